@@ -0,0 +1,93 @@
+import math
+
+class AliasTable:
+    """Tabla de alias (método de Vose) para elegir índices con pesos en O(1) por sorteo.
+
+    Se construye una vez por columna. Cada sorteo usa un solo número aleatorio: la parte entera
+    elige la casilla y la parte fraccionaria decide entre la casilla y su alias.
+    """
+    def __init__(self, weights):
+        size = len(weights)
+        if size == 0:
+            raise ValueError("La distribución necesita al menos un peso.")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("Los pesos no pueden ser negativos.")
+        total = sum(weights)
+        if not math.isfinite(total):
+            raise ValueError("La suma de los pesos es demasiado grande.")
+        if total <= 0:
+            raise ValueError("La suma de los pesos debe ser mayor que cero.")
+        scaled = [weight * size / total for weight in weights]
+        probabilities = [1.0] * size
+        aliases = list(range(size))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Lo que queda en `small` o `large` vale 1 salvo por redondeo
+        self.size = size
+        self.probabilities = probabilities
+        self.aliases = aliases
+
+    @classmethod
+    def zipf(cls, size, exponent=1.0):
+        """Distribución de Zipf: el elemento k (desde 1) pesa 1 / k^exponent."""
+        return cls([1.0 / k ** exponent for k in range(1, size + 1)])
+
+    @classmethod
+    def from_specs(cls, specs):
+        """Tabla para un campo `enum`, o None si la distribución es uniforme.
+
+        Acepta `weights` (uno por opción) o `distribution: 'zipf'` con `zipf_exponent`
+        (por defecto 1.0), que da más peso a las primeras opciones.
+        """
+        options = specs.get('options', [])
+        weights = specs.get('weights')
+        distribution = specs.get('distribution', 'uniform')
+        if weights is not None:
+            if not isinstance(weights, (list, tuple)) or not all(cls.is_finite(weight) and weight >= 0
+                                                                 for weight in weights):
+                raise ValueError("'weights' debe ser una lista de números finitos no negativos.")
+            if len(weights) != len(options):
+                raise ValueError("'weights' debe tener un peso por cada opción.")
+            return cls(weights)
+        if distribution == 'zipf':
+            exponent = specs.get('zipf_exponent', 1.0)
+            if not cls.is_finite(exponent):
+                raise ValueError("'zipf_exponent' debe ser un número finito.")
+            try:
+                return cls.zipf(len(options), exponent)
+            except (OverflowError, ZeroDivisionError):
+                raise ValueError("'zipf_exponent' es demasiado grande para la cantidad de opciones.") from None
+        if distribution != 'uniform':
+            raise ValueError(f"Distribución no soportada: {distribution}")
+        return None
+
+    @staticmethod
+    def is_finite(value):
+        # bool es subclase de int; NaN, infinito y enteros fuera del rango de float no sirven como pesos
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        try:
+            return math.isfinite(value)
+        except OverflowError:
+            return False
+
+    def sampler(self, rng):
+        """Devuelve una función sin argumentos que sortea un índice con `rng` (un `random.Random`)."""
+        random, size, probabilities, aliases = rng.random, self.size, self.probabilities, self.aliases
+
+        def sample():
+            position = random() * size
+            index = int(position)
+            return index if position - index < probabilities[index] else aliases[index]
+        return sample
+
+    def indexes(self, rng, count):
+        """Sortea `count` índices de una vez."""
+        sample = self.sampler(rng)
+        return [sample() for _ in range(count)]
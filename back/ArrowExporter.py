@@ -0,0 +1,118 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from itertools import chain, islice
+
+class ArrowExporter(ExporterBase):
+    """Exporta a Parquet o Arrow IPC. Consume directamente los `ColumnBatch` de `iter_batches`,
+    o filas en forma de diccionarios, que agrupa en bloques de `row_group_size`.
+
+    Con `schema` (el esquema del generador) el esquema Arrow se fija una sola vez y todos los bloques
+    lo usan; sin él se infiere del primer bloque, y una columna que ahí sea solo NULL queda sin tipo."""
+    # Tipo Arrow de cada tipo de campo; los `enum` se resuelven aparte según sus opciones
+    arrow_types = {
+        'string': pa.string(), 'email': pa.string(), 'phone': pa.string(), 'uuid': pa.string(),
+        'name': pa.string(), 'int': pa.int64(), 'float': pa.float64(), 'boolean': pa.bool_(),
+        'date': pa.date32(), 'datetime': pa.timestamp('s'), 'hour': pa.time32('s'),
+    }
+
+    def __init__(self, file_format='parquet', row_group_size=65536, schema=None):
+        super().__init__()
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+        self.arrow_schema = self.schema_from_specs(schema) if schema else None
+        # Opciones de cada `enum`: todos los bloques usan el mismo diccionario completo (Arrow IPC
+        # no admite que cambie entre lotes)
+        self.dictionaries = {str(field): pa.array(list(specs.get('options', [])))
+                             for field, specs in (schema or {}).items() if specs.get('type') == 'enum'}
+
+    @classmethod
+    def schema_from_specs(cls, schema):
+        """Esquema Arrow de un esquema de generador, con los mismos tipos que produce `to_array`."""
+        fields = []
+        for field, specs in schema.items():
+            field_type = specs.get('type')
+            if field_type == 'enum':
+                arrow_type = pa.dictionary(pa.int32(), pa.array(list(specs.get('options', []))).type)
+            elif field_type in cls.arrow_types:
+                arrow_type = cls.arrow_types[field_type]
+            else:
+                raise ValueError(f"Tipo de dato desconocido: {field_type}")
+            fields.append(pa.field(str(field), arrow_type))
+        return pa.schema(fields)
+
+    def to_array(self, batch, field):
+        """Convierte una columna del lote al tipo Arrow que le corresponde."""
+        values, kind = batch.columns[field], batch.kinds[field]
+        mask = batch.null_masks.get(field)
+        if kind == 'enum':
+            # Diccionario: índices int32 más la lista de opciones, que se guarda una sola vez
+            indices = pa.array(values.astype('int32'), mask=mask)
+            return pa.DictionaryArray.from_arrays(indices, pa.array(batch.categories[field]))
+        elif kind == 'date':
+            return pa.array(values, type=pa.date32(), mask=mask)
+        elif kind == 'datetime':
+            return pa.array(values, type=pa.timestamp('s'), mask=mask)
+        elif kind == 'hour':
+            return pa.array(values.astype('int32'), mask=mask).cast(pa.time32('s'))
+        # Números, booleanos y cadenas; las columnas generadas por fila (dtype object) se infieren
+        return pa.array(values, mask=mask)
+
+    def rows_to_table(self, rows, schema=None):
+        """Convierte un bloque de filas con el esquema indicado; los `enum` se codifican contra sus opciones."""
+        if schema is None:
+            return pa.Table.from_pylist(rows)
+        value_schema = pa.schema([pa.field(f.name, f.type.value_type) if pa.types.is_dictionary(f.type) else f
+                                  for f in schema])
+        table = pa.Table.from_pylist(rows, schema=value_schema)
+        for position, field in enumerate(schema):
+            if pa.types.is_dictionary(field.type):
+                options = self.dictionaries[field.name]
+                indices = pc.index_in(table.column(position).combine_chunks(), value_set=options).cast(pa.int32())
+                table = table.set_column(position, field, pa.DictionaryArray.from_arrays(indices, options))
+        return table
+
+    def batch_to_table(self, batch):
+        return pa.table({field: self.to_array(batch, field) for field in batch.fields})
+
+    def iter_tables(self, data):
+        data = iter(data)
+        first = next(data, None)
+        if first is None:
+            return
+        if isinstance(first, ColumnBatch):
+            for batch in chain([first], data):
+                table = self.batch_to_table(batch)
+                # Las columnas generadas por fila se infieren por lote; el esquema fijo las unifica
+                yield table.cast(self.arrow_schema) if self.arrow_schema is not None else table
+            return
+        rows = chain([first], data)
+        schema = self.arrow_schema
+        while True:
+            chunk = list(islice(rows, self.row_group_size))
+            if not chunk:
+                return
+            table = self.rows_to_table(chunk, schema)
+            # Sin esquema del generador, el primer bloque fija los tipos de los siguientes
+            schema = table.schema
+            yield table
+
+    def export(self, data, file_name='output.parquet'):
+        writer = None
+        try:
+            for table in self.iter_tables(data):
+                if writer is None:
+                    if self.file_format == 'parquet':
+                        # Codificación por diccionario solo para los `enum`, que ya llegan como diccionario
+                        dictionary_fields = [f.name for f in table.schema if pa.types.is_dictionary(f.type)]
+                        writer = pq.ParquetWriter(file_name, table.schema, use_dictionary=dictionary_fields or False)
+                    else:
+                        writer = pa.ipc.new_file(file_name, table.schema)
+                if self.file_format == 'parquet':
+                    writer.write_table(table, row_group_size=self.row_group_size)
+                else:
+                    writer.write_table(table, max_chunksize=self.row_group_size)
+        finally:
+            if writer is not None:
+                writer.close()
+        print(f"Archivo {self.file_format} generado: {file_name}")
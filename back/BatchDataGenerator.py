@@ -0,0 +1,142 @@
+import string
+import numpy as np
+
+class BatchDataGenerator:
+    """Genera columnas completas de N valores con una sola llamada vectorizada de NumPy."""
+    CHARSET = np.array(list(string.ascii_letters + string.digits))
+    DIGITS = np.array(list(string.digits))
+    HEX_DIGITS = np.array(list('0123456789abcdef'))
+    UUID_POSITIONS = [i for i in range(36) if i not in (8, 13, 18, 23)]
+
+    def __init__(self, data_generator=None, seed=None):
+        # Las columnas únicas no tienen versión vectorizada y usan el generador por fila
+        self.data_generator = data_generator or DataGenerator()
+        self.rng = np.random.default_rng(seed)
+
+    def random_strings(self, num_rows, length=10, charset=CHARSET):
+        """Genera `num_rows` cadenas de longitud fija a partir de una matriz de índices."""
+        if length == 0:
+            return np.full(num_rows, '', dtype='<U1')
+        chars = charset[self.rng.integers(0, len(charset), size=(num_rows, length))]
+        return np.ascontiguousarray(chars).view(f'<U{length}').reshape(num_rows)
+
+    def random_ints(self, num_rows, min_value=0, max_value=1000):
+        return self.rng.integers(min_value, max_value, endpoint=True, size=num_rows)
+
+    def random_floats(self, num_rows, min_value=0.0, max_value=1000.0, decimals=2):
+        return np.round(self.rng.uniform(min_value, max_value, num_rows), decimals)
+
+    def random_booleans(self, num_rows):
+        return self.rng.random(num_rows) < 0.5
+
+    def random_dates(self, num_rows, start_year=2000, end_year=2024):
+        """Genera fechas como desplazamientos en días desde la época (`datetime64[D]`)."""
+        start = np.datetime64(f'{start_year:04d}-01-01', 'D')
+        end = np.datetime64(f'{end_year:04d}-12-31', 'D')
+        return start + self.rng.integers(0, (end - start).astype(np.int64), endpoint=True, size=num_rows)
+
+    def random_datetimes(self, num_rows, start_year=2000, end_year=2024):
+        """Genera fechas y horas como desplazamientos en segundos desde la época (`datetime64[s]`)."""
+        start = np.datetime64(f'{start_year:04d}-01-01T00:00:00', 's')
+        end = np.datetime64(f'{end_year:04d}-12-31T23:59:59', 's')
+        return start + self.rng.integers(0, (end - start).astype(np.int64), endpoint=True, size=num_rows)
+
+    def random_hours(self, num_rows):
+        """Genera horas como segundos desde la medianoche."""
+        return self.rng.integers(0, 86400, size=num_rows)
+
+    def random_table_names(self, num_rows, table):
+        values, cumulative = table
+        indexes = np.searchsorted(np.frombuffer(cumulative, dtype=np.float64),
+                                  self.rng.random(num_rows) * NameCorpus.scale, side='right')
+        return np.asarray(values)[indexes]
+
+    def random_names(self, num_rows, gender=None, part='full'):
+        """Genera nombres con las mismas frecuencias que `NameCorpus`, con una búsqueda binaria vectorizada."""
+        tables = NameCorpus.shared().tables
+        if part == 'last':
+            return self.random_table_names(num_rows, tables['last'])
+        if gender is None:
+            male = self.random_table_names(num_rows, tables['first:male'])
+            female = self.random_table_names(num_rows, tables['first:female'])
+            first_names = np.where(self.rng.random(num_rows) < 0.5, male, female)
+        else:
+            first_names = self.random_table_names(num_rows, tables[f'first:{gender}'])
+        if part == 'first':
+            return first_names
+        return np.char.add(np.char.add(first_names, ' '), self.random_table_names(num_rows, tables['last']))
+
+    def random_enum_indexes(self, num_rows, options, alias_table=None):
+        """Sortea `num_rows` índices de categoría, uniformes o según la tabla de alias."""
+        if alias_table is None:
+            return self.rng.integers(0, len(options), size=num_rows)
+        positions = self.rng.random(num_rows) * alias_table.size
+        indexes = positions.astype(np.int64)
+        accept = positions - indexes < np.asarray(alias_table.probabilities)[indexes]
+        return np.where(accept, indexes, np.asarray(alias_table.aliases)[indexes])
+
+    def random_emails(self, num_rows, domain_list=None):
+        domains = np.array(domain_list or ["example.com", "test.org", "demo.net"])
+        usernames = np.char.add(self.random_strings(num_rows, 8), '@')
+        return np.char.add(usernames, domains[self.rng.integers(0, len(domains), size=num_rows)])
+
+    def random_uuids(self, num_rows):
+        """Genera UUID versión 4 a partir de bytes aleatorios, sin crear objetos `uuid.UUID`."""
+        raw = self.rng.integers(0, 256, size=(num_rows, 16), dtype=np.uint8)
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+        nibbles = np.empty((num_rows, 32), dtype=np.uint8)
+        nibbles[:, 0::2] = raw >> 4
+        nibbles[:, 1::2] = raw & 0x0F
+        chars = np.full((num_rows, 36), '-', dtype='<U1')
+        chars[:, self.UUID_POSITIONS] = self.HEX_DIGITS[nibbles]
+        return chars.view('<U36').reshape(num_rows)
+
+    def generate_column(self, field, specs, num_rows):
+        """Devuelve `(valores, categorías)` para un campo; las categorías solo aplican a `enum`."""
+        field_type = specs.get('type')
+
+        if specs.get('unique', False) or specs.get('pk', False):
+            generate = self.data_generator.compile_field(field, dict(specs, nullable=False))
+            return np.array([generate() for _ in range(num_rows)], dtype=object), None
+        elif field_type == 'string':
+            return self.random_strings(num_rows, specs.get('length', 10)), None
+        elif field_type == 'int':
+            return self.random_ints(num_rows, specs.get('min', 0), specs.get('max', 1000)), None
+        elif field_type == 'float':
+            return self.random_floats(num_rows, specs.get('min', 0.0), specs.get('max', 1000.0),
+                                      specs.get('decimals', 2)), None
+        elif field_type == 'boolean':
+            return self.random_booleans(num_rows), None
+        elif field_type == 'date':
+            return self.random_dates(num_rows, specs.get('start_year', 2000), specs.get('end_year', 2024)), None
+        elif field_type == 'datetime':
+            return self.random_datetimes(num_rows, specs.get('start_year', 2000), specs.get('end_year', 2024)), None
+        elif field_type == 'hour':
+            return self.random_hours(num_rows), None
+        elif field_type == 'enum':
+            options = specs.get('options', [])
+            alias_table = specs['alias_table'] if 'alias_table' in specs else AliasTable.from_specs(specs)
+            return self.random_enum_indexes(num_rows, options, alias_table), list(options)
+        elif field_type == 'email':
+            return self.random_emails(num_rows, specs.get('domain_list', None)), None
+        elif field_type == 'phone':
+            return self.random_strings(num_rows, specs.get('digits', 8), self.DIGITS), None
+        elif field_type == 'uuid':
+            return self.random_uuids(num_rows), None
+        elif field_type == 'name':
+            return self.random_names(num_rows, specs.get('gender'), specs.get('part', 'full')), None
+        else:
+            raise ValueError(f"Tipo de dato desconocido: {field_type}")
+
+    def generate_batch(self, schema, num_rows=1):
+        """Genera un `ColumnBatch` con `num_rows` valores por campo del esquema."""
+        self.data_generator.check_unique_domains(schema, num_rows)
+        batch = ColumnBatch(num_rows)
+        for field, specs in schema.items():
+            values, categories = self.generate_column(field, specs, num_rows)
+            null_mask = None
+            if specs.get('nullable', False):
+                null_mask = self.rng.random(num_rows) < specs.get('null_chance', 0.1)
+            batch.add_column(field, specs.get('type'), values, null_mask, categories)
+        return batch
@@ -0,0 +1,18 @@
+class BulkLoadGenerator:
+    def __init__(self, db_type, binary=False):
+        if db_type == 'postgresql':
+            self.writer = PostgreSQLCopyWriter(binary)
+        elif db_type == 'mysql':
+            self.writer = MySQLLoadDataWriter()
+        elif db_type == 'sqlserver':
+            self.writer = SQLServerBCPWriter()
+        elif db_type == 'oracle':
+            self.writer = OracleSQLLoaderWriter()
+        else:
+            raise ValueError(f"Carga masiva no soportada para: {db_type}")
+
+    def generate(self, table_name, schema, file_name, num_rows=10, data_generator=None):
+        """Genera las filas y las escribe en streaming en el formato de carga masiva del motor."""
+        data_generator = data_generator or DataGenerator()
+        column_types = {field: specs.get('type') for field, specs in schema.items()}
+        self.writer.export(table_name, data_generator.iter_rows(schema, num_rows), file_name, column_types)
@@ -0,0 +1,57 @@
+import os
+from itertools import chain
+
+class BulkLoadWriterBase:
+    """Escribe filas en el formato de carga masiva nativo de un motor, más su sentencia de carga."""
+    delimiter = '\t'
+    row_terminator = '\n'
+    null_marker = ''
+    true_value, false_value = '1', '0'
+    control_extension = '.sql'
+
+    def escape(self, value):
+        """Escapa una cadena según el formato. Se sobrescribe en las subclases."""
+        raise NotImplementedError("Este método debe ser implementado por las subclases.")
+
+    def load_statement(self, table_name, columns, file_name, column_types):
+        """Devuelve la sentencia o archivo de control que carga `file_name`. Se sobrescribe en las subclases."""
+        raise NotImplementedError("Este método debe ser implementado por las subclases.")
+
+    def support_files(self, columns, file_name, column_types):
+        """Archivos auxiliares que necesita la carga, como `{ruta: contenido}`. Por defecto ninguno."""
+        return {}
+
+    def format_value(self, value):
+        if value is None:
+            return self.null_marker
+        elif isinstance(value, str):
+            return self.escape(value)
+        elif isinstance(value, bool):
+            return self.true_value if value else self.false_value
+        # str() de date, time y datetime ya da 'YYYY-MM-DD', 'HH:MM:SS' y 'YYYY-MM-DD HH:MM:SS'
+        return str(value)
+
+    def open_data_file(self, file_name):
+        return open(file_name, 'w', encoding='utf-8', newline='')
+
+    def write_data(self, file, rows):
+        """Escribe las filas a medida que llegan, sin acumularlas en memoria."""
+        delimiter, terminator, format_value = self.delimiter, self.row_terminator, self.format_value
+        file.writelines(delimiter.join([format_value(v) for v in row.values()]) + terminator for row in rows)
+
+    def export(self, table_name, rows, file_name, column_types=None):
+        """Escribe el archivo de datos y, a su lado, la sentencia o archivo de control para cargarlo."""
+        rows = iter(rows)
+        first = next(rows, None)
+        columns = list(first.keys()) if first is not None else []
+        with self.open_data_file(file_name) as file:
+            self.write_data(file, chain([first], rows) if first is not None else [])
+        control_file = os.path.splitext(file_name)[0] + self.control_extension
+        if control_file == file_name:
+            control_file = file_name + self.control_extension
+        for support_file, content in self.support_files(columns, file_name, column_types or {}).items():
+            with open(support_file, 'w', encoding='utf-8') as file:
+                file.write(content)
+        with open(control_file, 'w', encoding='utf-8') as file:
+            file.write(self.load_statement(table_name, columns, file_name, column_types or {}))
+        print(f"Archivo de carga masiva generado: {file_name} (carga: {control_file})")
@@ -1,9 +1,25 @@
 import csv
+import io
+from itertools import chain
 
 class CSVExporter(ExporterBase):
+    def iter_parts(self, data):
+        # `data` puede ser cualquier iterable de filas: se escribe a medida que llega
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            return
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=first.keys())
+        writer.writeheader()
+        for row in chain([first], rows):
+            writer.writerow(row)
+            if buffer.tell() >= self.chunk_size:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
     def export(self, data, file_name='output.csv'):
-        with open(file_name, mode='w', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
+        self.write_file(data, file_name, newline='')
         print(f"Archivo CSV generado: {file_name}")
@@ -1,3 +1,5 @@
+import os
+
 class CodeExporter:
     def __init__(self, language):
         if language == 'python':
@@ -13,3 +15,15 @@ class CodeExporter:
     
     def export(self, data):
         return self.generator.generate_code(data)
+
+    def iter_code(self, data):
+        return self.generator.iter_code(data)
+
+    def save(self, data, file_name):
+        """Guarda el código en `file_name`. Con muchas filas, los datos van a un archivo junto a él
+        (mismo nombre, extensión de datos del lenguaje) y el código solo los carga."""
+        data_path = os.path.splitext(file_name)[0] + self.generator.data_extension
+        with open(file_name, 'w', encoding='utf-8') as code_file:
+            external = self.generator.write_code(data, code_file, data_path)
+        print(f"Código generado: {file_name}" + (f" (datos en {data_path})" if external else ""))
+        return external
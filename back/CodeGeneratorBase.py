@@ -1,4 +1,119 @@
+import os
+from itertools import chain, islice
+
 class CodeGeneratorBase:
-    def generate_code(self, data):
-        """Método abstracto para generar el código en el lenguaje específico. Debe ser sobrescrito."""
+    """Genera el código en el lenguaje específico por fragmentos de `chunk_rows` filas.
+
+    Con más de `inline_row_limit` filas, `write_code` deja los datos en un archivo aparte
+    (`data_extension`) y escribe un cargador pequeño, en lugar de un literal que el compilador
+    o el intérprete no puede procesar. Las subclases definen el encabezado, cada fila, el pie y
+    el cargador.
+    """
+    inline_row_limit = 100000
+    chunk_rows = 1000
+    # Límites en celdas (filas x columnas) para los lenguajes cuyo límite depende del ancho de fila;
+    # None si basta con los límites en filas
+    max_inline_cells = None
+    max_chunk_cells = None
+    data_extension = '.jsonl'
+    # Campo TSV que representa NULL; vacío en los lenguajes que escriben NULL como cadena vacía
+    tsv_null = ''
+    # Reemplazos de los literales de cadena estilo C (C++ y Java) y de los campos TSV
+    literal_escapes = (('\\', '\\\\'), ('"', '\\"'), ('\n', '\\n'), ('\r', '\\r'), ('\t', '\\t'))
+    field_escapes = (('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\r', '\\r'))
+
+    def header(self):
+        raise NotImplementedError("Este método debe ser implementado por las subclases.")
+
+    def format_row(self, row):
+        raise NotImplementedError("Este método debe ser implementado por las subclases.")
+
+    def footer(self, num_chunks):
         raise NotImplementedError("Este método debe ser implementado por las subclases.")
+
+    def format_chunk(self, index, rows):
+        return ''.join([self.format_row(row) for row in rows])
+
+    def format_data_line(self, row):
+        """Línea del archivo de datos externo."""
+        raise NotImplementedError("Este método debe ser implementado por las subclases.")
+
+    def loader(self, data_file_name):
+        """Código que lee el archivo de datos externo y hace lo mismo que el código con los datos en línea."""
+        raise NotImplementedError("Este método debe ser implementado por las subclases.")
+
+    def string_literal(self, value):
+        """Literal de cadena estilo C con el texto del valor."""
+        text = str(value)
+        for old, new in self.literal_escapes:
+            text = text.replace(old, new)
+        return f'"{text}"'
+
+    def tsv_line(self, row):
+        """Fila del archivo de datos TSV: campos separados por tabuladores, `tsv_null` para NULL."""
+        fields = []
+        for value in row.values():
+            if value is None:
+                fields.append(self.tsv_null)
+                continue
+            text = str(value)
+            for old, new in self.field_escapes:
+                text = text.replace(old, new)
+            fields.append(text)
+        return '\t'.join(fields) + '\n'
+
+    def row_limits(self, first_row):
+        """`(filas por fragmento, filas en línea)` según el ancho de las filas."""
+        columns = max(1, len(first_row))
+        chunk_rows, inline_rows = self.chunk_rows, self.inline_row_limit
+        if self.max_chunk_cells:
+            chunk_rows = min(chunk_rows, max(1, self.max_chunk_cells // columns))
+        if self.max_inline_cells:
+            inline_rows = min(inline_rows, max(1, self.max_inline_cells // columns))
+        return chunk_rows, inline_rows
+
+    def iter_code(self, data):
+        """Devuelve el código con los datos en línea, un fragmento por cada `chunk_rows` filas."""
+        rows = iter(data)
+        first = next(rows, None)
+        chunk_rows = self.row_limits(first)[0] if first is not None else self.chunk_rows
+        if first is not None:
+            rows = chain([first], rows)
+        yield self.header()
+        num_chunks = 0
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if not chunk:
+                break
+            yield self.format_chunk(num_chunks, chunk)
+            num_chunks += 1
+        yield self.footer(num_chunks)
+
+    def generate_code(self, data):
+        return ''.join(self.iter_code(data))
+
+    def write_code(self, data, code_file, data_path=None):
+        """Escribe el código en `code_file` (cualquier objeto con `write`).
+
+        Si hay más filas de las que se pueden dejar en línea (`row_limits`) y se indica `data_path`, las filas se escriben en
+        ese archivo y `code_file` recibe solo el cargador. Devuelve True en ese caso.
+        """
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            code_file.writelines(self.iter_code([]))
+            return False
+        chunk_rows, inline_rows = self.row_limits(first)
+        head = list(islice(chain([first], rows), inline_rows + 1))
+        if len(head) <= inline_rows or data_path is None:
+            code_file.writelines(self.iter_code(chain(head, rows)))
+            return False
+        rows = chain(head, rows)
+        with open(data_path, 'w', encoding='utf-8', newline='\n') as data_file:
+            while True:
+                chunk = list(islice(rows, chunk_rows))
+                if not chunk:
+                    break
+                data_file.write(''.join([self.format_data_line(row) for row in chunk]))
+        code_file.write(self.loader(os.path.basename(data_path)))
+        return True
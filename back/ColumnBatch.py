@@ -0,0 +1,49 @@
+import datetime
+import numpy as np
+
+class ColumnBatch:
+    """Lote columnar: un arreglo de NumPy por campo y una máscara de nulos opcional."""
+    def __init__(self, num_rows):
+        self.num_rows = num_rows
+        self.columns = {}
+        self.kinds = {}
+        self.null_masks = {}
+        self.categories = {}
+
+    def __len__(self):
+        return self.num_rows
+
+    @property
+    def fields(self):
+        return list(self.columns.keys())
+
+    def add_column(self, field, kind, values, null_mask=None, categories=None):
+        """Agrega una columna ya generada. Los `enum` guardan índices y sus `categories`."""
+        self.columns[field] = values
+        self.kinds[field] = kind
+        if null_mask is not None:
+            self.null_masks[field] = null_mask
+        if categories is not None:
+            self.categories[field] = categories
+
+    def column_values(self, field):
+        """Materializa una columna como lista de objetos de Python (`None` para los nulos)."""
+        values, kind = self.columns[field], self.kinds[field]
+        if kind == 'enum':
+            values = np.asarray(self.categories[field], dtype=object)[values].tolist()
+        elif kind == 'hour':
+            values = [datetime.time(s // 3600, s // 60 % 60, s % 60) for s in values.tolist()]
+        else:
+            # datetime64[D] y datetime64[s] se convierten en datetime.date y datetime.datetime
+            values = values.tolist()
+        null_mask = self.null_masks.get(field)
+        if null_mask is not None:
+            for index in np.flatnonzero(null_mask).tolist():
+                values[index] = None
+        return values
+
+    def to_rows(self):
+        """Convierte el lote en la lista de diccionarios que devuelve `generate_rows`."""
+        fields = self.fields
+        columns = [self.column_values(field) for field in fields]
+        return [dict(zip(fields, values)) for values in zip(*columns)]
@@ -0,0 +1,26 @@
+import bz2
+import io
+import lzma
+
+class CompressedOutput:
+    """Abre archivos de salida con compresión opcional: None, 'gzip', 'bz2' o 'xz'."""
+    extensions = {'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz'}
+
+    @staticmethod
+    def open(file_name, mode='w', compression=None, encoding=None, newline=None):
+        binary = 'b' in mode
+        if compression is None:
+            if binary:
+                return open(file_name, 'wb')
+            return open(file_name, 'w', encoding=encoding, newline=newline)
+        elif compression == 'gzip':
+            stream = io.BufferedWriter(ParallelGzipWriter(file_name), buffer_size=1 << 16)
+        elif compression == 'bz2':
+            stream = bz2.open(file_name, 'wb')
+        elif compression == 'xz':
+            stream = lzma.open(file_name, 'wb')
+        else:
+            raise ValueError(f"Compresión no soportada: {compression}")
+        if binary:
+            return stream
+        return io.TextIOWrapper(stream, encoding=encoding or 'utf-8', newline=newline)
@@ -1,16 +1,57 @@
 class CppCodeGenerator(CodeGeneratorBase):
-    def generate_code(self, data):
-        code = "#include <iostream>\n#include <vector>\nusing namespace std;\n\n"
-        code += "int main() {\n"
-        code += "    vector<vector<string>> data = {\n"
-        for row in data:
-            values = ', '.join(f'"{v}"' if isinstance(v, str) else str(v) for v in row.values())
-            code += f"        {{{values}}},\n"
-        code += "    };\n"
-        code += "    for (auto& item : data) {\n"
-        code += "        for (auto& field : item) cout << field << ' ';\n"
-        code += "        cout << endl;\n"
-        code += "    }\n"
-        code += "    return 0;\n"
-        code += "}\n"
-        return code
+    # Las listas de inicialización enormes vuelven muy lento a g++
+    inline_row_limit = 10000
+    data_extension = '.tsv'
+
+    def header(self):
+        return (
+            "#include <iostream>\n#include <string>\n#include <vector>\nusing namespace std;\n\n"
+            "int main() {\n"
+            "    vector<vector<string>> data = {\n"
+        )
+
+    def format_row(self, row):
+        values = ', '.join('""' if v is None else self.string_literal(v) for v in row.values())
+        return f"        {{{values}}},\n"
+
+    def footer(self, num_chunks):
+        return "    };\n" + self.print_data()
+
+    def print_data(self):
+        return (
+            "    for (auto& item : data) {\n"
+            "        for (auto& field : item) cout << field << ' ';\n"
+            "        cout << endl;\n"
+            "    }\n"
+            "    return 0;\n"
+            "}\n"
+        )
+
+    def format_data_line(self, row):
+        return self.tsv_line(row)
+
+    def loader(self, data_file_name):
+        return (
+            "#include <fstream>\n#include <iostream>\n#include <string>\n#include <vector>\nusing namespace std;\n\n"
+            "int main() {\n"
+            "    vector<vector<string>> data;\n"
+            f"    ifstream data_file({self.string_literal(data_file_name)});\n"
+            "    string line;\n"
+            "    while (getline(data_file, line)) {\n"
+            "        vector<string> item;\n"
+            "        string field;\n"
+            "        for (size_t i = 0; i <= line.size(); i++) {\n"
+            "            if (i == line.size() || line[i] == '\\t') {\n"
+            "                item.push_back(field);\n"
+            "                field.clear();\n"
+            "            } else if (line[i] == '\\\\' && i + 1 < line.size()) {\n"
+            "                char next = line[++i];\n"
+            "                field += next == 't' ? '\\t' : next == 'n' ? '\\n' : next == 'r' ? '\\r' : next;\n"
+            "            } else {\n"
+            "                field += line[i];\n"
+            "            }\n"
+            "        }\n"
+            "        data.push_back(item);\n"
+            "    }\n"
+            + self.print_data()
+        )
@@ -2,125 +2,419 @@ import random
 import string
 import datetime
 import uuid
-import names  # Import para generación de nombres
+import threading
+import zlib
+from collections import OrderedDict
 
 class DataGenerator:
-    def __init__(self):
+    # Filas por bloque en el modo por contador: acota lo que hay que descartar para saltar a una fila
+    counter_block_size = 1024
+    # Esquemas distintos cuyos planes guarda `generate_data`
+    max_compiled_plans = 8
+    # Textos compartidos para fechas y horas: 'YYYY-MM-DD' por rango de días, 'HH' y 'MM:SS'.
+    # Los rangos los elige el cliente, así que las tablas de días se guardan en un LRU pequeño y
+    # solo para rangos de hasta `max_table_days` días; los más largos se formatean al vuelo.
+    day_tables = OrderedDict()
+    day_tables_lock = threading.Lock()
+    max_day_tables = 8
+    max_table_days = 50 * 366
+    hour_strings = tuple(f'{hour:02d}' for hour in range(24))
+    minute_second_strings = tuple(f'{minute:02d}:{second:02d}' for minute in range(60) for second in range(60))
+
+    def __init__(self, seed=None, row_offset=0, key_seed=None, counter_based=False, temporal_text=False):
+        # Estado de las columnas únicas: una `UniquePermutation` por campo
         self.unique_values = {}
+        # Generador propio en lugar del estado global de `random`, para que una semilla sea reproducible
+        self.rng = random.Random(seed)
+        # Los valores únicos salen de una permutación con clave `key_seed`, a partir de la posición
+        # `row_offset`. Con la misma clave y desplazamientos disjuntos, los shards nunca colisionan.
+        self.key_seed = key_seed if key_seed is not None else self.rng.getrandbits(64)
+        self.row_offset = row_offset
+        # Modo por contador: cada (semilla, columna, fila) da siempre el mismo valor y se puede
+        # generar cualquier rango de filas sin generar las anteriores
+        self.counter_based = counter_based
+        self.current_row = row_offset
+        # Con `temporal_text` las fechas y horas salen ya como texto ('YYYY-MM-DD', 'YYYY-MM-DD HH:MM:SS',
+        # 'HH:MM:SS'), sin crear objetos `datetime`. Sirve a los consumidores que solo escriben texto.
+        self.temporal_text = temporal_text
+        # Planes compilados por `generate_data`, por identidad del esquema: {id: (esquema, plan)}
+        self.compiled_plans = {}
+
+    @staticmethod
+    def derive_seed(seed, index):
+        """Deriva una semilla independiente para `index` a partir de `seed` (mezcla splitmix64)."""
+        mask = 0xFFFFFFFFFFFFFFFF
+        z = (seed + (index + 1) * 0x9E3779B97F4A7C15) & mask
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+        return z ^ (z >> 31)
+
+    def unique_source(self, field_name, size):
+        """Devuelve la función que entrega el siguiente valor único del campo.
+
+        En modo por contador el valor depende solo de la fila actual, no de cuántos se hayan pedido.
+        """
+        permutation = self.unique_permutation(field_name, size)
+        if not self.counter_based:
+            return permutation.next_value
+
+        def value_at_row():
+            permutation.position = self.current_row
+            return permutation.next_value()
+        return value_at_row
+
+    def unique_permutation(self, field_name, size):
+        """Devuelve la permutación que entrega los valores únicos de `[0, size)` para un campo."""
+        permutation = self.unique_values.get(field_name)
+        if permutation is None:
+            permutation = UniquePermutation(size, self.column_key(field_name), self.row_offset)
+            self.unique_values[field_name] = permutation
+        return permutation
 
     def random_string(self, length=10):
         """Genera una cadena aleatoria de longitud fija."""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return ''.join(self.rng.choices(string.ascii_letters + string.digits, k=length))
 
     def random_int(self, min_value=0, max_value=1000):
         """Genera un número entero aleatorio dentro de un rango."""
-        return random.randint(min_value, max_value)
+        return self.rng.randint(min_value, max_value)
 
     def random_float(self, min_value=0.0, max_value=1000.0, decimals=2):
         """Genera un número flotante aleatorio dentro de un rango."""
-        return round(random.uniform(min_value, max_value), decimals)
+        return round(self.rng.uniform(min_value, max_value), decimals)
 
     def random_boolean(self):
         """Genera un valor booleano aleatorio."""
-        return random.choice([True, False])
+        return self.rng.choice([True, False])
 
     def random_date(self, start_year=2000, end_year=2024):
         """Genera una fecha aleatoria dentro de un rango de años."""
-        start_date = datetime.date(start_year, 1, 1)
-        end_date = datetime.date(end_year, 12, 31)
-        return start_date + datetime.timedelta(days=random.randint(0, (end_date - start_date).days))
+        start, days = self.day_range(start_year, end_year)
+        return datetime.date.fromordinal(start + int(self.rng.random() * days))
 
     def random_datetime(self, start_year=2000, end_year=2024):
         """Genera una fecha y hora aleatoria."""
-        start_date = datetime.datetime(start_year, 1, 1)
-        end_date = datetime.datetime(end_year, 12, 31, 23, 59, 59)
-        return start_date + datetime.timedelta(seconds=random.randint(0, int((end_date - start_date).total_seconds())))
+        start, days = self.day_range(start_year, end_year)
+        return datetime.datetime(start_year, 1, 1) + datetime.timedelta(seconds=int(self.rng.random() * days * 86400))
 
     def random_hour(self):
         """Genera una hora aleatoria."""
-        return datetime.time(random.randint(0, 23), random.randint(0, 59), random.randint(0, 59))
+        second = int(self.rng.random() * 86400)
+        return datetime.time(second // 3600, second // 60 % 60, second % 60)
+
+    @staticmethod
+    def day_range(start_year, end_year):
+        """Ordinal del 1 de enero de `start_year` y número de días hasta el 31 de diciembre de `end_year`."""
+        start = datetime.date(start_year, 1, 1).toordinal()
+        return start, datetime.date(end_year, 12, 31).toordinal() - start + 1
+
+    @classmethod
+    def day_table(cls, start, days):
+        """Texto 'YYYY-MM-DD' de cada día del rango, que se reutiliza mientras siga en el LRU."""
+        key = (start, days)
+        with cls.day_tables_lock:
+            table = cls.day_tables.get(key)
+            if table is not None:
+                cls.day_tables.move_to_end(key)
+                return table
+        fromordinal = datetime.date.fromordinal
+        table = tuple(fromordinal(day).isoformat() for day in range(start, start + days))
+        with cls.day_tables_lock:
+            cls.day_tables[key] = table
+            while len(cls.day_tables) > cls.max_day_tables:
+                cls.day_tables.popitem(last=False)
+        return table
+
+    @classmethod
+    def day_text(cls, start, days):
+        """Función que da el texto 'YYYY-MM-DD' del día `offset` del rango: por tabla si el rango es
+        corto, o con `date.fromordinal` si superaría `max_table_days`."""
+        if days <= cls.max_table_days:
+            return cls.day_table(start, days).__getitem__
+        fromordinal = datetime.date.fromordinal
+        return lambda offset: fromordinal(start + offset).isoformat()
 
     def random_uuid(self):
         """Genera un UUID único."""
-        return str(uuid.uuid4())
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
 
     def random_enum(self, options):
         """Genera un valor aleatorio de una lista de opciones (enum)."""
-        return random.choice(options)
+        return self.rng.choice(options)
 
     def random_email(self, domain_list=None):
         """Genera un correo electrónico aleatorio."""
         domain_list = domain_list or ["example.com", "test.org", "demo.net"]
-        return f"{self.random_string(8)}@{random.choice(domain_list)}"
+        return f"{self.random_string(8)}@{self.rng.choice(domain_list)}"
 
     def random_phone(self, digits=8, unique=False, field_name=None):
         """Genera un número de teléfono aleatorio con una cantidad definida de dígitos, opcionalmente único."""
         if unique:
-            if field_name not in self.unique_values:
-                self.unique_values[field_name] = set()
-            
-            while True:
-                number = ''.join(random.choices(string.digits, k=digits))
-                if number not in self.unique_values[field_name]:
-                    self.unique_values[field_name].add(number)
-                    return number
-        return ''.join(random.choices(string.digits, k=digits))
-
-    def random_name(self):
-        """Genera un nombre aleatorio utilizando la librería `names`."""
-        return names.get_full_name()
+            return str(self.unique_permutation(field_name, 10 ** digits).next_value()).zfill(digits)
+        return ''.join(self.rng.choices(string.digits, k=digits))
+
+    @staticmethod
+    def index_to_string(index, charset, length):
+        """Convierte un índice de `[0, len(charset) ** length)` en su cadena de longitud fija."""
+        base = len(charset)
+        chars = []
+        for _ in range(length):
+            index, digit = divmod(index, base)
+            chars.append(charset[digit])
+        return ''.join(chars)
+
+    def random_name(self, gender=None, part='full'):
+        """Genera un nombre con las frecuencias de la librería `names`, cargadas una sola vez."""
+        return NameCorpus.shared().sample(self.rng, gender, part)
 
     def value_or_null(self, generator_func, nullable=False, null_chance=0.1):
         """Devuelve un valor generado o `None` si nullable es True y se cumple la probabilidad."""
-        if nullable and random.random() < null_chance:
+        if nullable and self.rng.random() < null_chance:
             return None
         return generator_func()
 
-    def generate_data(self, schema):
-        """Genera datos aleatorios basados en un esquema proporcionado."""
-        data = {}
+    def nullable(self, generator_func, null_chance=0.1, rng=None):
+        """Envuelve un generador para que devuelva `None` con la probabilidad indicada."""
+        rand = (rng or self.rng).random
+
+        def generate():
+            if rand() < null_chance:
+                return None
+            return generator_func()
+        return generate
+
+    def compile_field(self, field, specs, rng=None):
+        """Resuelve una sola vez el tipo y los parámetros de un campo y devuelve su generador.
+
+        Todas las funciones aleatorias se toman de `rng` (por defecto `self.rng`), de modo que el modo
+        por contador puede darle a cada columna su propio flujo de números.
+        """
+        rng = rng or self.rng
+        field_type = specs.get('type')
+        unique = specs.get('unique', False) or specs.get('pk', False)
+        randint, choices = rng.randint, rng.choices
+
+        if field_type == 'string':
+            length = specs.get('length', 10)
+            charset = string.ascii_letters + string.digits
+            if unique:
+                next_value = self.unique_source(field, self.unique_domain(specs))
+                generator = lambda: self.index_to_string(next_value(), charset, length)
+            else:
+                generator = lambda: ''.join(choices(charset, k=length))
+        elif field_type == 'int':
+            min_value = specs.get('min', 0)
+            max_value = specs.get('max', 1000)
+            if unique:
+                next_value = self.unique_source(field, self.unique_domain(specs))
+                generator = lambda: min_value + next_value()
+            else:
+                generator = lambda: randint(min_value, max_value)
+        elif field_type == 'float':
+            min_value = specs.get('min', 0.0)
+            max_value = specs.get('max', 1000.0)
+            decimals = specs.get('decimals', 2)
+            uniform = rng.uniform
+            generator = lambda: round(uniform(min_value, max_value), decimals)
+        elif field_type == 'boolean':
+            rand = rng.random
+            generator = lambda: rand() < 0.5
+        elif field_type in ('date', 'datetime', 'hour'):
+            generator = self.compile_temporal(field_type, specs, rng)
+        elif field_type == 'enum':
+            options = specs.get('options', [])
+            # Los `SchemaPlan` ya traen la tabla de alias construida
+            alias_table = specs['alias_table'] if 'alias_table' in specs else AliasTable.from_specs(specs)
+            if alias_table is None:
+                choice = rng.choice
+                generator = lambda: choice(options)
+            else:
+                sample = alias_table.sampler(rng)
+                generator = lambda: options[sample()]
+        elif field_type == 'email':
+            domain_list = specs.get('domain_list', None) or ["example.com", "test.org", "demo.net"]
+            charset = string.ascii_letters + string.digits
+            choice = rng.choice
+            generator = lambda: f"{''.join(choices(charset, k=8))}@{choice(domain_list)}"
+        elif field_type == 'phone':
+            digits = specs.get('digits', 8)
+            if unique:
+                next_value = self.unique_source(field, self.unique_domain(specs))
+                generator = lambda: str(next_value()).zfill(digits)
+            else:
+                generator = lambda: ''.join(choices(string.digits, k=digits))
+        elif field_type == 'uuid':
+            getrandbits, UUID = rng.getrandbits, uuid.UUID
+            generator = lambda: str(UUID(int=getrandbits(128), version=4))
+        elif field_type == 'name':
+            generator = NameCorpus.shared().sampler(rng, specs.get('gender'), specs.get('part', 'full'))
+        else:
+            raise ValueError(f"Tipo de dato desconocido: {field_type}")
+
+        if specs.get('nullable', False):
+            return self.nullable(generator, specs.get('null_chance', 0.1), rng)
+        return generator
+
+    @staticmethod
+    def unique_domain(specs):
+        """Cantidad de valores distintos de una columna `unique`/`pk`, o None si la columna no es única."""
+        if not (specs.get('unique', False) or specs.get('pk', False)):
+            return None
+        field_type = specs.get('type')
+        if field_type == 'string':
+            return len(string.ascii_letters + string.digits) ** specs.get('length', 10)
+        elif field_type == 'int':
+            return specs.get('max', 1000) - specs.get('min', 0) + 1
+        elif field_type == 'phone':
+            return 10 ** specs.get('digits', 8)
+        return None
+
+    def check_unique_domains(self, schema, num_rows, start_row=0):
+        """Falla antes de generar nada si alguna columna única no tiene valores para `num_rows` filas más.
+
+        Los valores únicos se toman de la posición en que quedó la permutación de cada columna
+        (`row_offset` si aún no se usó, o `start_row` en modo por contador).
+        """
         for field, specs in schema.items():
-            field_type = specs.get('type')
-            nullable = specs.get('nullable', False)
-            
-            if field_type == 'string':
-                length = specs.get('length', 10)
-                data[field] = self.value_or_null(lambda: self.random_string(length), nullable)
-            elif field_type == 'int':
-                min_value = specs.get('min', 0)
-                max_value = specs.get('max', 1000)
-                data[field] = self.value_or_null(lambda: self.random_int(min_value, max_value), nullable)
-            elif field_type == 'float':
-                min_value = specs.get('min', 0.0)
-                max_value = specs.get('max', 1000.0)
-                decimals = specs.get('decimals', 2)
-                data[field] = self.value_or_null(lambda: self.random_float(min_value, max_value, decimals), nullable)
-            elif field_type == 'boolean':
-                data[field] = self.value_or_null(self.random_boolean, nullable)
-            elif field_type == 'date':
-                start_year = specs.get('start_year', 2000)
-                end_year = specs.get('end_year', 2024)
-                data[field] = self.value_or_null(lambda: self.random_date(start_year, end_year), nullable)
-            elif field_type == 'datetime':
-                start_year = specs.get('start_year', 2000)
-                end_year = specs.get('end_year', 2024)
-                data[field] = self.value_or_null(lambda: self.random_datetime(start_year, end_year), nullable)
-            elif field_type == 'hour':
-                data[field] = self.value_or_null(self.random_hour, nullable)
-            elif field_type == 'enum':
-                options = specs.get('options', [])
-                data[field] = self.value_or_null(lambda: self.random_enum(options), nullable)
-            elif field_type == 'email':
-                domain_list = specs.get('domain_list', None)
-                data[field] = self.value_or_null(lambda: self.random_email(domain_list), nullable)
-            elif field_type == 'phone':
-                digits = specs.get('digits', 8)
-                unique = specs.get('unique', False)
-                data[field] = self.value_or_null(lambda: self.random_phone(digits, unique, field_name=field), nullable)
-            elif field_type == 'uuid':
-                data[field] = self.value_or_null(self.random_uuid, nullable)
-            elif field_type == 'name':
-                data[field] = self.value_or_null(self.random_name, nullable)
+            size = self.unique_domain(specs)
+            if size is None:
+                continue
+            if self.counter_based:
+                first = start_row
+            elif field in self.unique_values:
+                first = self.unique_values[field].position
+            else:
+                first = self.row_offset
+            if first + num_rows > size:
+                raise ValueError(f"La columna '{field}' solo admite {size} valores únicos y se piden "
+                                 f"{num_rows} filas a partir de la posición {first}.")
+
+    def compile_temporal(self, field_type, specs, rng):
+        """Generador de fechas y horas: sortea un desplazamiento entero desde el inicio del rango y solo
+        lo convierte en objeto `datetime` si no se pidió `temporal_text`; en ese caso lo traduce con
+        las tablas de texto precalculadas."""
+        random = rng.random
+        hours, minute_seconds = self.hour_strings, self.minute_second_strings
+        if field_type == 'hour':
+            if self.temporal_text:
+                def generator():
+                    second = int(random() * 86400)
+                    return f"{hours[second // 3600]}:{minute_seconds[second % 3600]}"
             else:
-                raise ValueError(f"Tipo de dato desconocido: {field_type}")
-        return data
+                time = datetime.time
+
+                def generator():
+                    second = int(random() * 86400)
+                    return time(second // 3600, second // 60 % 60, second % 60)
+            return generator
+
+        start_year = specs.get('start_year', 2000)
+        start, days = self.day_range(start_year, specs.get('end_year', 2024))
+        if field_type == 'date':
+            if self.temporal_text:
+                day_string = self.day_text(start, days)
+                return lambda: day_string(int(random() * days))
+            fromordinal = datetime.date.fromordinal
+            return lambda: fromordinal(start + int(random() * days))
+
+        seconds = days * 86400
+        if self.temporal_text:
+            day_string = self.day_text(start, days)
+
+            def generator():
+                day, second = divmod(int(random() * seconds), 86400)
+                return f"{day_string(day)} {hours[second // 3600]}:{minute_seconds[second % 3600]}"
+            return generator
+        start_datetime, timedelta = datetime.datetime(start_year, 1, 1), datetime.timedelta
+        return lambda: start_datetime + timedelta(seconds=int(random() * seconds))
+
+    def compile_schema(self, schema):
+        """Compila el esquema en un plan: una lista de (campo, generador) que se reutiliza en cada fila."""
+        return [(field, self.compile_field(field, specs)) for field, specs in schema.items()]
+
+    def column_key(self, field):
+        """Clave estable de una columna, derivada de la semilla y del nombre (no de su posición)."""
+        return self.derive_seed(self.key_seed, zlib.crc32(str(field).encode()))
+
+    def iter_rows(self, schema, num_rows=1, start_row=0):
+        """Genera las filas una a una a partir del plan compilado, sin mantenerlas en memoria.
+
+        En modo por contador las filas empiezan en `start_row`; en modo secuencial se ignora.
+        """
+        # Se comprueba al llamar, no al pedir la primera fila, para fallar antes de abrir cualquier salida
+        self.check_unique_domains(schema, num_rows, start_row)
+        if self.counter_based:
+            return self.iter_counter_rows(schema, num_rows, start_row)
+        return self.iter_plan_rows(schema, num_rows)
+
+    def iter_plan_rows(self, schema, num_rows):
+        plan = self.compile_schema(schema)
+        fields = [field for field, _ in plan]
+        generators = [generator for _, generator in plan]
+        for _ in range(num_rows):
+            yield dict(zip(fields, [generate() for generate in generators]))
+
+    def iter_counter_rows(self, schema, num_rows=1, start_row=0):
+        """Genera filas en modo por contador: el valor de (semilla, columna, fila) es siempre el mismo.
+
+        Cada columna tiene su propio `random.Random`, que se siembra con (clave de la columna, bloque)
+        al inicio de cada bloque de `counter_block_size` filas. Empezar a mitad de un bloque solo
+        obliga a descartar las filas previas de ese bloque, nunca las de los bloques anteriores.
+        """
+        block_size = self.counter_block_size
+        fields = list(schema.keys())
+        keys = [self.column_key(field) for field in fields]
+        rngs = [random.Random() for _ in fields]
+        generators = [self.compile_field(field, specs, rng)
+                      for (field, specs), rng in zip(schema.items(), rngs)]
+        columns = list(zip(keys, rngs, generators))
+
+        for row in range(start_row, start_row + num_rows):
+            self.current_row = row
+            if row == start_row or row % block_size == 0:
+                block_start = row - row % block_size
+                for key, rng, generate in columns:
+                    rng.seed(self.derive_seed(key, row // block_size))
+                    for skipped in range(block_start, row):
+                        self.current_row = skipped
+                        generate()
+                self.current_row = row
+            yield dict(zip(fields, [generate() for generate in generators]))
+
+    def generate_rows(self, schema, num_rows=1, start_row=0):
+        """Genera `num_rows` filas ejecutando un plan compilado una sola vez."""
+        return list(self.iter_rows(schema, num_rows, start_row))
+
+    def generate_batch(self, schema, num_rows=1):
+        """Genera un lote columnar (`ColumnBatch`) de `num_rows` valores por campo usando NumPy."""
+        return BatchDataGenerator(self, self.rng.getrandbits(64)).generate_batch(schema, num_rows)
+
+    def iter_batches(self, schema, num_rows=1, batch_size=65536):
+        """Genera `num_rows` filas como una secuencia de `ColumnBatch` de hasta `batch_size` filas."""
+        batch_generator = BatchDataGenerator(self, self.rng.getrandbits(64))
+        for start in range(0, num_rows, batch_size):
+            yield batch_generator.generate_batch(schema, min(batch_size, num_rows - start))
+
+    def generate_data(self, schema, row=0):
+        """Genera datos aleatorios basados en un esquema proporcionado.
+
+        En modo por contador devuelve la fila `row` sin generar las anteriores.
+        """
+        if self.counter_based:
+            return next(self.iter_counter_rows(schema, 1, row))
+        return {field: generate() for field, generate in self.cached_plan(schema)}
+
+    def cached_plan(self, schema):
+        """Plan compilado de `schema`, que se reutiliza mientras se pase el mismo objeto de esquema.
+
+        La clave es la identidad del esquema (se guarda una referencia para que no se reutilice el id):
+        un esquema modificado después de su primer uso debe pasarse como un objeto nuevo.
+        """
+        cached = self.compiled_plans.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        if len(self.compiled_plans) >= self.max_compiled_plans:
+            self.compiled_plans.pop(next(iter(self.compiled_plans)))
+        plan = self.compile_schema(schema)
+        self.compiled_plans[id(schema)] = (schema, plan)
+        return plan
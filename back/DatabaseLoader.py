@@ -0,0 +1,101 @@
+import datetime
+import sqlite3
+from itertools import chain, islice
+
+class DatabaseLoader:
+    """Carga las filas generadas directamente en una conexión DB-API con `executemany` por bloques.
+
+    Sin conexión se abre una base SQLite con pragmas para carga masiva. Cualquier otro driver
+    (psycopg2, mysqlclient, ...) se usa pasando su conexión y su `paramstyle`. La misma conexión
+    se reutiliza para todas las tablas que se carguen con el mismo objeto.
+    """
+    sqlite_pragmas = {
+        'journal_mode': 'MEMORY',
+        'synchronous': 'OFF',
+        'temp_store': 'MEMORY',
+        'cache_size': -200000,  # ~200 MB
+    }
+    sql_types = {
+        'string': 'TEXT', 'int': 'INTEGER', 'float': 'REAL', 'boolean': 'BOOLEAN',
+        'date': 'DATE', 'datetime': 'TIMESTAMP', 'hour': 'TIME', 'enum': 'TEXT',
+        'email': 'TEXT', 'phone': 'TEXT', 'uuid': 'TEXT', 'name': 'TEXT',
+    }
+
+    def __init__(self, connection=None, database=':memory:', paramstyle='qmark', chunk_size=10000):
+        if connection is None:
+            connection = self.connect_sqlite(database)
+        if paramstyle not in ('qmark', 'numeric', 'format', 'pyformat'):
+            raise ValueError(f"Estilo de parámetros no soportado: {paramstyle}")
+        self.connection = connection
+        self.paramstyle = paramstyle
+        self.chunk_size = chunk_size
+        # sqlite3 no acepta `datetime.time` y sus adaptadores de fechas están obsoletos
+        self.temporal_as_text = isinstance(connection, sqlite3.Connection)
+
+    def connect_sqlite(self, database):
+        connection = sqlite3.connect(database)
+        for pragma, value in self.sqlite_pragmas.items():
+            connection.execute(f"PRAGMA {pragma} = {value}")
+        return connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def create_table(self, table_name, schema):
+        column_defs = ', '.join(f"{field} {self.sql_types.get(specs.get('type'), 'TEXT')}"
+                                for field, specs in schema.items())
+        cursor = self.connection.cursor()
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({column_defs})")
+        self.connection.commit()
+
+    def insert_sql(self, table_name, columns):
+        if self.paramstyle == 'qmark':
+            marks = ['?'] * len(columns)
+        elif self.paramstyle == 'numeric':
+            marks = [f':{i}' for i in range(1, len(columns) + 1)]
+        else:
+            marks = ['%s'] * len(columns)
+        return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(marks)})"
+
+    def iter_params(self, rows):
+        """Convierte las filas en tuplas de parámetros; en SQLite las fechas y horas van como texto."""
+        if not self.temporal_as_text:
+            for row in rows:
+                yield tuple(row.values())
+            return
+        temporal = (datetime.date, datetime.time)
+        for row in rows:
+            yield tuple([str(v) if isinstance(v, temporal) else v for v in row.values()])
+
+    def load_rows(self, table_name, rows):
+        """Inserta las filas en bloques de `chunk_size`, con un commit por bloque. Devuelve cuántas cargó."""
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return 0
+        sql = self.insert_sql(table_name, list(first.keys()))
+        params = self.iter_params(chain([first], rows))
+        cursor = self.connection.cursor()
+        total = 0
+        while True:
+            chunk = list(islice(params, self.chunk_size))
+            if not chunk:
+                return total
+            cursor.executemany(sql, chunk)
+            self.connection.commit()
+            total += len(chunk)
+
+    def load(self, table_name, schema, num_rows=10, data_generator=None, create_table=True):
+        """Genera `num_rows` filas y las carga en `table_name` sin renderizar SQL de texto."""
+        if create_table:
+            self.create_table(table_name, schema)
+        data_generator = data_generator or DataGenerator()
+        total = self.load_rows(table_name, data_generator.iter_rows(schema, num_rows))
+        print(f"Filas cargadas en {table_name}: {total}")
+        return total
@@ -1,16 +1,42 @@
+import datetime
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 
 class ExcelExporter(ExporterBase):
-    def export(self, data, file_name='output.xlsx'):
-        workbook = openpyxl.Workbook()
-        sheet = workbook.active
+    # Límite de filas de una hoja de Excel (incluida la cabecera); al llegar se abre otra hoja
+    max_rows_per_sheet = 1048576
+    number_formats = {
+        datetime.datetime: 'yyyy-mm-dd hh:mm:ss',
+        datetime.date: 'yyyy-mm-dd',
+        datetime.time: 'hh:mm:ss',
+    }
+
+    def typed_cell(self, sheet, value):
+        """Las fechas y horas van como celdas con formato; números y textos se escriben tal cual."""
+        number_format = self.number_formats.get(type(value))
+        if number_format is None:
+            return value
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.number_format = number_format
+        return cell
 
-        # Asume que data es una lista de diccionarios
-        headers = data[0].keys()
-        sheet.append(list(headers))
+    def export(self, data, file_name='output.xlsx'):
+        # Libro de solo escritura: las filas se vuelcan a disco en lugar de guardar cada celda en memoria
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet, headers, sheet_rows = None, None, 0
 
+        # `data` es cualquier iterable de diccionarios; la cabecera sale de la primera fila
         for row in data:
-            sheet.append(list(row.values()))
+            if sheet is None or sheet_rows >= self.max_rows_per_sheet:
+                headers = headers or list(row.keys())
+                sheet_number = len(workbook.worksheets) + 1
+                sheet = workbook.create_sheet('Sheet' if sheet_number == 1 else f'Sheet{sheet_number}')
+                sheet.append(headers)
+                sheet_rows = 1
+            sheet.append([self.typed_cell(sheet, v) for v in row.values()])
+            sheet_rows += 1
 
+        if sheet is None:
+            workbook.create_sheet('Sheet')
         workbook.save(file_name)
         print(f"Archivo Excel generado: {file_name}")
@@ -1,4 +1,35 @@
 class ExporterBase:
+    # Tamaño aproximado (en caracteres) de los bloques que se escriben o se envían por HTTP
+    chunk_size = 65536
+
+    def __init__(self, compression=None):
+        # None, 'gzip', 'bz2' o 'xz'
+        self.compression = compression
+
+    def open_file(self, file_name, encoding=None, newline=None):
+        """Abre el archivo de salida aplicando la compresión configurada."""
+        return CompressedOutput.open(file_name, 'w', self.compression, encoding, newline)
+
+    def iter_parts(self, data):
+        """Devuelve, en orden, los fragmentos de texto del archivo. Se sobrescribe en los formatos de texto."""
+        raise NotImplementedError("Este formato no se puede generar como texto.")
+
+    def iter_chunks(self, data):
+        """Agrupa los fragmentos en bloques de ~`chunk_size` caracteres, para un archivo o una respuesta HTTP."""
+        buffer, size = [], 0
+        for part in self.iter_parts(data):
+            buffer.append(part)
+            size += len(part)
+            if size >= self.chunk_size:
+                yield ''.join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield ''.join(buffer)
+
+    def write_file(self, data, file_name, encoding=None, newline=None):
+        with self.open_file(file_name, encoding, newline) as file:
+            file.writelines(self.iter_chunks(data))
+
     def export(self, data, file_name):
         """Método abstracto para exportar los datos a un archivo. Debe ser sobrescrito."""
         raise NotImplementedError("Este método debe ser implementado por las subclases.")
@@ -0,0 +1,25 @@
+import datetime
+import json
+
+def extended_json_value(value):
+    """Valores que JSON no representa, en MongoDB Extended JSON (modo relajado)."""
+    if isinstance(value, datetime.datetime):
+        return {'$date': f"{value.isoformat(timespec='milliseconds')}Z"}
+    elif isinstance(value, datetime.date):
+        return {'$date': f"{value.isoformat()}T00:00:00.000Z"}
+    return str(value)
+
+class ExtendedJSONLinesExporter(ExporterBase):
+    """Un documento MongoDB Extended JSON por línea, listo para `mongoimport`.
+
+    Las fechas se escriben como `{"$date": "...Z"}` (UTC) y los nulos como `null`; las horas
+    sin fecha quedan como texto 'HH:MM:SS'.
+    """
+    def iter_parts(self, data):
+        encode = json.JSONEncoder(default=extended_json_value, ensure_ascii=False).encode
+        for row in data:
+            yield encode(row) + '\n'
+
+    def export(self, data, file_name='output.jsonl'):
+        self.write_file(data, file_name, encoding='utf-8')
+        print(f"Archivo Extended JSON generado: {file_name}")
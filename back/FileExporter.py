@@ -1,14 +1,59 @@
 class FileExporter:
-    def __init__(self, format_type):
+    content_types = {
+        'csv': 'text/csv',
+        'json': 'application/json',
+        'jsonl': 'application/x-ndjson',
+        'ndjson': 'application/x-ndjson',
+        'ejsonl': 'application/x-ndjson',
+        'xml': 'application/xml',
+        'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'parquet': 'application/vnd.apache.parquet',
+        'arrow': 'application/vnd.apache.arrow.file',
+    }
+
+    # Formatos que escriben las fechas como texto: pueden recibirlas ya formateadas (`temporal_text`)
+    text_formats = ('csv', 'json', 'jsonl', 'ndjson', 'xml')
+    # Formatos que se pueden generar como texto y enviar por bloques
+    streamable_formats = text_formats + ('ejsonl',)
+
+    def __init__(self, format_type, compression=None, schema=None):
+        """`schema` es el esquema del generador; Parquet y Arrow lo usan para fijar los tipos de columna."""
+        if compression is not None and compression not in CompressedOutput.extensions:
+            raise ValueError(f"Compresión no soportada: {compression}")
+        self.format_type = format_type
+        self.compression = compression
         if format_type == 'excel':
+            if compression is not None:
+                raise ValueError("El formato excel ya es un archivo comprimido.")
             self.exporter = ExcelExporter()
         elif format_type == 'csv':
-            self.exporter = CSVExporter()
+            self.exporter = CSVExporter(compression)
         elif format_type == 'json':
-            self.exporter = JSONExporter()
+            self.exporter = JSONExporter(compression)
         elif format_type == 'xml':
-            self.exporter = XMLExporter()
+            self.exporter = XMLExporter(compression)
+        elif format_type in ('jsonl', 'ndjson'):
+            self.exporter = JSONLinesExporter(compression)
+        elif format_type == 'ejsonl':
+            # Extended JSON para mongoimport; necesita las fechas como objetos
+            self.exporter = ExtendedJSONLinesExporter(compression)
+        elif format_type in ('parquet', 'arrow'):
+            if compression is not None:
+                raise ValueError(f"El formato {format_type} comprime internamente; no admite compresión externa.")
+            self.exporter = ArrowExporter(format_type, schema=schema)
         else:
             raise ValueError(f"Formato de exportación no soportado: {format_type}")
+
     def export(self, data, file_name):
+        """Exporta `data`, que puede ser una lista o cualquier iterable de filas (por ejemplo `iter_rows`).
+        Parquet y Arrow aceptan además los `ColumnBatch` de `iter_batches`."""
         self.exporter.export(data, file_name)
+
+    @property
+    def streamable(self):
+        """Los formatos de texto sin compresión se pueden enviar por HTTP a medida que se generan."""
+        return self.compression is None and self.format_type in self.streamable_formats
+
+    def iter_chunks(self, data):
+        """Devuelve el contenido del archivo como bloques de texto, sin escribirlo en disco."""
+        return self.exporter.iter_chunks(data)
@@ -1,5 +1,10 @@
+import datetime
+from itertools import islice
+
 class InsertGenerator:
-    def __init__(self, db_type):
+    def __init__(self, db_type, batch_size=1, max_statement_length=None):
+        # batch_size > 1 agrupa las filas en INSERT de varias filas en los motores que lo soportan
+        self.batch_size = batch_size
         if db_type == 'mysql':
             self.generator = MySQLInsertGenerator()
         elif db_type == 'postgresql':
@@ -14,12 +19,40 @@ class InsertGenerator:
             self.generator = OracleInsertGenerator()
         else:
             raise ValueError(f"Tipo de base de datos no soportado: {db_type}")
+        if max_statement_length is not None:
+            # Por ejemplo, el max_allowed_packet real del servidor MySQL
+            self.generator.max_statement_length = max_statement_length
+
+    def iter_inserts(self, table_name, schema, num_rows=10, data_generator=None, start_row=0):
+        """Genera las sentencias una a una, sin construir la lista completa en memoria."""
+        data_generator = data_generator or DataGenerator(temporal_text=self.generator.temporal_text)
+        rows = data_generator.iter_rows(schema, num_rows, start_row)
+        # El esquema fija el formateador de cada columna
+        yield from self.generator.iter_batch_inserts(table_name, rows, self.batch_size, schema)
+
+    def iter_insert_chunks(self, table_name, schema, num_rows=10, chunk_size=1000, data_generator=None, start_row=0):
+        """Agrupa las sentencias en bloques de texto de hasta `chunk_size` sentencias."""
+        statements = self.iter_inserts(table_name, schema, num_rows, data_generator, start_row)
+        while True:
+            chunk = list(islice(statements, chunk_size))
+            if not chunk:
+                return
+            yield '\n'.join(chunk) + '\n'
 
     def generate_inserts(self, table_name, schema, num_rows=10):
-        data_generator = DataGenerator()
-        inserts = []
-        for _ in range(num_rows):
-            data = data_generator.generate_data(schema)
-            insert_statement = self.generator.generate_insert(table_name, data)
-            inserts.append(insert_statement)
-        return inserts
+        return list(self.iter_inserts(table_name, schema, num_rows))
+
+    def write_inserts(self, sink, table_name, schema, num_rows=10, chunk_size=1000, data_generator=None):
+        """Escribe las sentencias por bloques en `sink` (cualquier objeto con `write`). La memoria no depende de `num_rows`."""
+        for chunk in self.iter_insert_chunks(table_name, schema, num_rows, chunk_size, data_generator):
+            sink.write(chunk)
+
+    def save_sql_file(self, file_name, table_name, schema, num_rows=10, chunk_size=1000, compression=None,
+                      data_generator=None):
+        """Genera y guarda las sentencias en un archivo .sql (opcionalmente comprimido) sin acumularlas en memoria."""
+        current_datetime = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        (data_generator or DataGenerator(0)).check_unique_domains(schema, num_rows)
+        with CompressedOutput.open(file_name, 'w', compression) as file:
+            file.write(f"{self.generator.comment_prefix} Archivo SQL generado el {current_datetime}\n\n")
+            self.write_inserts(file, table_name, schema, num_rows, chunk_size, data_generator)
+        print(f"Archivo SQL generado: {file_name}")
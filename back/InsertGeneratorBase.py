@@ -1,21 +1,171 @@
+import datetime
+from itertools import chain
+from operator import methodcaller
+
 class InsertGeneratorBase:
+    # Límites para los INSERT de varias filas; `None` significa sin límite. Las subclases los ajustan.
+    supports_multi_row = False
+    max_rows_per_insert = None
+    max_variables = None
+    max_statement_length = None
+    # Las fechas y horas se escriben como texto entre comillas, así que pueden llegar ya formateadas
+    temporal_text = True
+    comment_prefix = '--'
+    # Reemplazos para escapar cadenas, en orden: el estándar SQL solo duplica la comilla simple
+    escapes = (("'", "''"),)
+    true_literal = 'TRUE'
+    false_literal = 'FALSE'
+    # Tipos cuyos valores generados nunca llevan comillas ni barras: se citan sin escapar
+    safe_text_types = ('string', 'phone', 'uuid')
+    # Cláusula que devuelve el id insertado (PostgreSQL, Oracle); solo se añade si hay columna `id`
+    returning_clause = ''
+
     def generate_insert(self, table_name, data):
         """Método que genera una sentencia INSERT para la base de datos. Se sobrescribe en las subclases."""
         raise NotImplementedError("Este método debe ser implementado por las subclases.")
 
+    def generate_batch_insert(self, table_name, columns, values):
+        """Genera un INSERT de varias filas a partir de la lista de columnas y las tuplas ya formateadas."""
+        raise NotImplementedError("Este motor no soporta INSERT de varias filas.")
+
+    def generate_single_insert(self, table_name, columns, row):
+        """INSERT de una fila ya formateada con `row_formatter`. Por defecto es un lote de una fila."""
+        return self.generate_batch_insert(table_name, columns, [row])
+
+    def returning(self, columns):
+        """`returning_clause` si `columns` (texto 'a, b, …' o nombres de columna) incluye `id`; si no, vacío."""
+        names = columns.split(', ') if isinstance(columns, str) else columns
+        return self.returning_clause if 'id' in names else ''
+
+    def escaper(self):
+        """Función que escapa una cadena con los reemplazos del motor (`str.replace` es mucho más
+        rápido que `str.translate` cuando el reemplazo tiene más de un carácter)."""
+        if len(self.escapes) == 1:
+            return methodcaller('replace', *self.escapes[0])
+        escapes = self.escapes
+
+        def escape(value):
+            for old, new in escapes:
+                value = value.replace(old, new)
+            return value
+        return escape
+
+    def escape(self, value):
+        for old, new in self.escapes:
+            value = value.replace(old, new)
+        return value
+
+    def format_row(self, data):
+        return '(' + ', '.join(self.format_value(v) for v in data.values()) + ')'
+
+    def column_formatter(self, specs):
+        """Resuelve una vez, según el tipo del esquema, cómo se escribe una columna en la plantilla de fila.
+
+        Devuelve `(marcador, conversión)`: el marcador ya incluye las comillas cuando el tipo las lleva
+        siempre, y la conversión (None si no hace falta) se aplica al valor antes de la plantilla.
+        """
+        field_type = specs.get('type') if specs else None
+        if specs and specs.get('nullable', False):
+            # Con NULL posibles, las comillas dependen del valor
+            formatter = self.value_formatter(field_type)
+            return '{}', lambda value: 'NULL' if value is None else formatter(value)
+        if field_type in self.safe_text_types or field_type in ('date', 'datetime', 'hour'):
+            # Los valores generados no llevan comillas; str() de fechas y horas ya da el formato ISO
+            return "'{}'", None
+        elif field_type in ('email', 'name'):
+            return "'{}'", self.escaper()
+        elif field_type in ('int', 'float'):
+            return '{}', None
+        return '{}', self.value_formatter(field_type)
+
+    def value_formatter(self, field_type):
+        """Función que formatea un valor no nulo de una columna de tipo `field_type`."""
+        if field_type in self.safe_text_types or field_type in ('date', 'datetime', 'hour'):
+            return "'{}'".format
+        elif field_type in ('email', 'name'):
+            escape = self.escaper()
+            return lambda value: f"'{escape(value)}'"
+        elif field_type in ('int', 'float'):
+            return str
+        elif field_type == 'boolean':
+            return {True: self.true_literal, False: self.false_literal}.__getitem__
+        # Enums (las opciones pueden ser de cualquier tipo) y columnas sin esquema
+        return self.format_value
+
+    def row_formatter(self, columns, schema=None):
+        """Compila el formateo de filas en una plantilla `(…, …)` única y la lista de columnas que
+        necesitan conversión; el resto de los valores entra en la plantilla tal cual."""
+        schema = schema or {}
+        placeholders, converters = [], []
+        for index, column in enumerate(columns):
+            placeholder, convert = self.column_formatter(schema.get(column))
+            placeholders.append(placeholder)
+            if convert is not None:
+                converters.append((index, convert))
+        template = ('(' + ', '.join(placeholders) + ')').format
+        if not converters:
+            return lambda data: template(*data.values())
+
+        def format_row(data):
+            values = list(data.values())
+            for index, convert in converters:
+                values[index] = convert(values[index])
+            return template(*values)
+        return format_row
+
+    def iter_batch_inserts(self, table_name, rows, batch_size=100, schema=None):
+        """Agrupa las filas en sentencias INSERT de hasta `batch_size` filas respetando los límites del motor.
+
+        Con `schema`, cada columna se formatea con la función de su tipo en lugar de `format_value`,
+        también en los motores sin INSERT de varias filas.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return
+        # La lista de columnas, los formateadores y los límites se resuelven una sola vez con la primera fila
+        format_row = self.row_formatter(list(first.keys()), schema)
+        columns = ', '.join(first.keys())
+        if batch_size <= 1 or not self.supports_multi_row:
+            # Un INSERT por fila, con la misma forma que `generate_insert`
+            for data in chain([first], rows):
+                yield self.generate_single_insert(table_name, columns, format_row(data))
+            return
+        max_rows = batch_size
+        if self.max_rows_per_insert:
+            max_rows = min(max_rows, self.max_rows_per_insert)
+        if self.max_variables:
+            max_rows = min(max_rows, max(1, self.max_variables // max(1, len(first))))
+        base_length = len(self.generate_batch_insert(table_name, columns, []))
+
+        batch = []
+        length = base_length
+        for data in chain([first], rows):
+            row = format_row(data)
+            row_length = len(row) if row.isascii() else len(row.encode('utf-8'))
+            if batch and (len(batch) >= max_rows or
+                          (self.max_statement_length and length + row_length + 2 > self.max_statement_length)):
+                yield self.generate_batch_insert(table_name, columns, batch)
+                batch = []
+                length = base_length
+            batch.append(row)
+            length += row_length + 2
+        if batch:
+            yield self.generate_batch_insert(table_name, columns, batch)
+
     def format_value(self, value):
         """Formatea el valor para ser usado en una sentencia INSERT según el tipo de base de datos."""
         if value is None:
             return 'NULL'
         elif isinstance(value, str):
-            return f"'{value}'"
+            return f"'{self.escape(value)}'"
         elif isinstance(value, bool):
-            return 'TRUE' if value else 'FALSE'
+            return self.true_literal if value else self.false_literal
         elif isinstance(value, (int, float)):
             return str(value)
         elif isinstance(value, datetime.datetime):
-            return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+            return f"'{value.isoformat(' ', 'seconds')}'"
         elif isinstance(value, datetime.date):
-            return f"'{value.strftime('%Y-%m-%d')}'"
+            return f"'{value.isoformat()}'"
         else:
-            return f"'{str(value)}'"
+            return f"'{self.escape(str(value))}'"
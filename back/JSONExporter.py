@@ -1,7 +1,16 @@
 import json
 
 class JSONExporter(ExporterBase):
+    def iter_parts(self, data):
+        # Arreglo JSON generado objeto por objeto, sin serializar la lista completa en memoria
+        encode = json.JSONEncoder(default=str).encode
+        yield '['
+        separator = '\n'
+        for row in data:
+            yield separator + encode(row)
+            separator = ',\n'
+        yield '\n]\n'
+
     def export(self, data, file_name='output.json'):
-        with open(file_name, 'w') as file:
-            json.dump(data, file, indent=4)
+        self.write_file(data, file_name)
         print(f"Archivo JSON generado: {file_name}")
@@ -0,0 +1,12 @@
+import json
+
+class JSONLinesExporter(ExporterBase):
+    def iter_parts(self, data):
+        # Un objeto JSON por línea (NDJSON)
+        encode = json.JSONEncoder(default=str).encode
+        for row in data:
+            yield encode(row) + '\n'
+
+    def export(self, data, file_name='output.jsonl'):
+        self.write_file(data, file_name)
+        print(f"Archivo JSON Lines generado: {file_name}")
@@ -1,15 +1,78 @@
 class JavaCodeGenerator(CodeGeneratorBase):
-    def generate_code(self, data):
-        code = "import java.util.*;\n\n"
-        code += "public class Main {\n"
-        code += "    public static void main(String[] args) {\n"
-        code += "        List<List<String>> data = new ArrayList<>();\n"
-        for row in data:
-            values = ', '.join(f'"{v}"' if isinstance(v, str) else str(v) for v in row.values())
-            code += f"        data.add(Arrays.asList({values}));\n"
-        code += "        for (List<String> item : data) {\n"
-        code += "            System.out.println(item);\n"
-        code += "        }\n"
-        code += "    }\n"
-        code += "}\n"
-        return code
+    # Cada método tiene un límite de 64 KB de bytecode y la clase uno de 65535 constantes, y los dos
+    # dependen de las celdas, no de las filas. Cada literal distinto ocupa dos constantes (String y
+    # Utf8), así que en línea caben unas 32 000 celdas: se deja en 20 000. Cada celda cuesta unos
+    # 8 bytes de bytecode (dup, índice, ldc_w, aastore): 4000 por método quedan en la mitad del límite.
+    inline_row_limit = 2000
+    chunk_rows = 250
+    max_inline_cells = 20000
+    max_chunk_cells = 4000
+    data_extension = '.tsv'
+    # Distinto de cualquier campo escapado, porque las barras de los datos se duplican
+    tsv_null = '\\N'
+
+    def header(self):
+        return "import java.util.*;\n\npublic class Main {\n"
+
+    def format_row(self, row):
+        values = ', '.join('null' if v is None else self.string_literal(v) for v in row.values())
+        return f"        data.add(Arrays.asList({values}));\n"
+
+    def format_chunk(self, index, rows):
+        rows = ''.join([self.format_row(row) for row in rows])
+        return f"    private static void addRows{index}(List<List<String>> data) {{\n{rows}    }}\n\n"
+
+    def footer(self, num_chunks):
+        calls = ''.join(f"        addRows{index}(data);\n" for index in range(num_chunks))
+        return (
+            "    public static void main(String[] args) {\n"
+            "        List<List<String>> data = new ArrayList<>();\n"
+            f"{calls}"
+            + self.print_data()
+        )
+
+    def print_data(self):
+        return (
+            "        for (List<String> item : data) {\n"
+            "            System.out.println(item);\n"
+            "        }\n"
+            "    }\n"
+            "}\n"
+        )
+
+    def format_data_line(self, row):
+        return self.tsv_line(row)
+
+    def loader(self, data_file_name):
+        return (
+            "import java.io.*;\nimport java.nio.charset.StandardCharsets;\nimport java.nio.file.*;\nimport java.util.*;\n\n"
+            "public class Main {\n"
+            "    public static void main(String[] args) throws IOException {\n"
+            "        List<List<String>> data = new ArrayList<>();\n"
+            f"        try (BufferedReader reader = Files.newBufferedReader(Paths.get({self.string_literal(data_file_name)}), StandardCharsets.UTF_8)) {{\n"
+            "            String line;\n"
+            "            while ((line = reader.readLine()) != null) {\n"
+            "                List<String> item = new ArrayList<>();\n"
+            "                StringBuilder field = new StringBuilder();\n"
+            "                boolean isNull = false;\n"
+            "                for (int i = 0; i <= line.length(); i++) {\n"
+            "                    if (i == line.length() || line.charAt(i) == '\\t') {\n"
+            "                        item.add(isNull ? null : field.toString());\n"
+            "                        field.setLength(0);\n"
+            "                        isNull = false;\n"
+            "                    } else if (line.charAt(i) == '\\\\' && i + 1 < line.length()) {\n"
+            "                        char next = line.charAt(++i);\n"
+            "                        if (next == 'N') {\n"
+            "                            isNull = true;\n"
+            "                        } else {\n"
+            "                            field.append(next == 't' ? '\\t' : next == 'n' ? '\\n' : next == 'r' ? '\\r' : next);\n"
+            "                        }\n"
+            "                    } else {\n"
+            "                        field.append(line.charAt(i));\n"
+            "                    }\n"
+            "                }\n"
+            "                data.add(item);\n"
+            "            }\n"
+            "        }\n"
+            + self.print_data()
+        )
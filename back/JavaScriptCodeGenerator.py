@@ -1,9 +1,26 @@
+import json
+
 class JavaScriptCodeGenerator(CodeGeneratorBase):
-    def generate_code(self, data):
-        code = "const data = [\n"
-        for row in data:
-            values = ', '.join(f'"{v}"' if isinstance(v, str) else str(v) for v in row.values())
-            code += f"    {{{values}}},\n"
-        code += "];\n"
-        code += "data.forEach(item => console.log(item));\n"
-        return code
+    def header(self):
+        return "const data = [\n"
+
+    def format_row(self, row):
+        # Un objeto JSON también es un literal de objeto válido en JavaScript
+        return f"    {json.dumps(row, default=str)},\n"
+
+    def footer(self, num_chunks):
+        return "];\ndata.forEach(item => console.log(item));\n"
+
+    def format_data_line(self, row):
+        return json.dumps(row, default=str, ensure_ascii=False) + '\n'
+
+    def loader(self, data_file_name):
+        return (
+            "const fs = require('fs');\n"
+            "const path = require('path');\n\n"
+            f"const dataPath = path.join(__dirname, {json.dumps(data_file_name)});\n"
+            "const data = fs.readFileSync(dataPath, 'utf8').split('\\n')\n"
+            "    .filter(line => line)\n"
+            "    .map(line => JSON.parse(line));\n"
+            "data.forEach(item => console.log(item));\n"
+        )
@@ -0,0 +1,154 @@
+import glob
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+class JobCancelled(Exception):
+    """Se lanza dentro del trabajo cuando se detecta una cancelación pedida desde la API."""
+
+def track_progress(items, store, job_id, count=len, interval=10000):
+    """Recorre `items` registrando en `store` cuántas filas se generaron, cada `interval` filas."""
+    done = reported = 0
+    for item in items:
+        yield item
+        done += count(item)
+        if done - reported >= interval:
+            reported = done
+            if store.update_progress(job_id, done):
+                raise JobCancelled()
+    store.update_progress(job_id, done)
+
+def process_alive(pid):
+    """Indica si el proceso `pid` sigue vivo en esta máquina."""
+    if pid == os.getpid():
+        return True
+    if os.name == 'nt':
+        # En Windows `os.kill` terminaría el proceso: se asume vivo
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def run_export_job(database, job_id, spec, output_path):
+    """Ejecuta una exportación en un proceso del pool y deja el archivo en `output_path`."""
+    store = JobStore(database)
+    if not store.start(job_id):
+        return
+    seed = spec.get('seed')
+    schema, num_rows, file_format = spec['schema'], spec['num_rows'], spec['format']
+    temporal_text = file_format in FileExporter.text_formats
+    if seed is not None:
+        data_generator = DataGenerator(seed, counter_based=True, temporal_text=temporal_text)
+    else:
+        data_generator = DataGenerator(temporal_text=temporal_text)
+    if file_format in ('parquet', 'arrow'):
+        data = track_progress(data_generator.iter_batches(schema, num_rows), store, job_id,
+                              count=lambda batch: batch.num_rows)
+    else:
+        data = track_progress(data_generator.iter_rows(schema, num_rows), store, job_id, count=lambda row: 1)
+    # Se escribe en un temporal y se renombra, para no servir nunca un archivo a medias
+    partial_path = output_path + '.part'
+    try:
+        FileExporter(file_format, spec.get('compression'), schema).export(data, partial_path)
+        os.replace(partial_path, output_path)
+    except JobCancelled:
+        store.finish(job_id, 'cancelled')
+    except Exception as error:
+        store.finish(job_id, 'failed', error=str(error))
+    else:
+        store.finish(job_id, 'done', num_rows, output_path)
+        return
+    if os.path.exists(partial_path):
+        os.remove(partial_path)
+
+class JobManager:
+    """Ejecuta exportaciones grandes fuera del ciclo de la petición.
+
+    Los trabajos se encolan en un pool acotado de procesos, así la generación no compite por el
+    GIL con las peticiones interactivas. El estado y el avance viven en un `JobStore` SQLite
+    dentro de `directory`, junto con los archivos resultantes. Si ya hay `max_pending` trabajos
+    en cola o en curso, `submit` lanza `RuntimeError` en lugar de aceptar más.
+
+    Los procesos del pool se crean con `spawn`, no con `fork`, para que no hereden conexiones ni
+    estado del proceso web. Al iniciar se dan por fallidos los trabajos cuyo proceso dueño ya no
+    existe, y los archivos de trabajos terminados hace más de `retention` segundos se borran.
+    """
+    def __init__(self, workers=2, max_pending=20, directory=None, retention=86400):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retention = retention
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'generador_jobs')
+        os.makedirs(self.directory, exist_ok=True)
+        self.store = JobStore(os.path.join(self.directory, 'jobs.sqlite3'))
+        self.executor = None  # Se crea con el primer trabajo
+        for job_id in self.store.reclaim_stale(process_alive):
+            for partial_path in glob.glob(os.path.join(self.directory, glob.escape(job_id) + '*.part')):
+                os.remove(partial_path)
+        self.purge_expired()
+
+    def purge_expired(self):
+        """Borra los archivos de los trabajos terminados hace más de `retention` segundos."""
+        for output_path in self.store.expire(time.time() - self.retention):
+            if os.path.exists(output_path):
+                os.remove(output_path)
+
+    def job_finished(self, job_id, future):
+        # Si el proceso murió o la tarea no llegó a ejecutarse, el trabajo no puede quedar en cola
+        if future.cancelled():
+            self.store.fail_unfinished(job_id, "El trabajo se descartó antes de ejecutarse.")
+        elif future.exception() is not None:
+            self.store.fail_unfinished(job_id, f"{type(future.exception()).__name__}: {future.exception()}")
+
+    def submit(self, schema, num_rows=10, file_format='csv', file_name='output_file', compression=None, seed=None):
+        """Encola una exportación y devuelve su id."""
+        # Valida formato, compresión y columnas únicas antes de aceptar el trabajo
+        FileExporter(file_format, compression)
+        DataGenerator(0).check_unique_domains(schema, num_rows)
+        self.purge_expired()
+        if self.store.count_active() >= self.max_pending:
+            raise RuntimeError("Hay demasiados trabajos pendientes; inténtelo más tarde.")
+        extension = f'.{file_format}{CompressedOutput.extensions.get(compression, "")}'
+        job_id = self.store.create(file_format, file_name + extension, num_rows)
+        spec = {'schema': schema, 'num_rows': num_rows, 'format': file_format,
+                'compression': compression, 'seed': seed}
+        output_path = os.path.join(self.directory, job_id + extension)
+        try:
+            future = self.start_executor().submit(run_export_job, self.store.database, job_id, spec, output_path)
+        except BrokenProcessPool:
+            # Un proceso del pool murió: los trabajos que tenía ya se marcaron como fallidos
+            self.executor = None
+            future = self.start_executor().submit(run_export_job, self.store.database, job_id, spec, output_path)
+        future.add_done_callback(partial(self.job_finished, job_id))
+        return job_id
+
+    def start_executor(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=multiprocessing.get_context('spawn'))
+        return self.executor
+
+    def progress(self, job_id):
+        return self.store.progress(job_id)
+
+    def cancel(self, job_id):
+        return self.store.request_cancel(job_id)
+
+    def result(self, job_id):
+        """Devuelve `(ruta, nombre de descarga)` del archivo de un trabajo terminado, o None."""
+        job = self.store.get(job_id)
+        if job is None or job['status'] != 'done' or not os.path.exists(job['output_path']):
+            return None
+        return job['output_path'], job['file_name']
+
+    def shutdown(self, wait=True):
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait)
+            self.executor = None
@@ -0,0 +1,149 @@
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing, contextmanager
+
+class JobStore:
+    """Estado de los trabajos de exportación en una base SQLite compartida.
+
+    El proceso web registra los trabajos y los procesos del pool actualizan su avance en la
+    misma base, así que cualquier worker de Django puede consultar o cancelar un trabajo
+    aunque lo haya encolado otro.
+    """
+    columns = ('id', 'status', 'format', 'file_name', 'num_rows', 'rows_done', 'created_at',
+               'started_at', 'finished_at', 'output_path', 'error', 'cancel_requested', 'owner_pid')
+
+    def __init__(self, database):
+        self.database = database
+        with self.connect() as connection:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, status TEXT NOT NULL, format TEXT, file_name TEXT, "
+                "num_rows INTEGER, rows_done INTEGER DEFAULT 0, created_at REAL, started_at REAL, "
+                "finished_at REAL, output_path TEXT, error TEXT, cancel_requested INTEGER DEFAULT 0, "
+                "owner_pid INTEGER)")
+            existing = {row[1] for row in connection.execute("PRAGMA table_info(jobs)")}
+            if 'owner_pid' not in existing:
+                # Bases creadas antes de registrar qué proceso encoló cada trabajo
+                connection.execute("ALTER TABLE jobs ADD COLUMN owner_pid INTEGER")
+
+    @contextmanager
+    def connect(self):
+        """Conexión de un solo uso: confirma o revierte la transacción al salir y siempre se cierra.
+
+        El contexto de `sqlite3` solo confirma; sin cerrarla, la conexión sigue abierta hasta que la
+        recoja el recolector y pasaría a los procesos del pool.
+        """
+        with closing(sqlite3.connect(self.database, timeout=30)) as connection, connection:
+            yield connection
+
+    def create(self, file_format, file_name, num_rows):
+        job_id = uuid.uuid4().hex
+        with self.connect() as connection:
+            connection.execute(
+                "INSERT INTO jobs (id, status, format, file_name, num_rows, created_at, owner_pid) "
+                "VALUES (?, 'queued', ?, ?, ?, ?, ?)",
+                (job_id, file_format, file_name, num_rows, time.time(), os.getpid()))
+        return job_id
+
+    def get(self, job_id):
+        with self.connect() as connection:
+            row = connection.execute(f"SELECT {', '.join(self.columns)} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(zip(self.columns, row)) if row is not None else None
+
+    def start(self, job_id):
+        """Marca el trabajo como en curso. Devuelve False si se canceló mientras estaba en cola."""
+        with self.connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = 'running', started_at = ? WHERE id = ? AND status = 'queued'",
+                (time.time(), job_id))
+            return cursor.rowcount == 1
+
+    def update_progress(self, job_id, rows_done):
+        """Guarda el avance y devuelve True si se pidió cancelar el trabajo."""
+        with self.connect() as connection:
+            connection.execute("UPDATE jobs SET rows_done = ? WHERE id = ?", (rows_done, job_id))
+            row = connection.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row[0])
+
+    def finish(self, job_id, status, rows_done=None, output_path=None, error=None):
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, rows_done = COALESCE(?, rows_done), finished_at = ?, "
+                "output_path = ?, error = ? WHERE id = ?",
+                (status, rows_done, time.time(), output_path, error, job_id))
+
+    def fail_unfinished(self, job_id, error):
+        """Marca como fallido un trabajo que quedó en cola o en curso (por ejemplo, si murió su proceso)."""
+        with self.connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, error = ? "
+                "WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), error, job_id))
+            return cursor.rowcount == 1
+
+    def reclaim_stale(self, is_alive):
+        """Marca como fallidos los trabajos en cola o en curso cuyo proceso dueño ya no existe, para que
+        no queden pendientes para siempre ni cuenten en el límite. Devuelve sus ids."""
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT id, owner_pid FROM jobs WHERE status IN ('queued', 'running')").fetchall()
+            stale = [job_id for job_id, owner_pid in rows if owner_pid is None or not is_alive(owner_pid)]
+            connection.executemany(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, "
+                "error = 'El proceso que ejecutaba el trabajo terminó antes de completarlo.' WHERE id = ?",
+                [(time.time(), job_id) for job_id in stale])
+        return stale
+
+    def expire(self, older_than):
+        """Marca como vencidos los trabajos terminados antes de `older_than` y devuelve sus archivos."""
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT id, output_path FROM jobs WHERE status IN ('done', 'failed', 'cancelled') "
+                "AND finished_at < ?", (older_than,)).fetchall()
+            connection.executemany("UPDATE jobs SET status = 'expired', output_path = NULL WHERE id = ?",
+                                   [(job_id,) for job_id, _ in rows])
+        return [output_path for _, output_path in rows if output_path]
+
+    def request_cancel(self, job_id):
+        """Cancela de inmediato un trabajo en cola, o marca uno en curso para que se detenga.
+        Devuelve False si el trabajo no existe o ya terminó."""
+        with self.connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ? AND status = 'queued'",
+                (time.time(), job_id))
+            if cursor.rowcount == 1:
+                return True
+            cursor = connection.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,))
+            return cursor.rowcount == 1
+
+    def count_active(self):
+        with self.connect() as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'running')").fetchone()[0]
+
+    def progress(self, job_id):
+        """Estado del trabajo con filas por segundo y tiempo restante estimado."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        rows_per_second = eta_seconds = None
+        if job['started_at'] is not None:
+            elapsed = (job['finished_at'] or time.time()) - job['started_at']
+            if elapsed > 0:
+                rows_per_second = job['rows_done'] / elapsed
+            if job['status'] == 'running' and rows_per_second:
+                eta_seconds = (job['num_rows'] - job['rows_done']) / rows_per_second
+        return {
+            'job_id': job['id'],
+            'status': job['status'],
+            'format': job['format'],
+            'num_rows': job['num_rows'],
+            'rows_done': job['rows_done'],
+            'rows_per_second': rows_per_second,
+            'eta_seconds': eta_seconds,
+            'error': job['error'],
+        }
@@ -0,0 +1,32 @@
+from array import array
+
+class KeyIndex:
+    """Claves de una columna guardadas en memoria compacta, con acceso por posición.
+
+    Las claves enteras van en un `array('q')` (8 bytes por clave). Las de texto se concatenan en
+    UTF-8 en un `bytearray`, con un `array('Q')` de posiciones finales. Así diez millones de
+    claves ocupan decenas de MB en lugar de los GB que costarían las filas como diccionarios.
+    """
+    def __init__(self, integer=True):
+        self.integer = integer
+        if integer:
+            self.keys = array('q')
+        else:
+            self.text = bytearray()
+            self.ends = array('Q')
+
+    def append(self, key):
+        if self.integer:
+            self.keys.append(key)
+        else:
+            self.text += str(key).encode('utf-8')
+            self.ends.append(len(self.text))
+
+    def __len__(self):
+        return len(self.keys) if self.integer else len(self.ends)
+
+    def __getitem__(self, position):
+        if self.integer:
+            return self.keys[position]
+        start = self.ends[position - 1] if position > 0 else 0
+        return self.text[start:self.ends[position]].decode('utf-8')
@@ -1,3 +1,64 @@
+import datetime
+import json
+
 class MongoDBInsertGenerator(InsertGeneratorBase):
+    """Genera scripts para mongosh: `insertOne` por documento o `insertMany` por lotes.
+
+    Los documentos se escriben como literales JavaScript válidos (null, true/false, cadenas
+    JSON) y las fechas como `ISODate(...)` en UTC, en lugar del `repr` de Python.
+    """
+    supports_multi_row = True
+    # Necesita los objetos de fecha para escribir ISODate
+    temporal_text = False
+    comment_prefix = '//'
+
     def generate_insert(self, table_name, data):
-        return f"db.{table_name}.insert({data});"
+        return f"db.{table_name}.insertOne({self.format_document(data)});"
+
+    def generate_batch_insert(self, table_name, columns, values):
+        if len(values) == 1:
+            return f"db.{table_name}.insertOne({values[0]});"
+        documents = ',\n'.join(values)
+        return f"db.{table_name}.insertMany([\n{documents}\n]);"
+
+    def format_document(self, data):
+        fields = ', '.join(f"{json.dumps(str(key), ensure_ascii=False)}: {self.format_value(value)}"
+                           for key, value in data.items())
+        return '{' + fields + '}'
+
+    def row_formatter(self, columns, schema=None):
+        """Compila el formateo de documentos: las claves quedan fijas en la plantilla y cada valor
+        usa el formateador del tipo de su columna."""
+        schema = schema or {}
+        placeholders, formatters = [], []
+        for column in columns:
+            key = json.dumps(str(column), ensure_ascii=False).replace('{', '{{').replace('}', '}}')
+            specs = schema.get(column) or {}
+            placeholders.append(key + ': {}')
+            formatters.append(self.format_value if specs.get('nullable', False) else self.value_formatter(specs.get('type')))
+        template = ('{{' + ', '.join(placeholders) + '}}').format
+
+        def format_row(data):
+            return template(*[format_value(value) for format_value, value in zip(formatters, data.values())])
+        return format_row
+
+    def value_formatter(self, field_type):
+        """Formateador de los valores no nulos de una columna de tipo `field_type`."""
+        if field_type in ('int', 'float'):
+            return str
+        elif field_type in ('string', 'phone', 'uuid', 'email', 'name'):
+            return json.JSONEncoder(ensure_ascii=False).encode
+        return self.format_value
+
+    def format_value(self, value):
+        if value is None:
+            return 'null'
+        elif isinstance(value, bool):
+            return 'true' if value else 'false'
+        elif isinstance(value, (int, float)):
+            return str(value)
+        elif isinstance(value, datetime.datetime):
+            return f'ISODate("{value.isoformat(timespec="seconds")}Z")'
+        elif isinstance(value, datetime.date):
+            return f'ISODate("{value.isoformat()}T00:00:00Z")'
+        return json.dumps(value if isinstance(value, str) else str(value), ensure_ascii=False)
@@ -1,5 +1,15 @@
 class MySQLInsertGenerator(InsertGeneratorBase):
+    supports_multi_row = True
+    # max_allowed_packet por defecto de MySQL 5.7; se puede subir si el servidor lo permite
+    max_statement_length = 4 * 1024 * 1024
+    # Sin NO_BACKSLASH_ESCAPES la barra invertida también es carácter de escape
+    escapes = (("\\", "\\\\"), ("'", "''"))
+
     def generate_insert(self, table_name, data):
         columns = ', '.join(data.keys())
         values = ', '.join(self.format_value(v) for v in data.values())
         return f"INSERT INTO {table_name} ({columns}) VALUES ({values});"
+
+    def generate_batch_insert(self, table_name, columns, values):
+        rows = ',\n'.join(values)
+        return f"INSERT INTO {table_name} ({columns}) VALUES {rows};"
@@ -0,0 +1,15 @@
+class MySQLLoadDataWriter(BulkLoadWriterBase):
+    """Genera un TSV para `LOAD DATA LOCAL INFILE` y la sentencia que lo carga."""
+    null_marker = '\\N'
+    escape_table = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
+
+    def escape(self, value):
+        return value.translate(self.escape_table)
+
+    def load_statement(self, table_name, columns, file_name, column_types):
+        return (f"LOAD DATA LOCAL INFILE '{file_name}'\n"
+                f"INTO TABLE {table_name}\n"
+                "CHARACTER SET utf8mb4\n"
+                "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'\n"
+                "LINES TERMINATED BY '\\n'\n"
+                f"({', '.join(columns)});\n")
@@ -0,0 +1,67 @@
+import bisect
+from array import array
+import names  # Solo se usa para ubicar los archivos de frecuencias que trae el paquete
+
+class NameCorpus:
+    """Listas de nombres y apellidos de `names`, cargadas una sola vez en memoria.
+
+    `names.get_full_name` vuelve a abrir y recorrer los archivos de frecuencias en cada llamada.
+    Aquí cada lista queda como una tupla de nombres y un `array` con su frecuencia acumulada, y
+    un nombre se elige con una búsqueda binaria. Se reproduce la distribución de `names`: se
+    sortea un valor en [0, 90) y se toma el primer nombre cuya frecuencia acumulada lo supera,
+    así que los nombres posteriores a ese límite nunca salen y no se cargan.
+    """
+    scale = 90.0
+    genders = ('male', 'female')
+    parts = ('full', 'first', 'last')
+    corpus = None  # Instancia compartida por todo el proceso
+
+    def __init__(self, files=None):
+        self.tables = {key: self.load_table(path) for key, path in (files or names.FILES).items()}
+
+    @classmethod
+    def shared(cls):
+        if cls.corpus is None:
+            cls.corpus = cls()
+        return cls.corpus
+
+    def load_table(self, path):
+        values, cumulative = [], array('d')
+        with open(path) as name_file:
+            for line in name_file:
+                name, _, total, _ = line.split()
+                values.append(name.capitalize())
+                cumulative.append(float(total))
+                if cumulative[-1] > self.scale:
+                    break
+        return tuple(values), cumulative
+
+    def table_sampler(self, key, rng):
+        values, cumulative = self.tables[key]
+        random, scale, bisect_right = rng.random, self.scale, bisect.bisect_right
+        return lambda: values[bisect_right(cumulative, random() * scale)]
+
+    def sampler(self, rng, gender=None, part='full'):
+        """Devuelve una función sin argumentos que genera nombres con `rng` (un `random.Random`).
+
+        `gender` es 'male', 'female' o None (se sortea en cada nombre); `part` es 'full',
+        'first' o 'last'.
+        """
+        if part not in self.parts:
+            raise ValueError(f"Parte de nombre no soportada: {part}")
+        last_name = self.table_sampler('last', rng)
+        if part == 'last':
+            return last_name
+        if gender in self.genders:
+            first_name = self.table_sampler(f'first:{gender}', rng)
+        elif gender is None:
+            male, female, random = self.table_sampler('first:male', rng), self.table_sampler('first:female', rng), rng.random
+            first_name = lambda: male() if random() < 0.5 else female()
+        else:
+            raise ValueError(f"Género no soportado: {gender}")
+        if part == 'first':
+            return first_name
+        return lambda: f"{first_name()} {last_name()}"
+
+    def sample(self, rng, gender=None, part='full'):
+        return self.sampler(rng, gender, part)()
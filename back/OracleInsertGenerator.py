@@ -1,6 +1,14 @@
 class OracleInsertGenerator(InsertGeneratorBase):
+    # Sin tipo BOOLEAN en SQL antes de 23c; se usa NUMBER(1)
+    true_literal = '1'
+    false_literal = '0'
+    returning_clause = ' RETURNING id INTO :id'
+
     def generate_insert(self, table_name, data):
         columns = ', '.join(data.keys())
         values = ', '.join(self.format_value(v) for v in data.values())
         # Nota: Oracle tiene diferentes tipos de manejo de secuencias, pero esto es un caso básico
-        return f"INSERT INTO {table_name} ({columns}) VALUES ({values}) RETURNING id INTO :id;"
+        return f"INSERT INTO {table_name} ({columns}) VALUES ({values}){self.returning(data.keys())};"
+
+    def generate_single_insert(self, table_name, columns, row):
+        return f"INSERT INTO {table_name} ({columns}) VALUES {row}{self.returning(columns)};"
@@ -0,0 +1,27 @@
+class OracleSQLLoaderWriter(BulkLoadWriterBase):
+    """Genera el archivo de datos y el archivo de control (.ctl) para SQL*Loader."""
+    delimiter = ','
+    control_extension = '.ctl'
+    field_types = {
+        'date': 'DATE "YYYY-MM-DD"',
+        'datetime': 'TIMESTAMP "YYYY-MM-DD HH24:MI:SS"',
+    }
+
+    def escape(self, value):
+        # Los campos van entre comillas dobles; un campo vacío sin comillas se carga como NULL
+        if '\n' in value or '\r' in value:
+            raise ValueError(f"SQL*Loader no admite saltos de línea en los datos: {value!r}")
+        return '"' + value.replace('"', '""') + '"'
+
+    def load_statement(self, table_name, columns, file_name, column_types):
+        fields = ',\n'.join(f"  {column} {self.field_types[column_types[column]]}"
+                            if column_types.get(column) in self.field_types else f"  {column}"
+                            for column in columns)
+        return ("LOAD DATA\n"
+                "CHARACTERSET AL32UTF8\n"
+                f"INFILE '{file_name}'\n"
+                "APPEND\n"
+                f"INTO TABLE {table_name}\n"
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"'\n"
+                "TRAILING NULLCOLS\n"
+                f"(\n{fields}\n)\n")
@@ -0,0 +1,89 @@
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+def generate_shard_rows(schema, seed, key_seed, row_offset, num_rows, counter_based=False):
+    """Genera las filas de un shard en un proceso del pool."""
+    data_generator = DataGenerator(seed, row_offset, key_seed, counter_based)
+    return data_generator.generate_rows(schema, num_rows, row_offset)
+
+def generate_shard_inserts(insert_generator, table_name, schema, seed, key_seed, row_offset, num_rows,
+                           counter_based=False):
+    """Genera el texto SQL de un shard en un proceso del pool."""
+    data_generator = DataGenerator(seed, row_offset, key_seed, counter_based)
+    return ''.join(insert_generator.iter_insert_chunks(table_name, schema, num_rows, data_generator=data_generator,
+                                                       start_row=row_offset))
+
+class ParallelGenerator:
+    """Reparte la generación en shards de tamaño fijo sobre un pool de procesos.
+
+    Cada shard recibe una semilla derivada de `seed` y de su índice. Los valores únicos salen de
+    una misma permutación con clave, y cada shard la recorre desde su primera fila global, así que
+    nunca colisionan. Como los shards no dependen de cuántos procesos haya, la misma semilla
+    produce la misma salida con cualquier número de `workers`. Los resultados se entregan en orden.
+
+    Con `counter_based=True` cada shard usa el modo por contador de `DataGenerator`: la salida ya no
+    depende ni de `shard_size`, y cualquier shard se puede regenerar por separado.
+    """
+    def __init__(self, workers=None, seed=None, shard_size=100000, counter_based=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self.shard_size = shard_size
+        self.counter_based = counter_based
+
+    def shard_seed(self, shard):
+        # En modo por contador todos los shards comparten la semilla; la fila decide el valor
+        return self.seed if self.counter_based else DataGenerator.derive_seed(self.seed, shard)
+
+    @property
+    def key_seed(self):
+        # En modo por contador la clave se deriva de la semilla igual que en un `DataGenerator` suelto
+        return None if self.counter_based else self.seed
+
+    def shards(self, num_rows):
+        """Devuelve la lista de `(semilla, primera fila, filas)` de cada shard."""
+        num_shards = max(1, -(-num_rows // self.shard_size))
+        return [(self.shard_seed(shard), shard * self.shard_size,
+                 min(self.shard_size, num_rows - shard * self.shard_size))
+                for shard in range(num_shards)]
+
+    def check_unique_domains(self, schema, num_rows):
+        """Comprueba las columnas únicas antes de repartir shards: todos recorren la misma permutación
+        desde la fila 0, así que el total de filas no puede superar el espacio de ninguna."""
+        DataGenerator(counter_based=True).check_unique_domains(schema, num_rows)
+
+    def map_ordered(self, function, tasks):
+        """Ejecuta las tareas en el pool y entrega los resultados en orden, con una ventana acotada
+        de shards en curso para que la memoria no crezca si el consumidor es más lento."""
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(function, *task))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def iter_rows(self, schema, num_rows=10):
+        """Genera las filas en paralelo y las entrega en el orden de los shards. Las columnas únicas
+        se comprueban al llamar, antes de crear el pool."""
+        self.check_unique_domains(schema, num_rows)
+        tasks = ((schema, seed, self.key_seed, row_offset, count, self.counter_based)
+                 for seed, row_offset, count in self.shards(num_rows))
+        return (row for rows in self.map_ordered(generate_shard_rows, tasks) for row in rows)
+
+    def generate_rows(self, schema, num_rows=10):
+        return list(self.iter_rows(schema, num_rows))
+
+    def iter_insert_chunks(self, insert_generator, table_name, schema, num_rows=10):
+        """Genera el texto SQL de cada shard en paralelo y lo entrega en orden."""
+        self.check_unique_domains(schema, num_rows)
+        tasks = ((insert_generator, table_name, schema, seed, self.key_seed, row_offset, count, self.counter_based)
+                 for seed, row_offset, count in self.shards(num_rows))
+        return self.map_ordered(generate_shard_inserts, tasks)
+
+    def write_inserts(self, sink, insert_generator, table_name, schema, num_rows=10):
+        """Escribe en `sink` las sentencias generadas en paralelo, en el orden de los shards."""
+        for chunk in self.iter_insert_chunks(insert_generator, table_name, schema, num_rows):
+            sink.write(chunk)
@@ -0,0 +1,56 @@
+import gzip
+import io
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+class ParallelGzipWriter(io.RawIOBase):
+    """Archivo binario que comprime bloques independientes en un pool de hilos (al estilo de pigz).
+
+    Cada bloque se convierte en un miembro gzip completo y los miembros se escriben en orden; la
+    concatenación es un gzip válido que `gunzip`, `zcat` o el módulo `gzip` leen como un solo flujo.
+    zlib libera el GIL al comprimir, así que la compresión se solapa con la generación.
+    """
+    def __init__(self, file_name, level=6, block_size=1 << 20, workers=None):
+        super().__init__()
+        self.file = open(file_name, 'wb')
+        self.level = level
+        self.block_size = block_size
+        workers = workers or os.cpu_count() or 1
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        # Bloques en curso acotados: la memoria no crece si el disco es más lento que la generación
+        self.max_pending = 2 * workers
+        self.pending = deque()
+        self.buffer = bytearray()
+        self.blocks = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        if len(self.buffer) >= self.block_size:
+            self.submit_block()
+        return len(data)
+
+    def submit_block(self):
+        block = bytes(self.buffer)
+        self.buffer.clear()
+        self.pending.append(self.executor.submit(gzip.compress, block, self.level, mtime=0))
+        self.blocks += 1
+        while len(self.pending) > self.max_pending:
+            self.file.write(self.pending.popleft().result())
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            # Un archivo vacío también lleva un miembro, para que siga siendo un gzip válido
+            if self.buffer or not self.blocks:
+                self.submit_block()
+            while self.pending:
+                self.file.write(self.pending.popleft().result())
+        finally:
+            self.executor.shutdown()
+            self.file.close()
+            super().close()
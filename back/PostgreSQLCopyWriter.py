@@ -0,0 +1,76 @@
+import datetime
+import struct
+from itertools import chain
+
+class PostgreSQLCopyWriter(BulkLoadWriterBase):
+    """Genera datos para `COPY ... FROM STDIN` en formato texto o binario."""
+    null_marker = '\\N'
+    true_value, false_value = 't', 'f'
+    escape_table = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+    binary_signature = b'PGCOPY\n\xff\r\n\x00'
+    pg_epoch_date = datetime.date(2000, 1, 1)
+    pg_epoch = datetime.datetime(2000, 1, 1)
+
+    def __init__(self, binary=False):
+        self.binary = binary
+
+    def escape(self, value):
+        return value.translate(self.escape_table)
+
+    def load_statement(self, table_name, columns, file_name, column_types):
+        options = ' WITH (FORMAT binary)' if self.binary else ''
+        return f"\\copy {table_name} ({', '.join(columns)}) FROM '{file_name}'{options}\n"
+
+    def encode_binary(self, value):
+        """Codifica un valor como campo binario de COPY: longitud (int32) seguida de los bytes.
+
+        Las columnas de destino deben ser: int -> bigint, float -> double precision, boolean,
+        date, datetime -> timestamp, hour -> time y cadenas -> text/varchar.
+        """
+        if value is None:
+            return b'\xff\xff\xff\xff'
+        elif isinstance(value, str):
+            encoded = value.encode('utf-8')
+            return struct.pack('!i', len(encoded)) + encoded
+        elif isinstance(value, bool):
+            return struct.pack('!i?', 1, value)
+        elif isinstance(value, int):
+            return struct.pack('!iq', 8, value)
+        elif isinstance(value, float):
+            return struct.pack('!id', 8, value)
+        elif isinstance(value, datetime.datetime):
+            return struct.pack('!iq', 8, (value - self.pg_epoch) // datetime.timedelta(microseconds=1))
+        elif isinstance(value, datetime.date):
+            return struct.pack('!ii', 4, (value - self.pg_epoch_date).days)
+        elif isinstance(value, datetime.time):
+            micros = ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond
+            return struct.pack('!iq', 8, micros)
+        encoded = str(value).encode('utf-8')
+        return struct.pack('!i', len(encoded)) + encoded
+
+    def open_data_file(self, file_name):
+        if self.binary:
+            return open(file_name, 'wb')
+        return super().open_data_file(file_name)
+
+    def write_data(self, file, rows):
+        if not self.binary:
+            return super().write_data(file, rows)
+        file.write(self.binary_signature + struct.pack('!ii', 0, 0))
+        encode = self.encode_binary
+        for row in rows:
+            file.write(struct.pack('!h', len(row)) + b''.join([encode(v) for v in row.values()]))
+        file.write(struct.pack('!h', -1))
+
+    def export(self, table_name, rows, file_name, column_types=None):
+        """En formato texto genera un único script para psql: `COPY ... FROM STDIN`, los datos y `\\.`."""
+        if self.binary:
+            return super().export(table_name, rows, file_name, column_types)
+        rows = iter(rows)
+        first = next(rows, None)
+        columns = list(first.keys()) if first is not None else []
+        with self.open_data_file(file_name) as file:
+            file.write(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN;\n")
+            self.write_data(file, chain([first], rows) if first is not None else [])
+            file.write('\\.\n')
+        print(f"Archivo COPY generado: {file_name}")
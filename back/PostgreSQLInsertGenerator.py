@@ -1,5 +1,12 @@
 class PostgreSQLInsertGenerator(InsertGeneratorBase):
+    supports_multi_row = True
+    returning_clause = ' RETURNING id'
+
     def generate_insert(self, table_name, data):
         columns = ', '.join(data.keys())
         values = ', '.join(self.format_value(v) for v in data.values())
-        return f"INSERT INTO {table_name} ({columns}) VALUES ({values}) RETURNING id;"
+        return f"INSERT INTO {table_name} ({columns}) VALUES ({values}){self.returning(data.keys())};"
+
+    def generate_batch_insert(self, table_name, columns, values):
+        rows = ',\n'.join(values)
+        return f"INSERT INTO {table_name} ({columns}) VALUES {rows}{self.returning(columns)};"
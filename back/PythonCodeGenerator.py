@@ -1,9 +1,46 @@
+import datetime
+import json
+
 class PythonCodeGenerator(CodeGeneratorBase):
-    def generate_code(self, data):
-        code = "data = [\n"
-        for row in data:
-            code += f"    {row},\n"
-        code += "]\n"
-        code += "for item in data:\n"
-        code += "    print(item)\n"
-        return code
+    # Etiqueta de cada tipo de fecha u hora en el archivo de datos externo
+    temporal_tags = (('$datetime', datetime.datetime), ('$date', datetime.date), ('$time', datetime.time))
+
+    def header(self):
+        # repr() de fechas y horas usa el módulo datetime
+        return "import datetime\n\ndata = [\n"
+
+    def format_row(self, row):
+        return f"    {row},\n"
+
+    def footer(self, num_chunks):
+        return "]\nfor item in data:\n    print(item)\n"
+
+    def tag_value(self, value):
+        """Fechas y horas como `{"$date": "texto ISO"}`, para que el cargador las vuelva a crear."""
+        for tag, value_type in self.temporal_tags:
+            if isinstance(value, value_type):
+                return {tag: value.isoformat()}
+        return str(value)
+
+    def format_data_line(self, row):
+        return json.dumps(row, default=self.tag_value, ensure_ascii=False) + '\n'
+
+    def loader(self, data_file_name):
+        return (
+            "import datetime\n"
+            "import json\n"
+            "import os\n\n"
+            "# Las fechas y horas vienen como {\"$date\": \"texto ISO\"}: se vuelven a crear los objetos\n"
+            "temporal_types = {'$datetime': datetime.datetime, '$date': datetime.date, '$time': datetime.time}\n\n"
+            "def decode(value):\n"
+            "    if isinstance(value, dict) and len(value) == 1:\n"
+            "        (tag, text), = value.items()\n"
+            "        if tag in temporal_types:\n"
+            "            return temporal_types[tag].fromisoformat(text)\n"
+            "    return value\n\n"
+            f"data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), {data_file_name!r})\n"
+            "with open(data_path, encoding='utf-8') as data_file:\n"
+            "    data = [{key: decode(value) for key, value in json.loads(line).items()} for line in data_file]\n"
+            "for item in data:\n"
+            "    print(item)\n"
+        )
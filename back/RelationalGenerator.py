@@ -0,0 +1,211 @@
+import os
+import random
+from itertools import islice
+
+class RelationalGenerator:
+    """Genera varias tablas relacionadas respetando sus claves foráneas, en flujo.
+
+    `tables` es `{tabla: {'schema': {...}, 'num_rows': N}}`. Una columna de clave foránea se
+    declara con `{'type': 'foreign_key', 'references': 'tabla.columna'}` (o solo `'tabla'` para
+    usar su `pk`) y acepta `distribution`: 'uniform' (por defecto) o 'skewed', donde `skew`
+    (por defecto 2.0) concentra los hijos en los primeros padres. También acepta `nullable`.
+
+    Las tablas se generan en orden topológico. De cada tabla referenciada solo se guarda la
+    columna de clave en un `KeyIndex`; las filas se entregan y se descartan, así que la memoria
+    depende del número de claves referenciadas y no del tamaño de las tablas hijas. Una tabla
+    puede referenciarse a sí misma: la clave sale de las filas ya generadas (NULL en la primera).
+    Si la tabla padre no tiene filas, la clave foránea debe ser `nullable` y queda en NULL.
+    """
+    distributions = ('uniform', 'skewed')
+
+    def __init__(self, tables, seed=None, temporal_text=False):
+        self.tables = tables
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self.temporal_text = temporal_text
+        self.references = {}  # (tabla, campo) -> (tabla padre, columna padre)
+        for table_name, table in tables.items():
+            for field, specs in table['schema'].items():
+                if specs.get('type') == 'foreign_key':
+                    self.references[(table_name, field)] = self.resolve_reference(table_name, field, specs)
+        self.order = self.table_order()
+
+    def resolve_reference(self, table_name, field, specs):
+        target = specs.get('references')
+        if not target:
+            raise ValueError(f"{table_name}.{field}: una clave foránea necesita 'references'.")
+        parent, _, column = str(target).partition('.')
+        if parent not in self.tables:
+            raise ValueError(f"{table_name}.{field}: la tabla referenciada {parent} no existe.")
+        parent_schema = self.tables[parent]['schema']
+        if not column:
+            column = next((name for name, parent_specs in parent_schema.items() if parent_specs.get('pk')), None)
+            if column is None:
+                raise ValueError(f"{table_name}.{field}: la tabla {parent} no tiene 'pk'.")
+        parent_specs = parent_schema.get(column)
+        if parent_specs is None:
+            raise ValueError(f"{table_name}.{field}: la columna {parent}.{column} no existe.")
+        if not (parent_specs.get('pk') or parent_specs.get('unique')):
+            raise ValueError(f"{table_name}.{field}: {parent}.{column} debe ser 'pk' o 'unique'.")
+        if parent_specs.get('nullable', False):
+            raise ValueError(f"{table_name}.{field}: {parent}.{column} es una clave referenciada y no puede ser 'nullable'.")
+        if (parent != table_name and self.tables[parent].get('num_rows', 10) <= 0
+                and self.tables[table_name].get('num_rows', 10) > 0 and not specs.get('nullable', False)):
+            raise ValueError(f"{table_name}.{field}: la tabla referenciada {parent} no tiene filas; "
+                             "la clave foránea debe ser 'nullable'.")
+        if specs.get('distribution', 'uniform') not in self.distributions:
+            raise ValueError(f"{table_name}.{field}: distribución no soportada: {specs.get('distribution')}")
+        skew = specs.get('skew', 2.0)
+        if not (SchemaPlan.is_number(skew) and skew > 0):
+            raise ValueError(f"{table_name}.{field}: 'skew' debe ser un número mayor que 0.")
+        null_chance = specs.get('null_chance', 0.1)
+        if not (SchemaPlan.is_number(null_chance) and 0 <= null_chance <= 1):
+            raise ValueError(f"{table_name}.{field}: 'null_chance' debe ser un número entre 0 y 1.")
+        return parent, column
+
+    def table_order(self):
+        """Orden topológico de las tablas (padres antes que hijos). Lanza `ValueError` si hay ciclos."""
+        parents = {table_name: set() for table_name in self.tables}
+        for (table_name, _), (parent, _) in self.references.items():
+            if parent != table_name:
+                parents[table_name].add(parent)
+        order = []
+        ready = [table_name for table_name in self.tables if not parents[table_name]]
+        while ready:
+            table_name = ready.pop(0)
+            order.append(table_name)
+            for child, child_parents in parents.items():
+                if table_name in child_parents:
+                    child_parents.discard(table_name)
+                    if not child_parents and child not in order and child not in ready:
+                        ready.append(child)
+        if len(order) != len(self.tables):
+            cycle = ', '.join(table_name for table_name in self.tables if table_name not in order)
+            raise ValueError(f"Las claves foráneas forman un ciclo entre: {cycle}")
+        return order
+
+    def resolved_schema(self, table_name):
+        """Esquema de la tabla con cada clave foránea con el tipo de la columna que referencia."""
+        schema = {}
+        for field, specs in self.tables[table_name]['schema'].items():
+            if specs.get('type') == 'foreign_key':
+                parent, column = self.references[(table_name, field)]
+                parent_type = self.tables[parent]['schema'][column].get('type')
+                specs = dict(specs, type=parent_type)
+                specs.pop('pk', None)
+                specs.pop('unique', None)
+            schema[field] = specs
+        return schema
+
+    @staticmethod
+    def key_sampler(index, rng, specs):
+        random = rng.random
+        if specs.get('distribution', 'uniform') == 'skewed':
+            skew = specs.get('skew', 2.0)
+            # u^skew con u uniforme acumula los valores cerca de 0: los primeros padres tienen más hijos
+            sample = lambda: index[int(len(index) * random() ** skew)]
+        else:
+            sample = lambda: index[int(len(index) * random())]
+        if specs.get('nullable', False):
+            null_chance = specs.get('null_chance', 0.1)
+            return lambda: None if random() < null_chance else sample()
+        return sample
+
+    @staticmethod
+    def self_reference(sample, index):
+        # En una autorreferencia solo hay claves de las filas anteriores
+        return lambda: sample() if len(index) else None
+
+    def iter_tables(self):
+        """Entrega `(tabla, esquema resuelto, filas)` en orden topológico.
+
+        Las filas de cada tabla deben consumirse antes de pedir la siguiente; las que queden sin
+        leer se generan igual al avanzar, para que los índices de claves estén completos.
+        """
+        indexes = {}
+        for parent, column in set(self.references.values()):
+            column_type = self.tables[parent]['schema'][column].get('type')
+            indexes[(parent, column)] = KeyIndex(integer=column_type == 'int')
+        # Las columnas únicas se comprueban antes de generar la primera fila de cualquier tabla
+        for table_name in self.order:
+            try:
+                DataGenerator(0).check_unique_domains(self.tables[table_name]['schema'],
+                                                      self.tables[table_name].get('num_rows', 10))
+            except ValueError as error:
+                raise ValueError(f"{table_name}: {error}") from error
+
+        for position, table_name in enumerate(self.order):
+            table_seed = DataGenerator.derive_seed(self.seed, position)
+            data_generator = DataGenerator(table_seed, temporal_text=self.temporal_text)
+            fk_rng = random.Random(DataGenerator.derive_seed(table_seed, 0))
+            rows = self.iter_table_rows(table_name, data_generator, fk_rng, indexes)
+            yield table_name, self.resolved_schema(table_name), rows
+            for _ in rows:
+                pass
+
+    def iter_table_rows(self, table_name, data_generator, fk_rng, indexes):
+        schema = self.tables[table_name]['schema']
+        fields, generators = [], []
+        for field, specs in schema.items():
+            if specs.get('type') == 'foreign_key':
+                index = indexes[self.references[(table_name, field)]]
+                generator = self.key_sampler(index, fk_rng, specs)
+                if self.references[(table_name, field)][0] == table_name:
+                    generator = self.self_reference(generator, index)
+                elif not len(index):
+                    # Padre sin filas: la clave es NULL (solo se admite si es `nullable`)
+                    generator = lambda: None
+            else:
+                generator = data_generator.compile_field(field, specs)
+            fields.append(field)
+            generators.append(generator)
+        recorded = [(fields.index(column), indexes[(parent, column)])
+                    for parent, column in indexes if parent == table_name]
+
+        for _ in range(self.tables[table_name].get('num_rows', 10)):
+            values = [generate() for generate in generators]
+            row = dict(zip(fields, values))
+            yield row
+            # La clave se registra después de entregar la fila: una autorreferencia nunca apunta a sí misma
+            for position, index in recorded:
+                index.append(values[position])
+
+    def iter_rows(self):
+        """Entrega `(tabla, fila)` para todas las tablas, en orden topológico."""
+        for table_name, _, rows in self.iter_tables():
+            for row in rows:
+                yield table_name, row
+
+    def write_inserts(self, sink, db_type, batch_size=100, chunk_size=1000):
+        """Escribe en `sink` los INSERT de todas las tablas, por bloques de `chunk_size` sentencias."""
+        generator = InsertGenerator(db_type).generator
+        for table_name, schema, rows in self.iter_tables():
+            statements = generator.iter_batch_inserts(table_name, rows, batch_size, schema)
+            while True:
+                chunk = list(islice(statements, chunk_size))
+                if not chunk:
+                    break
+                sink.write('\n'.join(chunk) + '\n')
+
+    def save_sql_file(self, file_name, db_type, batch_size=100, compression=None):
+        with CompressedOutput.open(file_name, 'w', compression) as file:
+            self.write_inserts(file, db_type, batch_size)
+        print(f"Archivo SQL generado: {file_name}")
+
+    def export(self, directory, file_format='csv', compression=None):
+        """Exporta cada tabla a `directory/<tabla>.<formato>` con `FileExporter`. Devuelve las rutas."""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for table_name, schema, rows in self.iter_tables():
+            path = os.path.join(directory, f'{table_name}.{file_format}{CompressedOutput.extensions.get(compression, "")}')
+            FileExporter(file_format, compression, schema).export(rows, path)
+            paths.append(path)
+        return paths
+
+    def load(self, loader, create_tables=True):
+        """Carga todas las tablas con un `DatabaseLoader`, padres antes que hijos."""
+        total = 0
+        for table_name, schema, rows in self.iter_tables():
+            if create_tables:
+                loader.create_table(table_name, schema)
+            total += loader.load_rows(table_name, rows)
+        return total
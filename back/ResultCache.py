@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+class ResultCache:
+    """Caché en disco, direccionada por contenido, de resultados generados con semilla fija.
+
+    Con semilla, la salida queda determinada por (esquema, semilla, filas, formato, dialecto...),
+    así que el hash de esas entradas identifica el archivo. Cada resultado se escribe en un
+    temporal del mismo directorio y se publica con `os.replace`, de modo que nunca se lee un
+    archivo a medias. Al superar `max_bytes` se eliminan los menos usados (por fecha de
+    modificación, que se actualiza en cada acierto).
+
+    `version` entra en cada clave: hay que subirlo cuando cambia la salida de los generadores o
+    exportadores para una misma semilla, así una caché existente deja de servir archivos viejos.
+    """
+    version = 4
+
+    def __init__(self, directory=None, max_bytes=1 << 30):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'generador_cache')
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def key(cls, schema, **inputs):
+        """Hash de las entradas que determinan el resultado. El esquema entra en su forma canónica."""
+        schema_key = schema.key if isinstance(schema, SchemaPlan) else SchemaPlan.schema_key(schema)
+        canonical = json.dumps(dict(inputs, schema=schema_key, version=cls.version),
+                               sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def path(self, key, suffix=''):
+        return os.path.join(self.directory, key + suffix)
+
+    def fetch(self, key, producer, suffix=''):
+        """Devuelve la ruta del resultado `key`; si no está, la crea llamando a `producer(ruta temporal)`."""
+        path = self.path(key, suffix)
+        if os.path.exists(path):
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass  # Lo eliminó otro proceso justo ahora; se vuelve a generar
+            else:
+                with self.lock:
+                    self.hits += 1
+                return path
+        with self.lock:
+            self.misses += 1
+        fd, temp_path = tempfile.mkstemp(suffix='.part', dir=self.directory)
+        os.close(fd)
+        try:
+            producer(temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.evict(keep=path)
+        return path
+
+    @staticmethod
+    def open_result(get_path, mode='rb', encoding=None, attempts=3):
+        """Abre el resultado que devuelve `get_path()`. Si otro proceso lo eliminó entre la búsqueda y
+        la apertura, `get_path()` lo vuelve a generar."""
+        for attempt in range(attempts):
+            try:
+                return open(get_path(), mode, encoding=encoding)
+            except FileNotFoundError:
+                if attempt == attempts - 1:
+                    raise
+
+    def evict(self, keep=None):
+        """Elimina los resultados menos usados hasta quedar por debajo de `max_bytes`."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith('.part'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def stats(self):
+        with self.lock:
+            return {'directory': self.directory, 'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses}
+
+    @staticmethod
+    def seeded_generator(seed, temporal_text=False):
+        return DataGenerator(seed, counter_based=True, temporal_text=temporal_text)
+
+    def export_path(self, schema, seed, num_rows, file_format, compression=None):
+        """Ruta en caché del archivo exportado con `FileExporter`."""
+        key = self.key(schema, seed=seed, num_rows=num_rows, format=file_format, compression=compression)
+        suffix = f'.{file_format}{CompressedOutput.extensions.get(compression, "")}'
+
+        def produce(temp_path):
+            data_generator = self.seeded_generator(seed, file_format in FileExporter.text_formats)
+            if file_format in ('parquet', 'arrow'):
+                data = data_generator.iter_batches(schema, num_rows)
+            else:
+                data = data_generator.iter_rows(schema, num_rows)
+            FileExporter(file_format, compression, schema).export(data, temp_path)
+        return self.fetch(key, produce, suffix)
+
+    def sql_path(self, table_name, schema, seed, num_rows, db_type, batch_size=1, compression=None):
+        """Ruta en caché del script SQL de `InsertGenerator`."""
+        key = self.key(schema, seed=seed, num_rows=num_rows, format='sql', dialect=db_type, table=table_name,
+                       batch_size=batch_size, compression=compression)
+        suffix = f'.sql{CompressedOutput.extensions.get(compression, "")}'
+
+        def produce(temp_path):
+            insert_generator = InsertGenerator(db_type, batch_size)
+            # Cada dialecto decide si recibe las fechas como texto (MongoDB las quiere como ISODate)
+            data_generator = self.seeded_generator(seed, insert_generator.generator.temporal_text)
+            insert_generator.save_sql_file(temp_path, table_name, schema, num_rows, compression=compression,
+                                           data_generator=data_generator)
+        return self.fetch(key, produce, suffix)
+
+    def code_path(self, schema, seed, num_rows, language):
+        """Ruta en caché del código generado por `CodeExporter`."""
+        key = self.key(schema, seed=seed, num_rows=num_rows, format='code', language=language)
+
+        def produce(temp_path):
+            rows = self.seeded_generator(seed).iter_rows(schema, num_rows)
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                file.writelines(CodeExporter(language).iter_code(rows))
+        return self.fetch(key, produce, '.txt')
+
+    def export_file(self, file_name, schema, seed, num_rows, file_format, compression=None):
+        """Como `FileExporter.export` con semilla fija: si el resultado ya existe, es una copia de archivo."""
+        with self.open_result(lambda: self.export_path(schema, seed, num_rows, file_format, compression)) as source, \
+                open(file_name, 'wb') as target:
+            shutil.copyfileobj(source, target)
+
+    def save_sql_file(self, file_name, table_name, schema, seed, num_rows, db_type, batch_size=1, compression=None):
+        """Como `InsertGenerator.save_sql_file` con semilla fija, servido desde la caché."""
+        with self.open_result(lambda: self.sql_path(table_name, schema, seed, num_rows, db_type, batch_size,
+                                                    compression)) as source, open(file_name, 'wb') as target:
+            shutil.copyfileobj(source, target)
+
+    def generate_code(self, schema, seed, num_rows, language):
+        """Como `CodeExporter.export` con semilla fija, servido desde la caché."""
+        with self.open_result(lambda: self.code_path(schema, seed, num_rows, language), 'r', 'utf-8') as file:
+            return file.read()
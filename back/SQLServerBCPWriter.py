@@ -0,0 +1,54 @@
+import os
+from xml.sax.saxutils import quoteattr
+
+class SQLServerBCPWriter(BulkLoadWriterBase):
+    """Genera un archivo delimitado en modo carácter de bcp, su archivo de formato XML y la sentencia de carga.
+
+    El modo carácter de bcp no tiene secuencias de escape: NULL es un campo vacío (requiere
+    KEEPNULLS) y la cadena vacía se escribe como un byte NUL. Un valor que contenga un
+    separador no se puede representar y se rechaza.
+
+    `BULK INSERT` asigna los campos por posición, así que la carga lee el archivo con
+    `OPENROWSET(BULK ...)` y el archivo de formato, que da nombre a cada campo, e inserta con la
+    lista de columnas explícita: el orden de las columnas de la tabla no importa.
+    """
+    format_extension = '.fmt.xml'
+
+    def escape(self, value):
+        if not value:
+            return '\0'
+        if '\t' in value or '\n' in value or '\r' in value:
+            raise ValueError(f"El formato bcp no admite tabuladores ni saltos de línea en los datos: {value!r}")
+        return value
+
+    @staticmethod
+    def quote_identifier(name):
+        return '[' + str(name).replace(']', ']]') + ']'
+
+    def format_file_name(self, file_name):
+        return os.path.splitext(file_name)[0] + self.format_extension
+
+    def format_file(self, columns):
+        """Archivo de formato XML: cada campo termina en tabulador (el último en salto de línea) y se
+        lee como NVARCHAR con el nombre de su columna; SQL Server lo convierte al tipo de la tabla."""
+        terminators = ['\\t'] * (len(columns) - 1) + ['\\n'] if columns else []
+        fields = ''.join(f'    <FIELD ID="{position}" xsi:type="CharTerm" TERMINATOR="{terminator}"/>\n'
+                         for position, terminator in enumerate(terminators, 1))
+        row = ''.join(f'    <COLUMN SOURCE="{position}" NAME={quoteattr(str(column))} xsi:type="SQLNVARCHAR"/>\n'
+                      for position, column in enumerate(columns, 1))
+        return ('<?xml version="1.0"?>\n'
+                '<BCPFORMAT xmlns="http://schemas.microsoft.com/sqlserver/2004/bulkload/format" '
+                'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">\n'
+                f'  <RECORD>\n{fields}  </RECORD>\n'
+                f'  <ROW>\n{row}  </ROW>\n'
+                '</BCPFORMAT>\n')
+
+    def support_files(self, columns, file_name, column_types):
+        return {self.format_file_name(file_name): self.format_file(columns)}
+
+    def load_statement(self, table_name, columns, file_name, column_types):
+        column_list = ', '.join(self.quote_identifier(column) for column in columns)
+        format_file = self.format_file_name(file_name)
+        return (f"INSERT INTO {table_name} WITH (TABLOCK, KEEPNULLS) ({column_list})\n"
+                f"SELECT {column_list}\n"
+                f"FROM OPENROWSET(BULK '{file_name}', FORMATFILE = '{format_file}', CODEPAGE = '65001') AS data;\n")
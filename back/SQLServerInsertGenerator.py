@@ -1,5 +1,16 @@
 class SQLServerInsertGenerator(InsertGeneratorBase):
+    supports_multi_row = True
+    # Un constructor de valores de tabla admite como máximo 1000 filas
+    max_rows_per_insert = 1000
+    # BIT no acepta TRUE/FALSE
+    true_literal = '1'
+    false_literal = '0'
+
     def generate_insert(self, table_name, data):
         columns = ', '.join(data.keys())
         values = ', '.join(self.format_value(v) for v in data.values())
         return f"INSERT INTO {table_name} ({columns}) VALUES ({values});"
+
+    def generate_batch_insert(self, table_name, columns, values):
+        rows = ',\n'.join(values)
+        return f"INSERT INTO {table_name} ({columns}) VALUES {rows};"
@@ -1,5 +1,14 @@
 class SQLiteInsertGenerator(InsertGeneratorBase):
+    supports_multi_row = True
+    # SQLITE_MAX_VARIABLE_NUMBER (3.32+) y SQLITE_MAX_SQL_LENGTH por defecto
+    max_variables = 32766
+    max_statement_length = 1000000
+
     def generate_insert(self, table_name, data):
         columns = ', '.join(data.keys())
         values = ', '.join(self.format_value(v) for v in data.values())
         return f"INSERT INTO {table_name} ({columns}) VALUES ({values});"
+
+    def generate_batch_insert(self, table_name, columns, values):
+        rows = ',\n'.join(values)
+        return f"INSERT INTO {table_name} ({columns}) VALUES {rows};"
@@ -0,0 +1,123 @@
+import hashlib
+import json
+from collections.abc import Mapping
+
+class SchemaPlan(Mapping):
+    """Esquema validado y normalizado, listo para compilarse sin volver a revisarlo.
+
+    Se comporta como el diccionario original (campo -> specs), pero cada spec ya trae sus valores
+    por defecto resueltos y `unique` refleja también `pk`. `key` es un hash del esquema canónico:
+    dos esquemas iguales, aunque sus specs se escriban en otro orden, tienen la misma clave.
+    El orden de los campos sí cuenta, porque define el orden de las columnas.
+    """
+    defaults = {
+        'string': {'length': 10},
+        'int': {'min': 0, 'max': 1000},
+        'float': {'min': 0.0, 'max': 1000.0, 'decimals': 2},
+        'boolean': {},
+        'date': {'start_year': 2000, 'end_year': 2024},
+        'datetime': {'start_year': 2000, 'end_year': 2024},
+        'hour': {},
+        'enum': {'options': []},
+        'email': {'domain_list': ["example.com", "test.org", "demo.net"]},
+        'phone': {'digits': 8},
+        'uuid': {},
+        'name': {'part': 'full'},
+    }
+    # Parámetros que deben ser enteros o números; se validan antes de compararlos
+    integer_params = {
+        'int': ('min', 'max'),
+        'float': ('decimals',),
+        'string': ('length',),
+        'phone': ('digits',),
+        'date': ('start_year', 'end_year'),
+        'datetime': ('start_year', 'end_year'),
+    }
+    number_params = {'float': ('min', 'max')}
+
+    def __init__(self, schema, key=None):
+        self.key = key or self.schema_key(schema)
+        self.specs = {str(field): self.resolve_field(field, specs) for field, specs in schema.items()}
+
+    @staticmethod
+    def canonical(schema):
+        """Serialización estable del esquema: campos en su orden, claves de cada spec ordenadas
+        y sin las que valen None (equivalen a omitirlas)."""
+        if not isinstance(schema, Mapping):
+            raise ValueError("El esquema debe ser un objeto {campo: especificación}.")
+        fields = [[field, {name: value for name, value in specs.items() if value is not None}
+                           if isinstance(specs, Mapping) else specs]
+                  for field, specs in schema.items()]
+        return json.dumps(fields, sort_keys=True, separators=(',', ':'), default=str)
+
+    @classmethod
+    def schema_key(cls, schema):
+        return hashlib.sha256(cls.canonical(schema).encode('utf-8')).hexdigest()
+
+    def resolve_field(self, field, specs):
+        if not isinstance(specs, Mapping):
+            raise ValueError(f"La especificación del campo {field} debe ser un objeto.")
+        field_type = specs.get('type')
+        if field_type not in self.defaults:
+            raise ValueError(f"Tipo de dato desconocido: {field_type}")
+        resolved = dict(self.defaults[field_type])
+        resolved.update((name, value) for name, value in specs.items() if value is not None)
+        resolved['unique'] = bool(specs.get('unique', False) or specs.get('pk', False))
+        resolved['nullable'] = bool(specs.get('nullable', False))
+        resolved.setdefault('null_chance', 0.1)
+
+        for name in self.integer_params.get(field_type, ()):
+            if not self.is_number(resolved[name], integer=True):
+                raise ValueError(f"Campo {field}: '{name}' debe ser un número entero.")
+        for name in self.number_params.get(field_type, ()) + ('null_chance',):
+            if not self.is_number(resolved[name]):
+                raise ValueError(f"Campo {field}: '{name}' debe ser un número.")
+        if field_type == 'enum' and not isinstance(resolved['options'], (list, tuple)):
+            raise ValueError(f"Campo {field}: 'options' debe ser una lista.")
+        if field_type in ('int', 'float') and resolved['min'] > resolved['max']:
+            raise ValueError(f"Campo {field}: 'min' no puede ser mayor que 'max'.")
+        if field_type in ('date', 'datetime') and not all(1 <= resolved[name] <= 9999
+                                                          for name in ('start_year', 'end_year')):
+            raise ValueError(f"Campo {field}: 'start_year' y 'end_year' deben estar entre 1 y 9999.")
+        if field_type in ('date', 'datetime') and resolved['start_year'] > resolved['end_year']:
+            raise ValueError(f"Campo {field}: 'start_year' no puede ser mayor que 'end_year'.")
+        if field_type == 'string' and resolved['length'] < 0:
+            raise ValueError(f"Campo {field}: 'length' no puede ser negativo.")
+        if field_type == 'phone' and resolved['digits'] < 1:
+            raise ValueError(f"Campo {field}: 'digits' debe ser al menos 1.")
+        if field_type == 'enum' and not resolved['options']:
+            raise ValueError(f"Campo {field}: un enum necesita al menos una opción en 'options'.")
+        if field_type == 'enum':
+            try:
+                resolved['alias_table'] = AliasTable.from_specs(resolved)
+            except ValueError as error:
+                raise ValueError(f"Campo {field}: {error}") from None
+        if field_type == 'email' and not (isinstance(resolved['domain_list'], (list, tuple)) and
+                                          all(isinstance(domain, str) and domain for domain in resolved['domain_list'])):
+            raise ValueError(f"Campo {field}: 'domain_list' debe ser una lista de dominios (texto).")
+        if field_type == 'email' and not resolved['domain_list']:
+            # Una lista vacía usa los dominios por defecto, como siempre
+            resolved['domain_list'] = self.defaults['email']['domain_list']
+        if field_type == 'name' and resolved['part'] not in NameCorpus.parts:
+            raise ValueError(f"Campo {field}: 'part' debe ser uno de {', '.join(NameCorpus.parts)}.")
+        if field_type == 'name' and resolved.get('gender') not in (None,) + NameCorpus.genders:
+            raise ValueError(f"Campo {field}: 'gender' debe ser male, female o null.")
+        if not 0 <= resolved['null_chance'] <= 1:
+            raise ValueError(f"Campo {field}: 'null_chance' debe estar entre 0 y 1.")
+        return resolved
+
+    @staticmethod
+    def is_number(value, integer=False):
+        # bool es subclase de int, pero `true` no es un límite válido
+        if isinstance(value, bool):
+            return False
+        return isinstance(value, int) if integer else isinstance(value, (int, float))
+
+    def __getitem__(self, field):
+        return self.specs[field]
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def __len__(self):
+        return len(self.specs)
@@ -0,0 +1,45 @@
+import threading
+from collections import OrderedDict
+
+class SchemaPlanCache:
+    """Caché LRU de `SchemaPlan` indexada por el hash del esquema canónico.
+
+    Un esquema repetido solo se serializa para calcular su clave; la validación y la resolución
+    de valores por defecto se hacen una vez. Es segura entre hilos y cuenta aciertos y fallos.
+    """
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.plans = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, schema):
+        """Devuelve el plan de `schema`, creándolo si no está. Lanza `ValueError` si el esquema no es válido."""
+        if isinstance(schema, SchemaPlan):
+            return schema
+        key = SchemaPlan.schema_key(schema)
+        with self.lock:
+            plan = self.plans.get(key)
+            if plan is not None:
+                self.plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+        # Se construye fuera del lock; si dos hilos coinciden, el resultado es el mismo
+        plan = SchemaPlan(schema, key)
+        with self.lock:
+            self.plans[key] = plan
+            self.plans.move_to_end(key)
+            while len(self.plans) > self.max_size:
+                self.plans.popitem(last=False)
+        return plan
+
+    def stats(self):
+        with self.lock:
+            return {'size': len(self.plans), 'max_size': self.max_size, 'hits': self.hits, 'misses': self.misses}
+
+    def clear(self):
+        with self.lock:
+            self.plans.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,47 @@
+class UniquePermutation:
+    """Permutación pseudoaleatoria con clave sobre `[0, size)`: red de Feistel con cycle-walking.
+
+    Cada índice se transforma en un valor distinto en tiempo y memoria constantes, así que los
+    valores únicos se entregan sin guardar los ya usados ni reintentar colisiones.
+    """
+    rounds = 4
+
+    def __init__(self, size, key, start=0):
+        if size <= 0:
+            raise ValueError("El espacio de valores únicos debe tener al menos un elemento.")
+        self.size = size
+        self.position = start
+        # La red trabaja sobre 2 * half_bits bits, el menor dominio par que cubre `size`
+        self.half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.mask = (1 << self.half_bits) - 1
+        self.keys = [(key + (i + 1) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF for i in range(self.rounds)]
+
+    def __len__(self):
+        return self.size
+
+    def permute(self, value):
+        """Aplica las rondas de Feistel; la función de ronda es una mezcla tipo splitmix64."""
+        half_bits, mask = self.half_bits, self.mask
+        left, right = value >> half_bits, value & mask
+        for key in self.keys:
+            z = (right * 0xBF58476D1CE4E5B9 + key) & 0xFFFFFFFFFFFFFFFF
+            z = ((z ^ (z >> 31)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+            left, right = right, left ^ ((z ^ (z >> 29)) & mask)
+        return (left << half_bits) | right
+
+    def __getitem__(self, index):
+        """Devuelve el valor de la posición `index`; los valores fuera de rango vuelven a cifrarse."""
+        if not 0 <= index < self.size:
+            raise IndexError(f"Índice fuera del espacio de valores únicos: {index}")
+        value = self.permute(index)
+        while value >= self.size:
+            value = self.permute(value)
+        return value
+
+    def next_value(self):
+        """Devuelve el siguiente valor único; falla en cuanto se agota el espacio."""
+        if self.position >= self.size:
+            raise ValueError(f"Se agotaron los {self.size} valores únicos disponibles.")
+        value = self[self.position]
+        self.position += 1
+        return value
@@ -1,12 +1,14 @@
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 
 class XMLExporter(ExporterBase):
-    def export(self, data, file_name='output.xml'):
-        root = ET.Element("data")
+    def iter_parts(self, data):
+        # Registro por registro, en lugar de construir el ElementTree completo
+        yield "<?xml version='1.0' encoding='utf-8'?>\n<data>"
         for row in data:
-            record = ET.SubElement(root, "record")
-            for key, value in row.items():
-                ET.SubElement(record, key).text = str(value)
-        tree = ET.ElementTree(root)
-        tree.write(file_name, encoding="utf-8", xml_declaration=True)
+            fields = ''.join(f"<{key}>{escape(str(value))}</{key}>" for key, value in row.items())
+            yield f"<record>{fields}</record>"
+        yield "</data>"
+
+    def export(self, data, file_name='output.xml'):
+        self.write_file(data, file_name, encoding='utf-8')
         print(f"Archivo XML generado: {file_name}")
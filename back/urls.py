@@ -5,4 +5,8 @@ urlpatterns = [
     path('generate-data/', views.GenerateDataView.as_view(), name='generate-data'),
     path('export-file/', views.ExportFileView.as_view(), name='export-file'),
     path('generate-code/', views.GenerateCodeView.as_view(), name='generate-code'),
+    path('export-jobs/', views.ExportJobView.as_view(), name='export-jobs'),
+    path('export-jobs/<str:job_id>/', views.ExportJobStatusView.as_view(), name='export-job-status'),
+    path('export-jobs/<str:job_id>/download/', views.ExportJobDownloadView.as_view(), name='export-job-download'),
+    path('schema-cache/', views.SchemaCacheStatsView.as_view(), name='schema-cache'),
 ]
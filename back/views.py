@@ -1,18 +1,71 @@
+import os
+import tempfile
+from django.http import StreamingHttpResponse, FileResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from .data_generator import DataGenerator  # Clase que ya implementamos
-from .file_exporters import FileExporter   # Exportadores de archivos
+from .data_generator import DataGenerator, SchemaPlanCache  # Clase que ya implementamos
+from .file_exporters import FileExporter, CompressedOutput   # Exportadores de archivos
 from .code_exporters import CodeExporter   # Exportadores de código
+from .jobs import JobManager, ResultCache   # Trabajos en segundo plano y caché de resultados
+
+# Pool compartido por todas las peticiones de este proceso
+job_manager = JobManager()
+# Planes de esquema ya validados, compartidos por todas las vistas
+schema_plans = SchemaPlanCache()
+# Resultados con semilla fija, reutilizados entre peticiones y procesos
+result_cache = ResultCache()
+
+def iter_temp_file(path, block_size=65536):
+    """Lee un archivo temporal por bloques y lo elimina al terminar (o si se corta la conexión)."""
+    try:
+        with open(path, 'rb') as file:
+            while True:
+                block = file.read(block_size)
+                if not block:
+                    break
+                yield block
+    finally:
+        os.unlink(path)
+
 
 class GenerateDataView(APIView):
     """Genera datos aleatorios basados en un esquema y los retorna como JSON."""
     def post(self, request):
-        schema = request.data.get('schema', {})
+        try:
+            schema = schema_plans.get(request.data.get('schema', {}))
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
         num_rows = request.data.get('num_rows', 10)
+        seed = request.data.get('seed')
+        start_row = request.data.get('start_row', 0)  # Con semilla permite paginar un conjunto virtual
+        stream_format = request.data.get('stream')  # None, jsonl o csv
         
-        data_generator = DataGenerator()
-        generated_data = [data_generator.generate_data(schema) for _ in range(num_rows)]
+        # Al transmitir, las fechas solo se necesitan como texto
+        temporal_text = stream_format is not None
+        if seed is not None:
+            data_generator = DataGenerator(seed, counter_based=True, temporal_text=temporal_text)
+        else:
+            data_generator = DataGenerator(temporal_text=temporal_text)
+
+        if stream_format is not None and stream_format not in ('jsonl', 'csv'):
+            return Response({"error": f"Formato de streaming no soportado: {stream_format}"},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            if stream_format is not None:
+                # Las filas se generan mientras se envían: memoria y primer byte no dependen de num_rows.
+                # `iter_rows` valida las columnas únicas antes de devolver el iterador.
+                rows = data_generator.iter_rows(schema, num_rows, start_row)
+            else:
+                generated_data = data_generator.generate_rows(schema, num_rows, start_row)
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if stream_format is not None:
+            exporter = FileExporter(stream_format)
+            return StreamingHttpResponse(exporter.iter_chunks(rows),
+                                         content_type=FileExporter.content_types[stream_format])
         
         return Response(generated_data, status=status.HTTP_200_OK)
 
@@ -20,35 +73,153 @@ class GenerateDataView(APIView):
 class ExportFileView(APIView):
     """Genera datos y los exporta en un archivo del formato especificado."""
     def post(self, request):
-        schema = request.data.get('schema', {})
+        try:
+            schema = schema_plans.get(request.data.get('schema', {}))
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
         num_rows = request.data.get('num_rows', 10)
-        file_format = request.data.get('format', 'csv')  # csv, json, xml, excel
+        file_format = request.data.get('format', 'csv')  # csv, json, jsonl, ejsonl, xml, excel, parquet, arrow
         file_name = request.data.get('file_name', 'output_file')
+        compression = request.data.get('compression')  # None, gzip, bz2, xz
+        seed = request.data.get('seed')
 
-        # Generar los datos
-        data_generator = DataGenerator()
-        generated_data = [data_generator.generate_data(schema) for _ in range(num_rows)]
+        try:
+            exporter = FileExporter(file_format, compression, schema)
+            # Una columna única sin valores suficientes es un error del cliente, no del servidor
+            DataGenerator(0).check_unique_domains(schema, num_rows)
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+        output_file = f'{file_name}.{file_format}{CompressedOutput.extensions.get(compression, "")}'
+        content_type = FileExporter.content_types.get(file_format) if compression is None else 'application/octet-stream'
+
+        if seed is not None:
+            # Con semilla el archivo siempre es el mismo: se genera una vez y se sirve desde la caché
+            file = result_cache.open_result(
+                lambda: result_cache.export_path(schema, seed, num_rows, file_format, compression))
+            return FileResponse(file, as_attachment=True, filename=output_file, content_type=content_type)
 
-        # Exportar a archivo
-        exporter = FileExporter(file_format)
-        exporter.export(generated_data, f'{file_name}.{file_format}')
+        # Generar los datos a medida que el exportador los escribe
+        data_generator = DataGenerator(temporal_text=file_format in FileExporter.text_formats)
+        if file_format in ('parquet', 'arrow'):
+            # Los formatos columnares consumen lotes de columnas sin pasar por diccionarios
+            generated_data = data_generator.iter_batches(schema, num_rows)
+        else:
+            generated_data = data_generator.iter_rows(schema, num_rows)
 
-        return Response({"message": f"Archivo generado: {file_name}.{file_format}"}, status=status.HTTP_200_OK)
+        if exporter.streamable:
+            # Formatos de texto: el cuerpo del archivo se envía a medida que se genera
+            response = StreamingHttpResponse(exporter.iter_chunks(generated_data), content_type=content_type)
+            response['Content-Disposition'] = f'attachment; filename="{output_file}"'
+            return response
+
+        # Excel, Parquet, Arrow y los archivos comprimidos se escriben en un temporal fuera del
+        # directorio de trabajo, que se envía por bloques y se elimina al terminar
+        fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(output_file)[1])
+        os.close(fd)
+        try:
+            exporter.export(generated_data, temp_path)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+        response = StreamingHttpResponse(iter_temp_file(temp_path), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{output_file}"'
+        response['Content-Length'] = os.path.getsize(temp_path)
+        return response
 
 
 class GenerateCodeView(APIView):
     """Genera datos y devuelve el código en el lenguaje especificado (Python, C++, JS, Java)."""
     def post(self, request):
-        schema = request.data.get('schema', {})
+        try:
+            schema = schema_plans.get(request.data.get('schema', {}))
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
         num_rows = request.data.get('num_rows', 10)
         language = request.data.get('language', 'python')
+        stream = request.data.get('stream', False)
+        seed = request.data.get('seed')
+
+        try:
+            code_exporter = CodeExporter(language)
+            DataGenerator(0).check_unique_domains(schema, num_rows)
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if seed is not None:
+            # El código generado con semilla se guarda en la caché de resultados
+            return Response({"code": result_cache.generate_code(schema, seed, num_rows, language)},
+                            status=status.HTTP_200_OK)
 
-        # Generar los datos
         data_generator = DataGenerator()
-        generated_data = [data_generator.generate_data(schema) for _ in range(num_rows)]
+
+        if stream:
+            # El código se envía como texto plano por fragmentos
+            code = code_exporter.iter_code(data_generator.iter_rows(schema, num_rows))
+            return StreamingHttpResponse(code, content_type='text/plain; charset=utf-8')
+
+        # Generar los datos
+        generated_data = data_generator.generate_rows(schema, num_rows)
 
         # Generar código
-        code_exporter = CodeExporter(language)
         code = code_exporter.export(generated_data)
 
         return Response({"code": code}, status=status.HTTP_200_OK)
+
+
+class ExportJobView(APIView):
+    """Encola una exportación grande y devuelve el id del trabajo sin esperar a que termine."""
+    def post(self, request):
+        try:
+            schema = schema_plans.get(request.data.get('schema', {}))
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+        num_rows = request.data.get('num_rows', 10)
+        file_format = request.data.get('format', 'csv')
+        file_name = request.data.get('file_name', 'output_file')
+        compression = request.data.get('compression')
+        seed = request.data.get('seed')
+
+        try:
+            job_id = job_manager.submit(schema, num_rows, file_format, file_name, compression, seed)
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+        except RuntimeError as error:
+            return Response({"error": str(error)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        return Response({"job_id": job_id}, status=status.HTTP_202_ACCEPTED)
+
+
+class ExportJobStatusView(APIView):
+    """Consulta el avance de un trabajo (filas, filas/s, tiempo restante) o lo cancela."""
+    def get(self, request, job_id):
+        progress = job_manager.progress(job_id)
+        if progress is None:
+            return Response({"error": "Trabajo no encontrado"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(progress, status=status.HTTP_200_OK)
+
+    def delete(self, request, job_id):
+        if not job_manager.cancel(job_id):
+            return Response({"error": "El trabajo no existe o ya terminó"}, status=status.HTTP_409_CONFLICT)
+        return Response({"message": "Cancelación solicitada"}, status=status.HTTP_202_ACCEPTED)
+
+
+class ExportJobDownloadView(APIView):
+    """Descarga el archivo generado por un trabajo terminado."""
+    def get(self, request, job_id):
+        result = job_manager.result(job_id)
+        if result is None:
+            return Response({"error": "El archivo no está disponible"}, status=status.HTTP_404_NOT_FOUND)
+        path, output_file = result
+        try:
+            file = open(path, 'rb')
+        except FileNotFoundError:
+            # Venció y se borró entre la consulta y la apertura
+            return Response({"error": "El archivo no está disponible"}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(file, as_attachment=True, filename=output_file)
+
+
+class SchemaCacheStatsView(APIView):
+    """Estado de las cachés: planes de esquema en memoria y resultados con semilla en disco."""
+    def get(self, request):
+        return Response({"schema_plans": schema_plans.stats(), "results": result_cache.stats()},
+                        status=status.HTTP_200_OK)
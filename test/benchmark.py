@@ -0,0 +1,363 @@
+"""Benchmarks de rendimiento del generador, con resultados en JSON y comparación contra una línea base.
+
+Mide filas/s, MB/s y memoria máxima (RSS) por tipo de campo de `DataGenerator`, por dialecto de
+`InsertGenerator`, por formato de `FileExporter` y por lenguaje de `CodeExporter`, en varios
+tamaños y anchos de esquema. Cada caso corre en un proceso nuevo para que el pico de memoria de
+uno no contamine al siguiente.
+
+    python test/benchmark.py run --output resultados.json
+    python test/benchmark.py run --sizes small,medium --groups dialects,formats --output actual.json
+    python test/benchmark.py compare base.json actual.json --threshold 0.10
+
+`compare` termina con código 1 si algún caso pierde más de `threshold` de filas/s, sube su pico
+de memoria más de `rss-threshold` o falla, así que sirve como control en integración continua.
+También falla si un caso de la línea base falta o pasó a omitirse, salvo con `--allow-missing`.
+"""
+import argparse
+import datetime
+import glob
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows: no hay medición de RSS
+    resource = None
+
+BACK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'back')
+
+SIZES = {'small': 1000, 'medium': 10000, 'large': 100000}
+WIDTHS = {'narrow': 4, 'medium': 12, 'wide': 36}
+GROUPS = ('fields', 'dialects', 'formats', 'languages')
+
+FIELD_SPECS = {
+    'string': {'type': 'string', 'length': 10},
+    'int': {'type': 'int', 'min': 0, 'max': 1000000},
+    'float': {'type': 'float'},
+    'boolean': {'type': 'boolean'},
+    'date': {'type': 'date'},
+    'datetime': {'type': 'datetime'},
+    'hour': {'type': 'hour'},
+    'enum': {'type': 'enum', 'options': ['AC', 'IN', 'BL', 'PE']},
+    'enum_weighted': {'type': 'enum', 'options': ['AC', 'IN', 'BL', 'PE'], 'weights': [90, 6, 3, 1]},
+    'email': {'type': 'email'},
+    'phone': {'type': 'phone'},
+    'uuid': {'type': 'uuid'},
+    'name': {'type': 'name'},
+    'int_unique': {'type': 'int', 'min': 0, 'max': 10 ** 9, 'unique': True},
+}
+DIALECTS = ('mysql', 'postgresql', 'sqlserver', 'sqlite', 'oracle', 'mongodb')
+FORMATS = ('csv', 'json', 'jsonl', 'ejsonl', 'xml', 'excel', 'parquet', 'arrow')
+LANGUAGES = ('python', 'javascript', 'cpp', 'java')
+
+_namespace = None
+
+
+def load_back():
+    """Carga las clases de `back/` en un solo espacio de nombres.
+
+    Los módulos de `back/` tienen una clase por archivo y se referencian entre sí por nombre,
+    sin imports, así que se ejecutan en orden hasta que todos resuelven sus dependencias. Los
+    que necesitan una dependencia opcional que no está instalada (numpy, pyarrow, openpyxl) se
+    omiten y sus casos se marcan como omitidos.
+    """
+    global _namespace
+    if _namespace is not None:
+        return _namespace
+    namespace = {'__name__': 'back', 'missing_dependencies': {}}
+    pending = sorted(path for path in glob.glob(os.path.join(BACK_DIR, '*.py'))
+                     if os.path.basename(path) not in ('views.py', 'urls.py', '__init__.py'))
+    while pending:
+        progress = False
+        for path in list(pending):
+            with open(path, encoding='utf-8') as source:
+                code = compile(source.read(), path, 'exec')
+            try:
+                exec(code, namespace)
+            except NameError:
+                continue
+            except ImportError as error:
+                class_name = os.path.splitext(os.path.basename(path))[0]
+                namespace['missing_dependencies'][class_name] = error.name or str(error)
+            pending.remove(path)
+            progress = True
+        if not progress:
+            raise RuntimeError(f"No se pudieron cargar: {', '.join(map(os.path.basename, pending))}")
+    _namespace = namespace
+    return namespace
+
+
+def build_schema(width):
+    """Esquema de `width` columnas: una clave primaria y luego los tipos de campo en rotación."""
+    types = [name for name in FIELD_SPECS if name != 'int_unique']
+    schema = {'id': {'type': 'int', 'min': 1, 'max': 10 ** 12, 'pk': True}}
+    for column in range(width - 1):
+        field_type = types[column % len(types)]
+        schema[f'{field_type}_{column}'] = dict(FIELD_SPECS[field_type])
+    return schema
+
+
+class CountingSink:
+    """Destino de escritura que solo cuenta los bytes recibidos."""
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, text):
+        self.bytes += len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+def run_field(back, case, rows):
+    schema = {'value': FIELD_SPECS[case]}
+    data_generator = back['DataGenerator'](0)
+    start = time.perf_counter()
+    for _ in data_generator.iter_rows(schema, rows):
+        pass
+    seconds = time.perf_counter() - start
+    # Tamaño aproximado en texto, con una muestra fuera de la medición
+    sample = back['DataGenerator'](0).generate_rows(schema, min(rows, 1000))
+    average = sum(len(str(row['value'])) for row in sample) / max(1, len(sample))
+    return seconds, int(average * rows)
+
+
+def run_dialect(back, case, rows, width, batch_size):
+    schema = build_schema(width)
+    insert_generator = back['InsertGenerator'](case, batch_size)
+    data_generator = back['DataGenerator'](0, temporal_text=insert_generator.generator.temporal_text)
+    sink = CountingSink()
+    start = time.perf_counter()
+    insert_generator.write_inserts(sink, 'benchmark', schema, rows, data_generator=data_generator)
+    return time.perf_counter() - start, sink.bytes
+
+
+def run_format(back, case, rows, width):
+    schema = build_schema(width)
+    exporter = back['FileExporter'](case)
+    data_generator = back['DataGenerator'](0, temporal_text=case in back['FileExporter'].text_formats)
+    fd, path = tempfile.mkstemp(suffix=f'.{case}')
+    os.close(fd)
+    stdout = sys.stdout
+    try:
+        sys.stdout = io.StringIO()  # Los exportadores anuncian el archivo generado
+        start = time.perf_counter()
+        if case in ('parquet', 'arrow'):
+            exporter.export(data_generator.iter_batches(schema, rows), path)
+        else:
+            exporter.export(data_generator.iter_rows(schema, rows), path)
+        seconds = time.perf_counter() - start
+        return seconds, os.path.getsize(path)
+    finally:
+        sys.stdout = stdout
+        os.remove(path)
+
+
+def run_language(back, case, rows, width):
+    schema = build_schema(width)
+    code_exporter = back['CodeExporter'](case)
+    sink = CountingSink()
+    start = time.perf_counter()
+    for chunk in code_exporter.iter_code(back['DataGenerator'](0).iter_rows(schema, rows)):
+        sink.write(chunk)
+    return time.perf_counter() - start, sink.bytes
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo da en KB y macOS en bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(group, case, rows, width, repeat, batch_size):
+    """Ejecuta un caso `repeat` veces en este proceso y devuelve el mejor tiempo."""
+    back = load_back()
+    required = {'formats': 'FileExporter', 'languages': 'CodeExporter'}.get(group, 'DataGenerator')
+    if required not in back:
+        return {'skipped': f"{required} no está disponible"}
+    best = None
+    try:
+        for _ in range(repeat):
+            if group == 'fields':
+                seconds, size = run_field(back, case, rows)
+            elif group == 'dialects':
+                seconds, size = run_dialect(back, case, rows, width, batch_size)
+            elif group == 'formats':
+                seconds, size = run_format(back, case, rows, width)
+            else:
+                seconds, size = run_language(back, case, rows, width)
+            if best is None or seconds < best[0]:
+                best = (seconds, size)
+    except (NameError, ImportError) as error:
+        # Formatos cuya dependencia opcional no está instalada
+        missing = back['missing_dependencies'].get(getattr(error, 'name', None))
+        return {'skipped': f"{error.name} requiere {missing}" if missing else str(error)}
+    except Exception as error:
+        # Un caso que falla se registra como fallido y el resto sigue corriendo
+        return {'failed': f"{type(error).__name__}: {error}"}
+    seconds, size = best
+    return {
+        'seconds': seconds,
+        'bytes': size,
+        'rows_per_sec': rows / seconds if seconds else None,
+        'mb_per_sec': size / (1024 * 1024) / seconds if seconds else None,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def iter_cases(groups, sizes, widths):
+    for group in groups:
+        for size_name in sizes:
+            rows = SIZES[size_name]
+            if group == 'fields':
+                for case in FIELD_SPECS:
+                    yield group, case, size_name, rows, 'single', 1
+                continue
+            cases = {'dialects': DIALECTS, 'formats': FORMATS, 'languages': LANGUAGES}[group]
+            for width_name in widths:
+                for case in cases:
+                    yield group, case, size_name, rows, width_name, WIDTHS[width_name]
+
+
+def case_key(result):
+    return result['group'], result['case'], result['size'], result['width']
+
+
+def run(args):
+    groups = args.groups.split(',')
+    sizes = args.sizes.split(',')
+    widths = args.widths.split(',')
+    for name, valid in (('groups', GROUPS), ('sizes', SIZES), ('widths', WIDTHS)):
+        unknown = set(locals()[name]) - set(valid)
+        if unknown:
+            raise SystemExit(f"Valores no válidos en --{name}: {', '.join(sorted(unknown))}")
+
+    results = []
+    for group, case, size_name, rows, width_name, width in iter_cases(groups, sizes, widths):
+        task = (group, case, rows, width, args.repeat, args.batch_size)
+        if args.in_process:
+            measurement = run_case(*task)
+        else:
+            # Un proceso por caso: el pico de RSS corresponde solo a ese caso
+            try:
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    measurement = executor.submit(run_case, *task).result()
+            except Exception as error:
+                # Por ejemplo, el proceso del caso murió por falta de memoria
+                measurement = {'failed': f"{type(error).__name__}: {error}"}
+        result = {'group': group, 'case': case, 'size': size_name, 'rows': rows, 'width': width_name,
+                  'columns': width, **measurement}
+        results.append(result)
+        if 'skipped' in measurement:
+            print(f"{group:9} {case:13} {size_name:6} {width_name:6}  omitido: {measurement['skipped']}")
+        elif 'failed' in measurement:
+            print(f"{group:9} {case:13} {size_name:6} {width_name:6}  FALLÓ: {measurement['failed']}")
+        else:
+            rss = f"{measurement['peak_rss_mb']:8.1f} MB" if measurement['peak_rss_mb'] is not None else '       -'
+            print(f"{group:9} {case:13} {size_name:6} {width_name:6} {measurement['rows_per_sec']:12,.0f} filas/s "
+                  f"{measurement['mb_per_sec']:8.2f} MB/s {rss}")
+
+    report = {
+        'metadata': {
+            'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'batch_size': args.batch_size,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"Resultados guardados en {args.output}")
+
+
+def compare(args):
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = {case_key(result): result for result in json.load(file)['results']}
+    with open(args.current, encoding='utf-8') as file:
+        current = {case_key(result): result for result in json.load(file)['results']}
+
+    regressions = []
+    # Casos que dejaron de medirse: faltan o pasaron a omitirse (p. ej. falta una dependencia)
+    unmeasured = []
+    for key in sorted(set(baseline) - set(current)):
+        unmeasured.append(f"{' '.join(key)}: no está en los resultados actuales")
+    for key in sorted(set(baseline) & set(current)):
+        before, after = baseline[key], current[key]
+        label = ' '.join(key)
+        if 'failed' in after:
+            regressions.append(f"{label}: falló ({after['failed']})")
+            print(f"{label:45} FALLÓ: {after['failed']}")
+            continue
+        if 'skipped' in after and 'skipped' not in before and 'failed' not in before:
+            unmeasured.append(f"{label}: omitido ({after['skipped']})")
+            continue
+        if 'skipped' in before or 'skipped' in after or 'failed' in before:
+            continue
+        speed = after['rows_per_sec'] / before['rows_per_sec']
+        status = ''
+        if speed < 1 - args.threshold:
+            status = 'REGRESIÓN'
+            regressions.append(f"{label}: filas/s {speed - 1:+.1%}")
+        if before.get('peak_rss_mb') and after.get('peak_rss_mb'):
+            memory = after['peak_rss_mb'] / before['peak_rss_mb']
+            if memory > 1 + args.rss_threshold:
+                status = 'REGRESIÓN'
+                regressions.append(f"{label}: RSS {memory - 1:+.1%}")
+        print(f"{label:45} {before['rows_per_sec']:12,.0f} -> {after['rows_per_sec']:12,.0f} filas/s "
+              f"({speed - 1:+.1%}) {status}")
+
+    if unmeasured:
+        print(f"\n{len(unmeasured)} casos de la línea base no se midieron:")
+        for case in unmeasured:
+            print(f"  {case}")
+        if not args.allow_missing:
+            regressions.extend(unmeasured)
+    if regressions:
+        print(f"\n{len(regressions)} regresiones, fallos o casos sin medir:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("\nSin regresiones por encima del umbral.")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de rendimiento del generador de datos.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Ejecuta los benchmarks y guarda los resultados en JSON.")
+    run_parser.add_argument('--output', default='benchmark.json')
+    run_parser.add_argument('--groups', default=','.join(GROUPS), help=f"De: {', '.join(GROUPS)}")
+    run_parser.add_argument('--sizes', default=','.join(SIZES), help=f"De: {', '.join(SIZES)}")
+    run_parser.add_argument('--widths', default=','.join(WIDTHS), help=f"De: {', '.join(WIDTHS)}")
+    run_parser.add_argument('--repeat', type=int, default=3, help="Repeticiones por caso; se guarda la mejor.")
+    run_parser.add_argument('--batch-size', type=int, default=100, help="Filas por INSERT en los dialectos.")
+    run_parser.add_argument('--in-process', action='store_true',
+                            help="No aísla cada caso en un proceso (más rápido, RSS acumulado).")
+
+    compare_parser = commands.add_parser('compare', help="Compara dos resultados y marca las regresiones.")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="Caída relativa de filas/s tolerada (0.10 = 10%%).")
+    compare_parser.add_argument('--rss-threshold', type=float, default=0.20,
+                                help="Aumento relativo de memoria máxima tolerado.")
+    compare_parser.add_argument('--allow-missing', action='store_true',
+                                help="No falla si hay casos de la línea base que faltan o pasaron a omitirse.")
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        run(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
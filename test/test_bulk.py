@@ -0,0 +1,129 @@
+import contextlib
+import csv
+import io
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from support import load_back
+
+# Cadenas que un usuario puede pasar (opciones de enum, filas propias) y que cada formato debe escapar
+VALUES = ["O'Brien", 'barra\\invertida', 'tab\tdentro', 'salto\nde línea', 'retorno\rcarro', '\\N', '',
+          'comilla "doble"', "todo'\\\t\n\"", 'ñandú €', 'a,b']
+PLAIN_VALUES = [value for value in VALUES if not re.search('[\t\n\r]', value)]
+ESCAPES = {'\\': '\\', 't': '\t', 'n': '\n', 'r': '\r', '0': '\0'}
+
+
+def decode_text_field(field):
+    """Campo del formato texto de COPY y de LOAD DATA: `\\N` es NULL y la barra escapa el siguiente carácter."""
+    if field == '\\N':
+        return None
+    return re.sub(r'\\(.)', lambda match: ESCAPES[match.group(1)], field)
+
+
+class GeneratedTextTest(unittest.TestCase):
+    def test_safe_text_types_never_need_escaping(self):
+        # InsertGeneratorBase cita estos tipos sin escapar: los valores generados solo usan letras, dígitos y '-'
+        back = load_back()
+        schema = {field_type: {'type': field_type, 'length': 30, 'digits': 12}
+                  for field_type in back.InsertGeneratorBase.safe_text_types}
+        for counter_based in (False, True):
+            for row in back.DataGenerator(1, counter_based=counter_based).iter_rows(schema, 3000):
+                for field_type, value in row.items():
+                    self.assertRegex(value, r'^[A-Za-z0-9-]*$', field_type)
+
+
+class InsertEscapingTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+
+    def test_round_trip_through_sqlite(self):
+        schema = {'id': {'type': 'int'}, 'option': {'type': 'enum', 'options': VALUES},
+                  'email': {'type': 'email'}, 'name': {'type': 'name', 'nullable': True}}
+        rows = [{'id': index, 'option': value, 'email': value, 'name': value} for index, value in enumerate(VALUES)]
+        rows.append({'id': len(VALUES), 'option': None, 'email': '', 'name': None})
+        # Los dialectos que siguen el estándar (solo duplican la comilla simple) también los entiende SQLite
+        for db_type in ('sqlite', 'postgresql', 'sqlserver'):
+            for batch_size in (1, 4):
+                with self.subTest(db_type=db_type, batch_size=batch_size):
+                    generator = self.back.InsertGenerator(db_type).generator
+                    connection = sqlite3.connect(':memory:')
+                    self.addCleanup(connection.close)
+                    connection.execute("CREATE TABLE device (id INTEGER, option TEXT, email TEXT, name TEXT)")
+                    for statement in generator.iter_batch_inserts('device', rows, batch_size, schema):
+                        connection.execute(statement)
+                    loaded = connection.execute("SELECT id, option, email, name FROM device ORDER BY id").fetchall()
+                    self.assertEqual(loaded, [tuple(row.values()) for row in rows])
+
+    def test_mysql_escapes_backslashes(self):
+        generator = self.back.InsertGenerator('mysql').generator
+        self.assertEqual(generator.format_value("a'b\\c"), "'a''b\\\\c'")
+        statement, = generator.iter_batch_inserts('device', [{'name': "a'b\\c"}], 1, {'name': {'type': 'name'}})
+        self.assertEqual(statement, "INSERT INTO device (name) VALUES ('a''b\\\\c');")
+
+
+class BulkLoadEscapingTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+        self.directory = tempfile.mkdtemp(prefix='generador_bulk_')
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.rows = [{'id': index, 'value': value} for index, value in enumerate(VALUES)]
+        self.rows.append({'id': len(VALUES), 'value': None})
+
+    def export(self, writer, rows, name):
+        path = os.path.join(self.directory, name)
+        with contextlib.redirect_stdout(io.StringIO()):  # Los escritores anuncian el archivo generado
+            writer.export('device', rows, path, {'id': 'int', 'value': 'string'})
+        with open(path, encoding='utf-8', newline='') as file:
+            return file.read()
+
+    def decode_tsv(self, text):
+        rows = []
+        for line in text.split('\n')[:-1]:
+            index, value = line.split('\t')
+            rows.append({'id': int(index), 'value': decode_text_field(value)})
+        return rows
+
+    def test_postgresql_copy_text(self):
+        text = self.export(self.back.PostgreSQLCopyWriter(), self.rows, 'device.copy')
+        header, data = text.split('\n', 1)
+        self.assertEqual(header, 'COPY device (id, value) FROM STDIN;')
+        self.assertTrue(data.endswith('\\.\n'))
+        self.assertEqual(self.decode_tsv(data[:-len('\\.\n')]), self.rows)
+
+    def test_mysql_load_data(self):
+        rows = self.rows + [{'id': len(self.rows), 'value': 'nul\0dentro'}]
+        text = self.export(self.back.MySQLLoadDataWriter(), rows, 'device.tsv')
+        self.assertEqual(self.decode_tsv(text), rows)
+
+    def test_sqlserver_bcp(self):
+        rows = [row for row in self.rows if row['value'] is None or row['value'] in PLAIN_VALUES]
+        text = self.export(self.back.SQLServerBCPWriter(), rows, 'device.dat')
+        loaded = []
+        for line in text.split('\n')[:-1]:
+            index, value = line.split('\t')
+            # Campo vacío es NULL (con KEEPNULLS) y un byte NUL es la cadena vacía; el resto va tal cual
+            loaded.append({'id': int(index), 'value': None if value == '' else '' if value == '\0' else value})
+        self.assertEqual(loaded, rows)
+        for value in set(VALUES) - set(PLAIN_VALUES):
+            with self.assertRaises(ValueError):
+                self.back.SQLServerBCPWriter().format_value(value)
+
+    def test_oracle_sql_loader(self):
+        writer = self.back.OracleSQLLoaderWriter()
+        rows = [row for row in self.rows if row['value'] is None or '\n' not in row['value'] and '\r' not in row['value']]
+        text = self.export(writer, rows, 'device.dat')
+        loaded = [{'id': int(index), 'value': value} for index, value in csv.reader(io.StringIO(text))]
+        # csv no distingue "" de un campo vacío: NULL se comprueba aparte
+        self.assertEqual(loaded, [dict(row, value=row['value'] or '') for row in rows])
+        self.assertEqual(writer.format_value(None), '')
+        self.assertEqual(writer.format_value(''), '""')
+        with self.assertRaises(ValueError):
+            writer.format_value('salto\nde línea')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from support import load_back
+
+SCHEMA = {
+    'id': {'type': 'int', 'pk': True, 'min': 1, 'max': 10 ** 6},
+    'name': {'type': 'name'},
+    'd': {'type': 'date'},
+    'seen_at': {'type': 'datetime', 'nullable': True},
+}
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+        self.directory = tempfile.mkdtemp(prefix='generador_cache_')
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.cache = self.back.ResultCache(os.path.join(self.directory, 'cache'))
+
+    def read_script(self, path):
+        # Sin la línea de cabecera, que lleva la fecha de generación
+        with open(path, encoding='utf-8') as file:
+            return file.read().split('\n', 1)[1]
+
+    def test_cached_script_matches_uncached(self):
+        for db_type in ('mongodb', 'postgresql'):
+            cached = os.path.join(self.directory, f'cached_{db_type}.sql')
+            uncached = os.path.join(self.directory, f'uncached_{db_type}.sql')
+            self.cache.save_sql_file(cached, 'device', SCHEMA, 5, 200, db_type, batch_size=50)
+            insert_generator = self.back.InsertGenerator(db_type, 50)
+            data_generator = self.back.DataGenerator(5, counter_based=True,
+                                                     temporal_text=insert_generator.generator.temporal_text)
+            insert_generator.save_sql_file(uncached, 'device', SCHEMA, 200, data_generator=data_generator)
+            self.assertEqual(self.read_script(cached), self.read_script(uncached))
+            # Un acierto devuelve el mismo archivo
+            self.cache.save_sql_file(cached, 'device', SCHEMA, 5, 200, db_type, batch_size=50)
+            self.assertEqual(self.read_script(cached), self.read_script(uncached))
+        self.assertIn('ISODate(', self.read_script(os.path.join(self.directory, 'cached_mongodb.sql')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from support import load_back
+
+
+def wide_schema(columns):
+    schema = {'id': {'type': 'int', 'pk': True, 'min': 1, 'max': 10 ** 9}}
+    for column in range(columns - 1):
+        schema[f'c{column}'] = {'type': 'string', 'length': 12, 'nullable': True, 'null_chance': 0.2}
+    return schema
+
+
+class JavaCodeTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+        self.generator = self.back.JavaCodeGenerator()
+        self.directory = tempfile.mkdtemp(prefix='generador_java_')
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def write(self, schema, num_rows, name):
+        """Escribe `Main.java` en su propia carpeta; devuelve (carpeta, si los datos quedaron en un TSV)."""
+        folder = os.path.join(self.directory, name)
+        os.makedirs(folder)
+        rows = self.back.DataGenerator(3).generate_rows(schema, num_rows)
+        with open(os.path.join(folder, 'Main.java'), 'w', encoding='utf-8') as code_file:
+            external = self.generator.write_code(rows, code_file, os.path.join(folder, 'data.tsv'))
+        return folder, external
+
+    def test_limits_scale_with_columns(self):
+        self.assertEqual(self.generator.row_limits({'a': 1, 'b': 2}), (250, 2000))
+        chunk_rows, inline_rows = self.generator.row_limits(wide_schema(36))
+        self.assertLessEqual(chunk_rows * 36, self.generator.max_chunk_cells)
+        self.assertLessEqual(inline_rows * 36, self.generator.max_inline_cells)
+
+        folder, external = self.write(wide_schema(36), 2000, 'wide')
+        self.assertTrue(external)
+        folder, external = self.write(wide_schema(36), inline_rows, 'inline')
+        self.assertFalse(external)
+        with open(os.path.join(folder, 'Main.java'), encoding='utf-8') as file:
+            code = file.read()
+        # Dos constantes por literal distinto, muy por debajo de las 65535 de la clase
+        self.assertLess(2 * len(set(re.findall(r'"(?:[^"\\]|\\.)*"', code))), 65535)
+        for body in re.findall(r'private static void addRows\d+\(.*?\n    }\n', code, re.S):
+            self.assertLessEqual(body.count('"') // 2 + body.count('null'), self.generator.max_chunk_cells)
+
+    def test_null_is_encoded_in_tsv(self):
+        line = self.generator.tsv_line({'a': None, 'b': '\\N', 'c': ''})
+        self.assertEqual(line, '\\N\t\\\\N\t\n')
+
+    @unittest.skipIf(shutil.which('javac') is None, "javac no está instalado")
+    def test_generated_java_compiles_and_inline_matches_external(self):
+        schema = wide_schema(36)
+        outputs = []
+        for name, num_rows in (('inline', 500), ('external', 2000)):
+            folder, external = self.write(schema, num_rows, name)
+            self.assertEqual(external, name == 'external')
+            subprocess.run(['javac', 'Main.java'], cwd=folder, check=True, capture_output=True)
+            result = subprocess.run(['java', 'Main'], cwd=folder, check=True, capture_output=True, text=True)
+            outputs.append(result.stdout.splitlines())
+        inline, external = outputs
+        # Las primeras filas son las mismas: NULL se imprime igual en los dos casos
+        self.assertEqual(inline, external[:len(inline)])
+        self.assertTrue(any('null' in line for line in inline))
+
+
+class PythonCodeTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+        self.directory = tempfile.mkdtemp(prefix='generador_python_')
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def test_inline_matches_external(self):
+        schema = {
+            'id': {'type': 'int', 'pk': True, 'min': 1, 'max': 10 ** 6},
+            'name': {'type': 'name'},
+            'price': {'type': 'float'},
+            'active': {'type': 'boolean'},
+            'd': {'type': 'date', 'nullable': True, 'null_chance': 0.2},
+            'seen_at': {'type': 'datetime'},
+            'opens': {'type': 'hour'},
+            'status': {'type': 'enum', 'options': ['AC', "O'K", 3]},
+        }
+        rows = self.back.DataGenerator(11).generate_rows(schema, 200)
+        outputs = []
+        for name, inline_row_limit in (('inline', 1000), ('external', 1)):
+            generator = self.back.PythonCodeGenerator()
+            generator.inline_row_limit = inline_row_limit
+            code_path = os.path.join(self.directory, f'{name}.py')
+            with open(code_path, 'w', encoding='utf-8') as code_file:
+                external = generator.write_code(rows, code_file, os.path.join(self.directory, f'{name}.jsonl'))
+            self.assertEqual(external, name == 'external')
+            result = subprocess.run([sys.executable, code_path], check=True, capture_output=True, text=True)
+            outputs.append(result.stdout)
+        inline, external = outputs
+        self.assertEqual(inline, external)
+        self.assertIn('datetime.date(', external)
+        self.assertIn('datetime.time(', external)
+
+
+if __name__ == '__main__':
+    unittest.main()
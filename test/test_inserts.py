@@ -0,0 +1,87 @@
+import unittest
+
+from support import load_back
+
+SCHEMA = {
+    'id': {'type': 'int', 'pk': True, 'min': 1, 'max': 10 ** 6},
+    'code': {'type': 'string', 'length': 6},
+    'name': {'type': 'name'},
+    'email': {'type': 'email', 'nullable': True, 'null_chance': 0.3},
+    'price': {'type': 'float'},
+    'active': {'type': 'boolean'},
+    'born': {'type': 'date'},
+    'seen_at': {'type': 'datetime', 'nullable': True},
+    'opens': {'type': 'hour'},
+    'status': {'type': 'enum', 'options': ['AC', "O'K", 3]},
+}
+
+
+class OracleInsertTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+        self.generator = self.back.InsertGenerator('oracle').generator
+
+    def test_schema_formatter_matches_per_value_formatting(self):
+        rows = self.back.DataGenerator(7).generate_rows(SCHEMA, 300)
+        typed = list(self.generator.iter_batch_inserts('device', rows, 100, SCHEMA))
+        self.assertEqual(typed, [self.generator.generate_insert('device', row) for row in rows])
+
+    def test_single_row_insert_uses_typed_literals(self):
+        row = {'id': 5, 'name': "O'Brien", 'email': None, 'active': True, 'status': "O'K"}
+        statement, = self.generator.iter_batch_inserts('device', [row], 100, SCHEMA)
+        self.assertEqual(statement, "INSERT INTO device (id, name, email, active, status) "
+                                    "VALUES (5, 'O''Brien', NULL, 1, 'O''K') RETURNING id INTO :id;")
+
+    def test_text_temporal_rows(self):
+        data_generator = self.back.DataGenerator(7, temporal_text=True)
+        statements = self.back.InsertGenerator('oracle').iter_inserts('device', SCHEMA, 50, data_generator)
+        for statement in statements:
+            self.assertTrue(statement.endswith(') RETURNING id INTO :id;'))
+            self.assertNotIn('True', statement)
+            self.assertNotIn('None', statement)
+
+
+class DialectLimitTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+
+    def statements(self, db_type, schema, num_rows, batch_size):
+        insert_generator = self.back.InsertGenerator(db_type, batch_size)
+        statements = list(insert_generator.iter_inserts('device', schema, num_rows, self.back.DataGenerator(3)))
+        # Las filas de un lote van separadas por ',\n'; los valores generados no llevan saltos de línea
+        rows = [statement.count(',\n(') + 1 for statement in statements]
+        self.assertEqual(sum(rows), num_rows)
+        return statements, rows
+
+    def test_sqlserver_rows_per_insert(self):
+        statements, rows = self.statements('sqlserver', {'id': {'type': 'int'}, 'flag': {'type': 'boolean'}}, 3500, 5000)
+        self.assertEqual(rows, [1000, 1000, 1000, 500])
+
+    def test_sqlite_variables(self):
+        schema = {f'c{column}': {'type': 'int'} for column in range(100)}
+        statements, rows = self.statements('sqlite', schema, 1000, 1000)
+        self.assertGreater(len(statements), 1)
+        for count in rows:
+            self.assertLessEqual(count * len(schema), 32766)
+
+    def test_statement_length(self):
+        for db_type, limit, length in (('sqlite', 1000000, 5000), ('mysql', 4 * 1024 * 1024, 50000)):
+            with self.subTest(db_type=db_type):
+                schema = {'id': {'type': 'int'}, 'body': {'type': 'string', 'length': length},
+                          'note': {'type': 'name', 'nullable': True}}
+                statements, rows = self.statements(db_type, schema, 300, 1000)
+                self.assertGreater(len(statements), 1)
+                for statement in statements:
+                    self.assertLessEqual(len(statement.encode('utf-8')), limit)
+
+    def test_configured_statement_length(self):
+        insert_generator = self.back.InsertGenerator('mysql', 1000, max_statement_length=20000)
+        schema = {'id': {'type': 'int'}, 'name': {'type': 'name'}, 'email': {'type': 'email'}}
+        statements = list(insert_generator.iter_inserts('device', schema, 2000, self.back.DataGenerator(3)))
+        self.assertGreater(len(statements), 1)
+        for statement in statements:
+            self.assertLessEqual(len(statement.encode('utf-8')), 20000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+from support import load_back
+
+
+class JobManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+        self.directory = tempfile.mkdtemp(prefix='generador_jobs_')
+        self.manager = self.back.JobManager(workers=2, directory=self.directory)
+        self.addCleanup(self.manager.shutdown)
+
+    def wait(self, job_ids, timeout=120):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            jobs = [self.manager.store.get(job_id) for job_id in job_ids]
+            if all(job['status'] not in ('queued', 'running') for job in jobs):
+                return jobs
+            time.sleep(0.1)
+        self.fail(f"Los trabajos no terminaron: {[job['status'] for job in jobs]}")
+
+    def test_every_submitted_job_finishes(self):
+        schema = {'id': {'type': 'int', 'pk': True, 'min': 1, 'max': 100000}, 'code': {'type': 'string'}}
+        job_ids = [self.manager.submit(schema, 2000, 'csv', f'export_{n}', seed=n) for n in range(3)]
+        for job in self.wait(job_ids):
+            self.assertEqual(job['status'], 'done', job['error'])
+            self.assertIsNotNone(job['started_at'])
+            self.assertEqual(job['rows_done'], 2000)
+        for job_id in job_ids:
+            self.assertIsNotNone(self.manager.progress(job_id)['rows_per_second'])
+            path, _ = self.manager.result(job_id)
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(sum(1 for _ in file), 2001)
+
+    def test_invalid_requests_are_rejected_before_queueing(self):
+        schema = {'id': {'type': 'int', 'pk': True, 'min': 1, 'max': 10}}
+        with self.assertRaises(ValueError):
+            self.manager.submit(schema, 11, 'csv')
+        with self.assertRaises(ValueError):
+            self.manager.submit(schema, 10, 'csv', compression='zip')
+        with self.assertRaises(ValueError):
+            self.back.FileExporter('jsonl', 'zip')
+        self.assertEqual(self.manager.store.count_active(), 0)
+        self.assertIsNone(self.manager.executor)
+
+    def test_crashed_worker_marks_job_failed(self):
+        job_id = self.manager.store.create('csv', 'caido.csv', 10)
+        future = Future()
+        future.set_exception(BrokenProcessPool('el proceso terminó de forma abrupta'))
+        self.manager.job_finished(job_id, future)
+        job = self.manager.store.get(job_id)
+        self.assertEqual(job['status'], 'failed')
+        self.assertIn('BrokenProcessPool', job['error'])
+
+    def test_restart_reclaims_jobs_of_dead_processes(self):
+        store = self.manager.store
+        job_id = store.create('csv', 'huerfano.csv', 10)
+        with store.connect() as connection:
+            # Un pid que no puede existir: el proceso que encoló el trabajo ya no está
+            connection.execute("UPDATE jobs SET owner_pid = ? WHERE id = ?", (2 ** 31 - 1, job_id))
+        restarted = self.back.JobManager(directory=self.directory)
+        self.assertEqual(restarted.store.get(job_id)['status'], 'failed')
+        self.assertEqual(restarted.store.count_active(), 0)
+
+    def test_expired_outputs_are_removed(self):
+        job_id = self.manager.submit({'value': {'type': 'int'}}, 10, 'csv', seed=1)
+        job, = self.wait([job_id])
+        self.assertTrue(os.path.exists(job['output_path']))
+        self.manager.retention = -1
+        self.manager.purge_expired()
+        self.assertFalse(os.path.exists(job['output_path']))
+        self.assertIsNone(self.manager.result(job_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
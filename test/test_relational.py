@@ -0,0 +1,43 @@
+import io
+import unittest
+
+from support import load_back
+
+TABLES = {
+    'customers': {'schema': {'code': {'type': 'string', 'length': 8, 'pk': True},
+                             'name': {'type': 'name'}}, 'num_rows': 50},
+    'orders': {'schema': {'id': {'type': 'int', 'pk': True, 'min': 1, 'max': 10 ** 6},
+                          'customer': {'type': 'foreign_key', 'references': 'customers.code',
+                                       'distribution': 'skewed', 'skew': 3}}, 'num_rows': 200},
+    'lines': {'schema': {'lid': {'type': 'int', 'pk': True, 'min': 1, 'max': 10 ** 6},
+                         'order_id': {'type': 'foreign_key', 'references': 'orders'}}, 'num_rows': 500},
+}
+
+
+class RelationalGeneratorTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+
+    def test_foreign_key_parameters_are_validated(self):
+        parent = {'schema': {'id': {'type': 'int', 'pk': True}}, 'num_rows': 5}
+        for specs in ({'distribution': 'skewed', 'skew': 0}, {'distribution': 'skewed', 'skew': -1},
+                      {'distribution': 'skewed', 'skew': '2'}, {'skew': float('nan')},
+                      {'nullable': True, 'null_chance': 1.5}, {'nullable': True, 'null_chance': 'x'}):
+            child = {'schema': {'parent': dict(specs, type='foreign_key', references='p')}, 'num_rows': 5}
+            with self.subTest(specs=specs), self.assertRaises(ValueError):
+                self.back.RelationalGenerator({'p': parent, 'c': child}, seed=1)
+
+    def test_returning_only_for_tables_with_id(self):
+        for db_type, clause in (('postgresql', ' RETURNING id;'), ('oracle', ' RETURNING id INTO :id;')):
+            sink = io.StringIO()
+            self.back.RelationalGenerator(TABLES, seed=1).write_inserts(sink, db_type)
+            # Las sentencias de varias filas ocupan varias líneas; cada una termina en ';' y salto de línea
+            statements = [statement + ';' for statement in sink.getvalue().split(';\n') if statement]
+            self.assertEqual({statement.split()[2] for statement in statements}, set(TABLES))
+            for statement in statements:
+                with self.subTest(db_type=db_type, statement=statement[:40]):
+                    self.assertEqual(statement.endswith(clause), statement.startswith('INSERT INTO orders'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from support import load_back
+
+
+class SchemaPlanTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+
+    def assertRejected(self, specs):
+        with self.assertRaises(ValueError):
+            self.back.SchemaPlan({'value': specs})
+
+    def test_enum_distribution_parameters(self):
+        enum = {'type': 'enum', 'options': ['a', 'b']}
+        for specs in ({'weights': ['x', 'y']}, {'weights': 5}, {'weights': [float('nan'), 1]},
+                      {'weights': [float('inf'), 1]}, {'weights': [-1, 2]}, {'weights': [True, 1]},
+                      {'distribution': 'zipf', 'zipf_exponent': '2'},
+                      {'distribution': 'zipf', 'zipf_exponent': float('nan')}):
+            with self.subTest(specs=specs):
+                self.assertRejected(dict(enum, **specs))
+        self.back.SchemaPlan({'value': dict(enum, weights=[3, 1.5])})
+        self.back.SchemaPlan({'value': dict(enum, distribution='zipf', zipf_exponent=2)})
+
+    def test_year_range_and_domain_list(self):
+        for field_type in ('date', 'datetime'):
+            for specs in ({'start_year': 0}, {'end_year': 10000}, {'start_year': 2000.5}, {'end_year': '2024'}):
+                with self.subTest(field_type=field_type, specs=specs):
+                    self.assertRejected(dict(specs, type=field_type))
+            plan = self.back.SchemaPlan({'value': {'type': field_type, 'start_year': 1, 'end_year': 9999}})
+            rows = self.back.DataGenerator(1).generate_rows(plan, 200)
+            self.assertEqual(len(rows), 200)
+        for domain_list in ('abc', ['example.com', 3], ['']):
+            with self.subTest(domain_list=domain_list):
+                self.assertRejected({'type': 'email', 'domain_list': domain_list})
+        plan = self.back.SchemaPlan({'value': {'type': 'email', 'domain_list': []}})
+        self.assertEqual(plan['value']['domain_list'], self.back.SchemaPlan.defaults['email']['domain_list'])
+
+
+if __name__ == '__main__':
+    unittest.main()
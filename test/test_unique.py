@@ -0,0 +1,92 @@
+import importlib.util
+import os
+import unittest
+
+from support import load_back
+
+# Espacios justos: cada columna única se recorre completa, así un valor repetido dejaría otro sin salir
+SCHEMA = {
+    'id': {'type': 'int', 'pk': True, 'min': 1, 'max': 3844},
+    'code': {'type': 'string', 'length': 2, 'unique': True},
+    'phone': {'type': 'phone', 'digits': 4, 'unique': True},
+    'value': {'type': 'int', 'min': 0, 'max': 5},
+}
+NUM_ROWS = 3844  # 62 ** 2 cadenas de largo 2
+
+
+class UniquePermutationTest(unittest.TestCase):
+    def setUp(self):
+        self.back = load_back()
+
+    def assertUnique(self, rows, fields=('id', 'code', 'phone')):
+        for field in fields:
+            values = [row[field] for row in rows]
+            self.assertEqual(len(set(values)), len(values), field)
+
+    def test_permutation_covers_the_space(self):
+        for size in (1, 2, 3, 1000, 4097):
+            permutation = self.back.UniquePermutation(size, key=12345)
+            self.assertEqual(sorted(permutation[index] for index in range(size)), list(range(size)))
+            with self.assertRaises(IndexError):
+                permutation[size]
+
+    def test_int_and_string_columns_have_no_duplicates(self):
+        for counter_based in (False, True):
+            with self.subTest(counter_based=counter_based):
+                rows = self.back.DataGenerator(5, counter_based=counter_based).generate_rows(SCHEMA, NUM_ROWS)
+                self.assertUnique(rows)
+                self.assertEqual({row['id'] for row in rows}, set(range(1, NUM_ROWS + 1)))
+
+    def test_successive_calls_continue_the_permutation(self):
+        data_generator = self.back.DataGenerator(5)
+        rows = data_generator.generate_rows(SCHEMA, 1000) + data_generator.generate_rows(SCHEMA, NUM_ROWS - 1000)
+        self.assertUnique(rows)
+        with self.assertRaises(ValueError):
+            data_generator.generate_rows(SCHEMA, 1)
+
+    def test_short_domain_is_rejected_before_generating(self):
+        with self.assertRaisesRegex(ValueError, "'id'"):
+            self.back.DataGenerator(5).iter_rows(SCHEMA, NUM_ROWS + 1)
+        with self.assertRaisesRegex(ValueError, "'code'"):
+            self.back.DataGenerator(5).iter_rows(dict(SCHEMA, id={'type': 'int', 'pk': True, 'max': 10 ** 6}),
+                                               NUM_ROWS + 1)
+        parallel = self.back.ParallelGenerator(workers=2, seed=5)
+        with self.assertRaises(ValueError):
+            parallel.iter_rows(SCHEMA, NUM_ROWS + 1)
+        with self.assertRaises(ValueError):
+            parallel.iter_insert_chunks(self.back.InsertGenerator('sqlite'), 'device', SCHEMA, NUM_ROWS + 1)
+
+    @unittest.skipUnless(hasattr(load_back(), 'BatchDataGenerator'), "NumPy no está instalado")
+    def test_batch_columns_have_no_duplicates(self):
+        batches = list(self.back.DataGenerator(5).iter_batches(SCHEMA, NUM_ROWS, batch_size=1000))
+        for field in ('id', 'code'):
+            values = [value for batch in batches for value in batch.columns[field].tolist()]
+            self.assertEqual(len(set(values)), NUM_ROWS, field)
+
+    def test_parallel_output_does_not_depend_on_workers(self):
+        for counter_based in (False, True):
+            outputs = []
+            for workers in (1, 2, 3):
+                generator = self.back.ParallelGenerator(workers=workers, seed=9, shard_size=500,
+                                                        counter_based=counter_based)
+                outputs.append(generator.generate_rows(SCHEMA, NUM_ROWS))
+            with self.subTest(counter_based=counter_based):
+                self.assertUnique(outputs[0])
+                self.assertEqual(outputs[0], outputs[1])
+                self.assertEqual(outputs[0], outputs[2])
+
+    def test_version3_unique_columns(self):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'version3.py')
+        spec = importlib.util.spec_from_file_location('version3', path)
+        version3 = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(version3)
+        columns = [{'name': 'id', 'type': 'int', 'pk': True, 'min': 1, 'max': 1296},
+                   {'name': 'code', 'type': 'string', 'length': 2, 'unique': True}]
+        rows = version3.DataGenerator().generate_data(columns, 1296)  # 36 ** 2 cadenas de largo 2
+        self.assertUnique(rows, ('id', 'code'))
+        with self.assertRaises(ValueError):
+            version3.DataGenerator().generate_data(columns, 1297)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,32 +1,105 @@
 import random
 import string
 import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union
 import json
 import csv
 import xml.etree.ElementTree as ET
 import sqlite3
+import zlib
+
+class UniquePermutation:
+    """Permutación pseudoaleatoria con clave sobre `[0, size)`: red de Feistel con cycle-walking.
+
+    Es la misma permutación de `back/UniquePermutation.py`, copiada para que este script siga
+    siendo independiente. Cada posición da un valor distinto en tiempo y memoria constantes, así
+    que las columnas únicas no guardan los valores ya usados ni reintentan colisiones.
+    """
+    rounds = 4
+
+    def __init__(self, size: int, key: int):
+        if size <= 0:
+            raise ValueError("El espacio de valores únicos debe tener al menos un elemento.")
+        self.size = size
+        self.position = 0
+        # La red trabaja sobre 2 * half_bits bits, el menor dominio par que cubre `size`
+        self.half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.mask = (1 << self.half_bits) - 1
+        self.keys = [(key + (i + 1) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF for i in range(self.rounds)]
+
+    def permute(self, value: int) -> int:
+        """Aplica las rondas de Feistel; la función de ronda es una mezcla tipo splitmix64."""
+        left, right = value >> self.half_bits, value & self.mask
+        for key in self.keys:
+            z = (right * 0xBF58476D1CE4E5B9 + key) & 0xFFFFFFFFFFFFFFFF
+            z = ((z ^ (z >> 31)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+            left, right = right, left ^ ((z ^ (z >> 29)) & self.mask)
+        return (left << self.half_bits) | right
+
+    def next_value(self) -> int:
+        if self.position >= self.size:
+            raise ValueError(f"Se agotaron los {self.size} valores únicos disponibles.")
+        # Los valores fuera de [0, size) vuelven a cifrarse hasta caer dentro
+        value = self.permute(self.position)
+        while value >= self.size:
+            value = self.permute(value)
+        self.position += 1
+        return value
 
 class DataGenerator:
+    UNIQUE_CHARSET = string.ascii_uppercase + string.digits
+
     def __init__(self):
+        # Una UniquePermutation por columna unique/pk
         self.unique_values = {}
         self.custom_generators = {}
+        self.permutation_key = random.getrandbits(64)
 
     def random_string(self, length: int = 10, charset: str = string.ascii_uppercase + string.digits) -> str:
         return ''.join(random.choices(charset, k=length))
 
     def random_number(self, min_value: int = 1000, max_value: int = 9999, unique: bool = False, field_name: Optional[str] = None) -> int:
         if unique:
-            if field_name not in self.unique_values:
-                self.unique_values[field_name] = set()
-            
-            while True:
-                number = random.randint(min_value, max_value)
-                if number not in self.unique_values[field_name]:
-                    self.unique_values[field_name].add(number)
-                    return number
+            return min_value + self.unique_permutation(field_name, max_value - min_value + 1).next_value()
         return random.randint(min_value, max_value)
 
+    def unique_permutation(self, field_name: str, size: int) -> UniquePermutation:
+        if field_name not in self.unique_values:
+            key = (self.permutation_key + zlib.crc32(str(field_name).encode())) & 0xFFFFFFFFFFFFFFFF
+            self.unique_values[field_name] = UniquePermutation(size, key)
+        return self.unique_values[field_name]
+
+    def unique_string(self, field_name: str, length: int) -> str:
+        charset = self.UNIQUE_CHARSET
+        index = self.unique_permutation(field_name, len(charset) ** length).next_value()
+        chars = []
+        for _ in range(length):
+            index, digit = divmod(index, len(charset))
+            chars.append(charset[digit])
+        return ''.join(chars)
+
+    def unique_domain(self, column: Dict[str, Any]) -> Optional[int]:
+        """Cantidad de valores distintos de una columna unique/pk, o None si aquí no está acotada."""
+        if not (column.get('unique', False) or column.get('pk', False)) or column['type'] in self.custom_generators:
+            return None
+        if column['type'] == 'string':
+            return len(self.UNIQUE_CHARSET) ** column.get('length', 10)
+        elif column['type'] == 'int':
+            return column.get('max', 9999) - column.get('min', 1000) + 1
+        return None
+
+    def check_unique_domains(self, columns: List[Dict[str, Any]], num_rows: int):
+        # Falla antes de generar ninguna fila, no cuando se agota el espacio de valores
+        for column in columns:
+            size = self.unique_domain(column)
+            if size is None:
+                continue
+            permutation = self.unique_values.get(column['name'])
+            used = permutation.position if permutation else 0
+            if used + num_rows > size:
+                raise ValueError(f"La columna '{column['name']}' solo admite {size} valores únicos y se piden "
+                                 f"{num_rows} filas más ({used} ya usados).")
+
     def random_date(self, start_year: int = 2000, end_year: int = 2024) -> datetime.date:
         start_date = datetime.date(start_year, 1, 1)
         end_date = datetime.date(end_year, 12, 31)
@@ -74,12 +147,9 @@ class DataGenerator:
 
         if col_type == 'string':
             length = column.get('length', 10)
-            value = self.random_string(length)
             if is_pk or unique:
-                while value in self.unique_values.get(column['name'], set()):
-                    value = self.random_string(length)
-                self.unique_values.setdefault(column['name'], set()).add(value)
-            return value
+                return self.unique_string(column['name'], length)
+            return self.random_string(length)
         elif col_type == 'int':
             min_value = column.get('min', 1000)
             max_value = column.get('max', 9999)
@@ -109,6 +179,7 @@ class DataGenerator:
         return {column['name']: self.generate_value(column) for column in columns}
 
     def generate_data(self, columns: List[Dict[str, Any]], num_rows: int = 1) -> List[Dict[str, Any]]:
+        self.check_unique_domains(columns, num_rows)
         return [self.generate_row(columns) for _ in range(num_rows)]
 
     def generate_insert_statement(self, table_name: str, row: Dict[str, Any]) -> str:
@@ -117,11 +188,15 @@ class DataGenerator:
         values = tuple(row.values())
         return f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders});" % values
 
+    def iter_insert_statements(self, table_name: str, columns: List[Dict[str, Any]], num_rows: int = 1) -> Iterator[str]:
+        # Se comprueba al llamar, no en la primera sentencia: no se empieza un archivo imposible de completar
+        self.check_unique_domains(columns, num_rows)
+        return (self.generate_insert_statement(table_name, self.generate_row(columns)) for _ in range(num_rows))
+
     def generate_insert_statements(self, table_name: str, columns: List[Dict[str, Any]], num_rows: int = 1) -> str:
-        data = self.generate_data(columns, num_rows)
-        return '\n'.join(self.generate_insert_statement(table_name, row) for row in data)
+        return '\n'.join(self.iter_insert_statements(table_name, columns, num_rows))
 
-    def save_sql_file(self, filename: str, insert_statements: str, use_transaction: bool = True):
+    def save_sql_file(self, filename: str, insert_statements: Union[str, Iterable[str]], use_transaction: bool = True):
         current_datetime = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         with open(filename, 'w') as f:
@@ -129,7 +204,13 @@ class DataGenerator:
             if use_transaction:
                 f.write("BEGIN TRANSACTION;\n")
                 f.write("SAVE TRANSACTION DataInsertSavepoint;\n\n")
-            f.write(insert_statements)
+            if isinstance(insert_statements, str):
+                f.write(insert_statements)
+            else:
+                # Escribe sentencia por sentencia para no cargar todo el script en memoria
+                for statement in insert_statements:
+                    f.write(statement)
+                    f.write('\n')
             if use_transaction:
                 f.write("\n-- To undo changes, use:\n")
                 f.write("-- ROLLBACK TRANSACTION DataInsertSavepoint;\n")
@@ -214,7 +295,7 @@ if __name__ == "__main__":
     data = generator.generate_data(columns, num_rows=10)
 
     # Generate and save SQL insert statements
-    insert_statements = generator.generate_insert_statements("users",
+    insert_statements = generator.iter_insert_statements("users",
      columns, num_rows=10)
     generator.save_sql_file("users_insert.sql", insert_statements,
      use_transaction=True)